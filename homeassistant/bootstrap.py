@@ -19,7 +19,12 @@ from homeassistant import config as conf_util, config_entries, core, loader
 from homeassistant.components import http
 from homeassistant.const import REQUIRED_NEXT_PYTHON_DATE, REQUIRED_NEXT_PYTHON_VER
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import area_registry, device_registry, entity_registry
+from homeassistant.helpers import (
+    area_registry,
+    config_per_platform,
+    device_registry,
+    entity_registry,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
@@ -442,6 +447,65 @@ async def async_setup_multi_components(
         )
 
 
+def _import_integration(
+    integration: loader.Integration, platform_names: set[str]
+) -> None:
+    """Import an integration and its platforms.
+
+    Failures are ignored, setup will import it again and report them.
+    """
+    try:
+        integration.get_component()
+        for platform_name in platform_names:
+            integration.get_platform(platform_name)
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.debug("Unable to pre-import %s", integration.domain, exc_info=True)
+
+
+async def _async_preimport_integrations(
+    hass: core.HomeAssistant,
+    config: dict[str, Any],
+    integration_cache: dict[str, loader.Integration],
+) -> None:
+    """Import integrations and their platforms in the executor before setup.
+
+    Integrations are imported in waves so an integration is only imported
+    after its dependencies. Integrations within a wave do not depend on
+    each other and are imported concurrently.
+    """
+    platforms: dict[str, set[str]] = {domain: set() for domain in integration_cache}
+    for domain in integration_cache:
+        for platform_name, _ in config_per_platform(config, domain):
+            if platform_name in platforms:
+                platforms[platform_name].add(domain)
+
+    # The dependencies of an integration are a superset of the dependencies
+    # of each of its dependencies, so integrations with the same number of
+    # dependencies can never depend on each other.
+    waves: dict[int, list[loader.Integration]] = {}
+    for itg in integration_cache.values():
+        if not await itg.resolve_dependencies():
+            continue
+        waves.setdefault(len(itg.all_dependencies), []).append(itg)
+
+    start = monotonic()
+    for _, wave in sorted(waves.items()):
+        await gather_with_concurrency(
+            MAX_LOAD_CONCURRENTLY,
+            *(
+                hass.async_add_executor_job(
+                    _import_integration, itg, platforms[itg.domain]
+                )
+                for itg in wave
+            ),
+        )
+    _LOGGER.debug(
+        "Pre-imported %s integrations in %.2fs",
+        len(integration_cache),
+        monotonic() - start,
+    )
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -494,6 +558,8 @@ async def _async_set_up_integrations(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    await _async_preimport_integrations(hass, config, integration_cache)
+
     logging_domains = domains_to_setup & LOGGING_INTEGRATIONS
 
     # Load logging as soon as possible
@@ -13,6 +13,7 @@ from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.bootstrap import DATA_LOGGING
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import (
+    CONTENT_TYPE_JSON,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_TIME_CHANGED,
     HTTP_BAD_REQUEST,
@@ -120,7 +121,10 @@ class APIEventStream(HomeAssistantView):
             if event.event_type == EVENT_HOMEASSISTANT_STOP:
                 data = stop_obj
             else:
-                data = json.dumps(event, cls=JSONEncoder)
+                try:
+                    data = event.as_dict_json()
+                except (ValueError, TypeError):
+                    data = json.dumps(event, cls=JSONEncoder)
 
             await to_write.put(data)
 
@@ -225,7 +229,11 @@ class APIStatesView(HomeAssistantView):
             for state in request.app["hass"].states.async_all()
             if entity_perm(state.entity_id, "read")
         ]
-        return self.json(states)
+        try:
+            body = f'[{",".join(state.as_dict_json() for state in states)}]'
+        except (ValueError, TypeError):
+            return self.json(states)
+        return _json_response(body)
 
 
 class APIEntityStateView(HomeAssistantView):
@@ -242,9 +250,12 @@ class APIEntityStateView(HomeAssistantView):
             raise Unauthorized(entity_id=entity_id)
 
         state = request.app["hass"].states.get(entity_id)
-        if state:
+        if not state:
+            return self.json_message("Entity not found.", HTTP_NOT_FOUND)
+        try:
+            return _json_response(state.as_dict_json())
+        except (ValueError, TypeError):
             return self.json(state)
-        return self.json_message("Entity not found.", HTTP_NOT_FOUND)
 
     async def post(self, request, entity_id):
         """Update state of entity."""
@@ -446,3 +457,10 @@ def async_events_json(hass):
         {"event": key, "listener_count": value}
         for key, value in hass.bus.async_listeners().items()
     ]
+
+
+def _json_response(body: str) -> web.Response:
+    """Return a JSON response for an already serialized body."""
+    response = web.Response(body=body.encode("UTF-8"), content_type=CONTENT_TYPE_JSON)
+    response.enable_compression()
+    return response
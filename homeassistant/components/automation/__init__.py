@@ -1,8 +1,10 @@
 """Allow to set up simple automation rules via the config file."""
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
-from typing import Any, Awaitable, Callable, Dict, TypedDict, cast
+from typing import Any, Awaitable, Callable, Dict, List, TypedDict, cast
 
 import voluptuous as vol
 from voluptuous.humanize import humanize_error
@@ -45,6 +47,7 @@ from homeassistant.helpers import condition, extract_domain_configs, template
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.reference_index import ReferenceIndex
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -77,6 +80,7 @@ from .const import (
     CONF_TRACE,
     CONF_TRIGGER,
     CONF_TRIGGER_VARIABLES,
+    DATA_REFERENCES,
     DEFAULT_INITIAL_STATE,
     DOMAIN,
     LOGGER,
@@ -136,16 +140,10 @@ def is_on(hass, entity_id):
 @callback
 def automations_with_entity(hass: HomeAssistant, entity_id: str) -> list[str]:
     """Return all automations that reference the entity."""
-    if DOMAIN not in hass.data:
+    if DATA_REFERENCES not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if entity_id in automation_entity.referenced_entities
-    ]
+    return hass.data[DATA_REFERENCES].async_referencing_entity(entity_id)
 
 
 @callback
@@ -167,16 +165,10 @@ def entities_in_automation(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def automations_with_device(hass: HomeAssistant, device_id: str) -> list[str]:
     """Return all automations that reference the device."""
-    if DOMAIN not in hass.data:
+    if DATA_REFERENCES not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if device_id in automation_entity.referenced_devices
-    ]
+    return hass.data[DATA_REFERENCES].async_referencing_device(device_id)
 
 
 @callback
@@ -198,16 +190,10 @@ def devices_in_automation(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def automations_with_area(hass: HomeAssistant, area_id: str) -> list[str]:
     """Return all automations that reference the area."""
-    if DOMAIN not in hass.data:
+    if DATA_REFERENCES not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if area_id in automation_entity.referenced_areas
-    ]
+    return hass.data[DATA_REFERENCES].async_referencing_area(area_id)
 
 
 @callback
@@ -230,6 +216,7 @@ async def async_setup(hass, config):
     """Set up all automations."""
     # Local import to avoid circular import
     hass.data[DOMAIN] = component = EntityComponent(LOGGER, DOMAIN, hass)
+    hass.data[DATA_REFERENCES] = ReferenceIndex()
 
     # To register the automation blueprints
     async_get_blueprints(hass)
@@ -262,8 +249,8 @@ async def async_setup(hass, config):
     )
 
     async def reload_service_handler(service_call):
-        """Remove all automations and load new ones from config."""
-        conf = await component.async_prepare_reload()
+        """Reload automations, keeping those whose config did not change."""
+        conf = await component.async_prepare_reload(skip_reset=True)
         if conf is None:
             return
         async_get_blueprints(hass).async_reset_cache()
@@ -320,6 +307,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         self._blueprint_inputs = blueprint_inputs
         self._trace_config = trace_config
         self._attr_unique_id = automation_id
+        self.reload_key: str | None = None
 
     @property
     def extra_state_attributes(self):
@@ -388,6 +376,13 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         """Startup with initial state or previous state."""
         await super().async_added_to_hass()
 
+        self.hass.data[DATA_REFERENCES].async_add(
+            self.entity_id,
+            self.referenced_entities,
+            self.referenced_devices,
+            self.referenced_areas,
+        )
+
         self._logger = logging.getLogger(
             f"{__name__}.{split_entity_id(self.entity_id)[1]}"
         )
@@ -532,6 +527,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
     async def async_will_remove_from_hass(self):
         """Remove listeners when removing automation from Home Assistant."""
         await super().async_will_remove_from_hass()
+        self.hass.data[DATA_REFERENCES].async_remove(self.entity_id)
         await self.async_disable()
 
     async def async_enable(self):
@@ -623,10 +619,25 @@ async def _async_process_config(
 ) -> bool:
     """Process config and add automations.
 
+    Automations which were set up before are kept as they are if their config
+    did not change, so their triggers, running actions and state survive a
+    reload. The other automations that were set up before are removed.
+
     Returns if blueprints were used.
     """
     entities = []
     blueprints_used = False
+    unchanged: set[str] = set()
+    existing: dict[str, list[AutomationEntity]] = {}
+    for automation in cast(List[AutomationEntity], component.entities):
+        if automation.reload_key is not None:
+            existing.setdefault(automation.reload_key, []).append(automation)
+
+    def pop_unchanged(reload_key: str | None) -> AutomationEntity | None:
+        """Return an existing automation set up from the same config."""
+        if reload_key is None or not existing.get(reload_key):
+            return None
+        return existing[reload_key].pop()
 
     for config_key in extract_domain_configs(config, DOMAIN):
         conf: list[dict[str, Any] | blueprint.BlueprintInputs] = config[config_key]
@@ -641,6 +652,12 @@ async def _async_process_config(
 
                 try:
                     raw_config = blueprint_inputs.async_substitute()
+                    reload_key = _automation_reload_key(
+                        config_key, list_no, raw_config, raw_blueprint_inputs
+                    )
+                    if existing_entity := pop_unchanged(reload_key):
+                        unchanged.add(existing_entity.entity_id)
+                        continue
                     config_block = cast(
                         Dict[str, Any],
                         await async_validate_config_item(hass, raw_config),
@@ -655,6 +672,12 @@ async def _async_process_config(
                     continue
             else:
                 raw_config = cast(AutomationConfig, config_block).raw_config
+                reload_key = _automation_reload_key(
+                    config_key, list_no, raw_config, raw_blueprint_inputs
+                )
+                if existing_entity := pop_unchanged(reload_key):
+                    unchanged.add(existing_entity.entity_id)
+                    continue
 
             automation_id = config_block.get(CONF_ID)
             name = config_block.get(CONF_ALIAS) or f"{config_key} {list_no}"
@@ -710,14 +733,50 @@ async def _async_process_config(
                 config_block[CONF_TRACE],
             )
 
+            entity.reload_key = reload_key
+
             entities.append(entity)
 
+    removed = [
+        automation.entity_id
+        for automation in component.entities
+        if automation.entity_id not in unchanged
+    ]
+    if removed:
+        await asyncio.gather(
+            *(component.async_remove_entity(entity_id) for entity_id in removed)
+        )
+
     if entities:
         await component.async_add_entities(entities)
 
     return blueprints_used
 
 
+def _automation_reload_key(
+    config_key: str,
+    list_no: int,
+    raw_config: dict[str, Any] | None,
+    raw_blueprint_inputs: dict[str, Any] | None,
+) -> str | None:
+    """Return a key which is equal for automations with the same config.
+
+    Automations without alias are named after their position in the config,
+    which then is part of the key. Returns None if no key can be made.
+    """
+    if raw_config is None:
+        return None
+    default_name = None if CONF_ALIAS in raw_config else f"{config_key} {list_no}"
+    try:
+        return json.dumps(
+            [default_name, raw_config, raw_blueprint_inputs],
+            sort_keys=True,
+            default=repr,
+        )
+    except (TypeError, ValueError):
+        return None
+
+
 async def _async_process_if(hass, name, config, p_config):
     """Process if checks."""
     if_configs = p_config[CONF_CONDITION]
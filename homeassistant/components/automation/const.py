@@ -6,6 +6,8 @@ CONF_TRIGGER = "trigger"
 CONF_TRIGGER_VARIABLES = "trigger_variables"
 DOMAIN = "automation"
 
+DATA_REFERENCES = "automation_references"
+
 CONF_HIDE_ENTITY = "hide_entity"
 
 CONF_CONDITION_TYPE = "condition_type"
@@ -3,9 +3,9 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime as dt, timedelta
+from functools import partial
 import logging
 import time
-from typing import cast
 
 from aiohttp import web
 from sqlalchemy import not_, or_
@@ -124,6 +124,7 @@ class LazyState(history_models.LazyState):
         vol.Required("start_time"): str,
         vol.Optional("end_time"): str,
         vol.Optional("statistic_ids"): [str],
+        vol.Optional("period", default="hour"): vol.Any("5minute", "hour"),
     }
 )
 @websocket_api.async_response
@@ -157,6 +158,7 @@ async def ws_get_statistics_during_period(
         start_time,
         end_time,
         msg.get("statistic_ids"),
+        msg["period"],
     )
     connection.send_result(msg["id"], statistics)
 
@@ -194,7 +196,7 @@ class HistoryPeriodView(HomeAssistantView):
 
     async def get(
         self, request: web.Request, datetime: str | None = None
-    ) -> web.Response:
+    ) -> web.StreamResponse:
         """Return history over a period of time."""
         datetime_ = None
         if datetime:
@@ -243,10 +245,10 @@ class HistoryPeriodView(HomeAssistantView):
         ):
             return self.json([])
 
-        return cast(
-            web.Response,
-            await hass.async_add_executor_job(
-                self._sorted_significant_states_json,
+        return await self.async_json_stream(
+            request,
+            partial(
+                self._sorted_significant_states,
                 hass,
                 start_time,
                 end_time,
@@ -257,7 +259,7 @@ class HistoryPeriodView(HomeAssistantView):
             ),
         )
 
-    def _sorted_significant_states_json(
+    def _sorted_significant_states(
         self,
         hass,
         start_time,
@@ -267,43 +269,47 @@ class HistoryPeriodView(HomeAssistantView):
         significant_changes_only,
         minimal_response,
     ):
-        """Fetch significant stats from the database as json."""
+        """Fetch significant states from the database and yield them per entity."""
         timer_start = time.perf_counter()
 
-        with session_scope(hass=hass) as session:
-            result = (
-                history._get_significant_states(  # pylint: disable=protected-access
+        # Respect the ordering given by any entities explicitly
+        # included in the configuration. Without requested entity_ids the
+        # few included entities are queried one by one before the states
+        # of all the others are streamed in entity_id order.
+        included_entities = []
+        if self.filters and self.use_include_order:
+            included_entities = self.filters.included_entities
+        queries = [entity_ids]
+        if entity_ids is not None:
+            first = [ent_id for ent_id in included_entities if ent_id in entity_ids]
+            queries = [first + [ent_id for ent_id in entity_ids if ent_id not in first]]
+            included_entities = []
+        elif included_entities:
+            queries = [included_entities, None]
+
+        state_count = 0
+        with session_scope(hass=hass, read_only=True) as session:
+            for query_entity_ids in queries:
+                entity_states = history._iter_significant_states(  # pylint: disable=protected-access
                     hass,
                     session,
                     start_time,
                     end_time,
-                    entity_ids,
+                    query_entity_ids,
                     self.filters,
                     include_start_time_state,
                     significant_changes_only,
                     minimal_response,
                 )
-            )
+                for entity_id, states in entity_states:
+                    if query_entity_ids is None and entity_id in included_entities:
+                        continue
+                    state_count += len(states)
+                    yield states
 
-        result = list(result.values())
         if _LOGGER.isEnabledFor(logging.DEBUG):
             elapsed = time.perf_counter() - timer_start
-            _LOGGER.debug("Extracted %d states in %fs", sum(map(len, result)), elapsed)
-
-        # Optionally reorder the result to respect the ordering given
-        # by any entities explicitly included in the configuration.
-        if self.filters and self.use_include_order:
-            sorted_result = []
-            for order_entity in self.filters.included_entities:
-                for state_list in result:
-                    if state_list[0].entity_id == order_entity:
-                        sorted_result.append(state_list)
-                        result.remove(state_list)
-                        break
-            sorted_result.extend(result)
-            result = sorted_result
-
-        return self.json(result)
+            _LOGGER.debug("Extracted %d states in %fs", state_count, elapsed)
 
 
 def sqlalchemy_filter_from_include_exclude_conf(conf):
@@ -28,6 +28,7 @@ from homeassistant.helpers import (
     config_validation as cv,
     entity_platform,
 )
+from homeassistant.helpers.reference_index import ReferenceIndex
 from homeassistant.helpers.state import async_reproduce_state
 from homeassistant.loader import async_get_integration
 
@@ -76,6 +77,7 @@ def _ensure_no_intersection(value):
 CONF_SCENE_ID = "scene_id"
 CONF_SNAPSHOT = "snapshot_entities"
 DATA_PLATFORM = "homeassistant_scene"
+DATA_REFERENCES = "homeassistant_scene_references"
 EVENT_SCENE_RELOADED = "scene_reloaded"
 STATES_SCHEMA = vol.All(dict, _convert_states)
 
@@ -130,16 +132,10 @@ class SceneConfig(NamedTuple):
 @callback
 def scenes_with_entity(hass: HomeAssistant, entity_id: str) -> list[str]:
     """Return all scenes that reference the entity."""
-    if DATA_PLATFORM not in hass.data:
+    if DATA_REFERENCES not in hass.data:
         return []
 
-    platform = hass.data[DATA_PLATFORM]
-
-    return [
-        scene_entity.entity_id
-        for scene_entity in platform.entities.values()
-        if entity_id in scene_entity.scene_config.states
-    ]
+    return hass.data[DATA_REFERENCES].async_referencing_entity(entity_id)
 
 
 @callback
@@ -160,6 +156,7 @@ def entities_in_scene(hass: HomeAssistant, entity_id: str) -> list[str]:
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up Home Assistant scene entries."""
+    hass.data.setdefault(DATA_REFERENCES, ReferenceIndex())
     _process_scenes_config(hass, async_add_entities, config)
 
     # This platform can be loaded multiple times. Only first time register the service.
@@ -316,6 +313,16 @@ class HomeAssistantScene(Scene):
             attributes[CONF_ID] = unique_id
         return attributes
 
+    async def async_added_to_hass(self) -> None:
+        """Add the entities of the scene to the reference index."""
+        self.hass.data[DATA_REFERENCES].async_add(
+            self.entity_id, self.scene_config.states
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Remove the entities of the scene from the reference index."""
+        self.hass.data[DATA_REFERENCES].async_remove(self.entity_id)
+
     async def async_activate(self, **kwargs: Any) -> None:
         """Activate scene. Try to get entities into requested state."""
         await async_reproduce_state(
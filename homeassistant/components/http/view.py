@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
-import json
+from collections.abc import Awaitable, Callable, Iterable
+import concurrent.futures
 import logging
+import threading
 from typing import Any
 
 from aiohttp import web
@@ -20,12 +21,15 @@ import voluptuous as vol
 from homeassistant import exceptions
 from homeassistant.const import CONTENT_TYPE_JSON, HTTP_OK, HTTP_SERVICE_UNAVAILABLE
 from homeassistant.core import Context, is_callback
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import json_dumps
 
 from .const import KEY_AUTHENTICATED, KEY_HASS
 
 _LOGGER = logging.getLogger(__name__)
 
+# Size in characters of the chunks written by streamed JSON responses
+JSON_STREAM_CHUNK_SIZE = 65536
+
 
 class HomeAssistantView:
     """Base view for all views."""
@@ -53,7 +57,7 @@ class HomeAssistantView:
     ) -> web.Response:
         """Return a JSON response."""
         try:
-            msg = json.dumps(result, cls=JSONEncoder, allow_nan=False).encode("UTF-8")
+            msg = json_dumps(result).encode("UTF-8")
         except (ValueError, TypeError) as err:
             _LOGGER.error("Unable to serialize to JSON: %s\n%s", err, result)
             raise HTTPInternalServerError from err
@@ -66,6 +70,96 @@ class HomeAssistantView:
         response.enable_compression()
         return response
 
+    @staticmethod
+    async def async_json_stream(
+        request: web.Request, items: Callable[[], Iterable[Any]]
+    ) -> web.StreamResponse:
+        """Stream a JSON list of the items generated in the executor.
+
+        The items are serialized as they are generated and written in chunks,
+        so the response is never held in memory as a whole.
+        """
+        hass = request.app[KEY_HASS]
+        # Holds at most one chunk besides the final None or exception
+        queue: asyncio.Queue[str | Exception | None] = asyncio.Queue(maxsize=2)
+        stop = threading.Event()
+        lock = threading.Lock()
+        pending: list[concurrent.futures.Future] = []
+
+        def put(chunk: str | Exception | None) -> bool:
+            """Hand over a chunk, return False once the response was aborted."""
+            with lock:
+                if stop.is_set():
+                    return False
+                future = asyncio.run_coroutine_threadsafe(queue.put(chunk), hass.loop)
+                pending.append(future)
+            try:
+                future.result()
+            except concurrent.futures.CancelledError:
+                return False
+            finally:
+                with lock:
+                    pending.remove(future)
+            return True
+
+        def produce() -> None:
+            """Serialize the items and hand them over in chunks."""
+            last: Exception | None = None
+            buffer = ["["]
+            size = 0
+            separator = ""
+            try:
+                for item in items():
+                    try:
+                        msg = json_dumps(item)
+                    except (ValueError, TypeError) as err:
+                        _LOGGER.error("Unable to serialize to JSON: %s\n%s", err, item)
+                        raise HTTPInternalServerError from err
+                    buffer.append(separator)
+                    buffer.append(msg)
+                    separator = ","
+                    size += len(msg)
+                    if size >= JSON_STREAM_CHUNK_SIZE:
+                        if not put("".join(buffer)):
+                            return
+                        buffer = []
+                        size = 0
+                buffer.append("]")
+                if not put("".join(buffer)):
+                    return
+            except Exception as err:  # pylint: disable=broad-except
+                last = err
+            put(last)
+
+        response = web.StreamResponse()
+        response.content_type = CONTENT_TYPE_JSON
+        response.enable_compression()
+        hass.async_add_executor_job(produce)
+        try:
+            while (chunk := await queue.get()) is not None:
+                if isinstance(chunk, Exception):
+                    if not response.prepared:
+                        raise chunk
+                    # The status is already sent, so the only way to tell the
+                    # client the body is incomplete is to drop the connection
+                    if not isinstance(chunk, HTTPInternalServerError):
+                        _LOGGER.error(
+                            "Error streaming the JSON response", exc_info=chunk
+                        )
+                    if request.transport is not None:
+                        request.transport.close()
+                    return response
+                if not response.prepared:
+                    await response.prepare(request)
+                await response.write(chunk.encode("UTF-8"))
+            await response.write_eof()
+        finally:
+            with lock:
+                stop.set()
+                for future in pending:
+                    future.cancel()
+        return response
+
     def json_message(
         self,
         message: str,
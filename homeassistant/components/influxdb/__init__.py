@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from contextlib import suppress
 from dataclasses import dataclass
+import gzip
 import logging
 import math
 import queue
@@ -11,6 +12,7 @@ import time
 from typing import Any, Callable
 
 from influxdb import InfluxDBClient, exceptions
+from influxdb.line_protocol import make_lines
 from influxdb_client import InfluxDBClient as InfluxDBClientV2
 from influxdb_client.client.write_api import ASYNCHRONOUS, SYNCHRONOUS
 from influxdb_client.rest import ApiException
@@ -37,25 +39,34 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.storage import STORAGE_DIR
 
+from .buffer import WriteBuffer
 from .const import (
     API_VERSION_2,
     BATCH_BUFFER_SIZE,
     BATCH_TIMEOUT,
+    BUFFER_FILE,
+    BUFFER_FULL_MESSAGE,
+    BUFFERING_MESSAGE,
     CATCHING_UP_MESSAGE,
     CLIENT_ERROR_V1,
     CLIENT_ERROR_V2,
     CODE_INVALID_INPUTS,
     COMPONENT_CONFIG_SCHEMA_CONNECTION,
     CONF_API_VERSION,
+    CONF_BATCH_SIZE,
     CONF_BUCKET,
     CONF_COMPONENT_CONFIG,
     CONF_COMPONENT_CONFIG_DOMAIN,
     CONF_COMPONENT_CONFIG_GLOB,
     CONF_DB_NAME,
     CONF_DEFAULT_MEASUREMENT,
+    CONF_FLUSH_INTERVAL,
+    CONF_GZIP,
     CONF_HOST,
     CONF_IGNORE_ATTRIBUTES,
+    CONF_MAX_BUFFER_SIZE,
     CONF_MEASUREMENT_ATTR,
     CONF_ORG,
     CONF_OVERRIDE_MEASUREMENT,
@@ -85,6 +96,7 @@ from .const import (
     INFLUX_CONF_TAGS,
     INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
+    LINE_PROTOCOL_PRECISION,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
     RE_DECIMAL,
@@ -97,6 +109,7 @@ from .const import (
     TEST_QUERY_V2,
     TIMEOUT,
     WRITE_ERROR,
+    WROTE_BUFFERED_MESSAGE,
     WROTE_MESSAGE,
 )
 
@@ -160,6 +173,13 @@ _CUSTOMIZE_ENTITY_SCHEMA = vol.Schema(
 _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
     {
         vol.Optional(CONF_RETRY_COUNT, default=0): cv.positive_int,
+        vol.Optional(CONF_BATCH_SIZE, default=BATCH_BUFFER_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_FLUSH_INTERVAL, default=BATCH_TIMEOUT): cv.positive_float,
+        vol.Optional(CONF_GZIP, default=False): cv.boolean,
+        # Size in MiB of the disk buffer used while InfluxDB is unreachable
+        vol.Optional(CONF_MAX_BUFFER_SIZE, default=0): cv.positive_int,
         vol.Optional(CONF_DEFAULT_MEASUREMENT): cv.string,
         vol.Optional(CONF_MEASUREMENT_ATTR, default=DEFAULT_MEASUREMENT_ATTR): vol.In(
             ["unit_of_measurement", "domain__device_class", "entity_id"]
@@ -211,27 +231,24 @@ def _generate_event_to_json(conf: dict) -> Callable[[dict], str]:
         conf[CONF_COMPONENT_CONFIG_GLOB],
     )
 
-    def event_to_json(event: dict) -> str:
-        """Convert event into json in format Influx expects."""
-        state = event.data.get(EVENT_NEW_STATE)
-        if (
-            state is None
-            or state.state in (STATE_UNKNOWN, "", STATE_UNAVAILABLE)
-            or not entity_filter(state.entity_id)
-        ):
-            return
-
-        try:
-            _include_state = _include_value = False
+    # Entity filter result and measurement details do not change between
+    # events of an entity, unless the attribute the measurement is taken from
+    # changes, so they are only worked out once per entity.
+    included_entities: dict[str, bool] = {}
+    entity_measurements: dict[str, tuple[Any, str, bool, bool, set[str]]] = {}
+
+    def _entity_measurement(state) -> tuple[str, bool, bool, set[str]]:
+        """Return measurement, uom/device class inclusion and ignored attributes."""
+        if measurement_attr == "entity_id":
+            source = None
+        elif measurement_attr == "domain__device_class":
+            source = state.attributes.get("device_class")
+        else:
+            source = state.attributes.get(measurement_attr)
 
-            _state_as_value = float(state.state)
-            _include_value = True
-        except ValueError:
-            try:
-                _state_as_value = float(state_helper.state_as_number(state))
-                _include_state = _include_value = True
-            except ValueError:
-                _include_state = True
+        cached = entity_measurements.get(state.entity_id)
+        if cached is not None and cached[0] == source:
+            return cached[1:]
 
         include_uom = True
         include_dc = True
@@ -244,15 +261,14 @@ def _generate_event_to_json(conf: dict) -> Callable[[dict], str]:
                 if measurement_attr == "entity_id":
                     measurement = state.entity_id
                 elif measurement_attr == "domain__device_class":
-                    device_class = state.attributes.get("device_class")
-                    if device_class is None:
+                    if source is None:
                         # This entity doesn't have a device_class set, use only domain
                         measurement = state.domain
                     else:
-                        measurement = f"{state.domain}__{device_class}"
+                        measurement = f"{state.domain}__{source}"
                         include_dc = False
                 else:
-                    measurement = state.attributes.get(measurement_attr)
+                    measurement = source
                 if measurement in (None, ""):
                     if default_measurement:
                         measurement = default_measurement
@@ -261,6 +277,43 @@ def _generate_event_to_json(conf: dict) -> Callable[[dict], str]:
                 else:
                     include_uom = measurement_attr != "unit_of_measurement"
 
+        ignore_attributes = set(entity_config.get(CONF_IGNORE_ATTRIBUTES, []))
+        ignore_attributes.update(global_ignore_attributes)
+
+        cached = (source, measurement, include_uom, include_dc, ignore_attributes)
+        entity_measurements[state.entity_id] = cached
+        return cached[1:]
+
+    def event_to_json(event: dict) -> str:
+        """Convert event into json in format Influx expects."""
+        state = event.data.get(EVENT_NEW_STATE)
+        if state is None or state.state in (STATE_UNKNOWN, "", STATE_UNAVAILABLE):
+            return
+
+        included = included_entities.get(state.entity_id)
+        if included is None:
+            included = included_entities[state.entity_id] = entity_filter(
+                state.entity_id
+            )
+        if not included:
+            return
+
+        try:
+            _include_state = _include_value = False
+
+            _state_as_value = float(state.state)
+            _include_value = True
+        except ValueError:
+            try:
+                _state_as_value = float(state_helper.state_as_number(state))
+                _include_state = _include_value = True
+            except ValueError:
+                _include_state = True
+
+        measurement, include_uom, include_dc, ignore_attributes = _entity_measurement(
+            state
+        )
+
         json = {
             INFLUX_CONF_MEASUREMENT: measurement,
             INFLUX_CONF_TAGS: {
@@ -275,8 +328,6 @@ def _generate_event_to_json(conf: dict) -> Callable[[dict], str]:
         if _include_value:
             json[INFLUX_CONF_FIELDS][INFLUX_CONF_VALUE] = _state_as_value
 
-        ignore_attributes = set(entity_config.get(CONF_IGNORE_ATTRIBUTES, []))
-        ignore_attributes.update(global_ignore_attributes)
         for key, value in state.attributes.items():
             if key in tags_attributes:
                 json[INFLUX_CONF_TAGS][key] = value
@@ -316,12 +367,19 @@ def _generate_event_to_json(conf: dict) -> Callable[[dict], str]:
     return event_to_json
 
 
+def _points_to_lines(json: list[dict], precision: str | None) -> str:
+    """Convert points into line protocol."""
+    return make_lines(
+        {"points": json}, LINE_PROTOCOL_PRECISION.get(precision, precision)
+    )
+
+
 @dataclass
 class InfluxClient:
     """An InfluxDB client wrapper for V1 or V2."""
 
     data_repositories: list[str]
-    write: Callable[[str], None]
+    write: Callable[[list[dict] | str], None]
     query: Callable[[str, str], list[Any]]
     close: Callable[[], None]
 
@@ -332,6 +390,7 @@ def get_influx_connection(conf, test_write=False, test_read=False):  # noqa: C90
         CONF_TIMEOUT: TIMEOUT,
     }
     precision = conf.get(CONF_PRECISION)
+    use_gzip = conf.get(CONF_GZIP, False)
 
     if conf[CONF_API_VERSION] == API_VERSION_2:
         kwargs[CONF_URL] = conf[CONF_URL]
@@ -340,6 +399,8 @@ def get_influx_connection(conf, test_write=False, test_read=False):  # noqa: C90
         kwargs[CONF_VERIFY_SSL] = conf[CONF_VERIFY_SSL]
         if CONF_SSL_CA_CERT in conf:
             kwargs[CONF_SSL_CA_CERT] = conf[CONF_SSL_CA_CERT]
+        if use_gzip:
+            kwargs["enable_gzip"] = True
         bucket = conf.get(CONF_BUCKET)
         influx = InfluxDBClientV2(**kwargs)
         query_api = influx.query_api()
@@ -423,10 +484,34 @@ def get_influx_connection(conf, test_write=False, test_read=False):  # noqa: C90
 
     influx = InfluxDBClient(**kwargs)
 
+    def write_gzip_v1(json):
+        """Write data to V1 influx as gzip compressed line protocol."""
+        if not isinstance(json, str):
+            json = _points_to_lines(json, precision)
+        params = {"db": kwargs.get(CONF_DB_NAME)}
+        if precision is not None:
+            params["precision"] = LINE_PROTOCOL_PRECISION.get(precision, precision)
+        influx.request(
+            url="write",
+            method="POST",
+            params=params,
+            data=gzip.compress(json.encode("utf-8")),
+            expected_response_code=204,
+            headers={
+                "Content-Type": "application/octet-stream",
+                "Content-Encoding": "gzip",
+            },
+        )
+
     def write_v1(json):
         """Write data to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            if use_gzip:
+                write_gzip_v1(json)
+            elif isinstance(json, str):
+                influx.write_points(json, time_precision=precision, protocol="line")
+            else:
+                influx.write_points(json, time_precision=precision)
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -479,7 +564,22 @@ def setup(hass, config):
 
     event_to_json = _generate_event_to_json(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    buffer = None
+    if conf[CONF_MAX_BUFFER_SIZE]:
+        buffer = WriteBuffer(
+            hass.config.path(STORAGE_DIR, BUFFER_FILE),
+            conf[CONF_MAX_BUFFER_SIZE] * 1024 * 1024,
+        )
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass,
+        influx,
+        event_to_json,
+        max_tries,
+        batch_size=conf[CONF_BATCH_SIZE],
+        flush_interval=conf[CONF_FLUSH_INTERVAL],
+        precision=conf.get(CONF_PRECISION),
+        buffer=buffer,
+    )
     instance.start()
 
     def shutdown(event):
@@ -496,14 +596,29 @@ def setup(hass, config):
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(
+        self,
+        hass,
+        influx,
+        event_to_json,
+        max_tries,
+        batch_size=BATCH_BUFFER_SIZE,
+        flush_interval=BATCH_TIMEOUT,
+        precision=None,
+        buffer=None,
+    ):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue = queue.Queue()
         self.influx = influx
         self.event_to_json = event_to_json
         self.max_tries = max_tries
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.precision = precision
+        self.buffer = buffer
         self.write_errors = 0
+        self.next_buffer_flush = 0.0
         self.shutdown = False
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
@@ -513,24 +628,31 @@ class InfluxThread(threading.Thread):
         item = (time.monotonic(), event)
         self.queue.put(item)
 
-    @staticmethod
-    def batch_timeout():
+    def batch_timeout(self):
         """Return number of seconds to wait for more events."""
-        return BATCH_TIMEOUT
+        return self.flush_interval
 
     def get_events_json(self):
         """Return a batch of events formatted for writing."""
-        queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
+        if self.buffer is not None:
+            # Events that can not be written are moved to the disk buffer
+            # without waiting for retries, so the queue never backs up.
+            queue_seconds = math.inf
+        else:
+            queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
 
         count = 0
         json = []
+        deadline = math.inf
 
         dropped = 0
 
         with suppress(queue.Empty):
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
-                timeout = None if count == 0 else self.batch_timeout()
+            while len(json) < self.batch_size and not self.shutdown:
+                timeout = None if count == 0 else max(deadline - time.monotonic(), 0)
                 item = self.queue.get(timeout=timeout)
+                if count == 0:
+                    deadline = time.monotonic() + self.batch_timeout()
                 count += 1
 
                 if item is None:
@@ -551,8 +673,38 @@ class InfluxThread(threading.Thread):
 
         return count, json
 
+    def write_to_buffer(self, json, err):
+        """Store events in the disk buffer until InfluxDB is reachable again."""
+        if not self.buffer.pending and not self.write_errors:
+            _LOGGER.error(BUFFERING_MESSAGE, err, self.buffer.path)
+            self.next_buffer_flush = time.monotonic() + RETRY_DELAY
+
+        if not self.buffer.append(_points_to_lines(json, self.precision).splitlines()):
+            if not self.write_errors:
+                _LOGGER.error(BUFFER_FULL_MESSAGE, self.buffer.path)
+            self.write_errors += len(json)
+
+    def flush_buffer(self):
+        """Write buffered events to influxdb, return False if it failed."""
+        if time.monotonic() < self.next_buffer_flush:
+            return False
+
+        try:
+            written = self.buffer.flush(self.influx.write, self.batch_size)
+        except ConnectionError:
+            self.next_buffer_flush = time.monotonic() + RETRY_DELAY
+            return False
+
+        _LOGGER.debug(WROTE_BUFFERED_MESSAGE, written)
+        return True
+
     def write_to_influxdb(self, json):
         """Write preprocessed events to influxdb, with retry."""
+        if self.buffer is not None and self.buffer.pending:
+            if not self.flush_buffer():
+                self.write_to_buffer(json, None)
+                return
+
         for retry in range(self.max_tries + 1):
             try:
                 self.influx.write(json)
@@ -569,6 +721,8 @@ class InfluxThread(threading.Thread):
             except ConnectionError as err:
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
+                elif self.buffer is not None:
+                    self.write_to_buffer(json, err)
                 else:
                     if not self.write_errors:
                         _LOGGER.error(err)
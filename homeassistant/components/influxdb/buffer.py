@@ -0,0 +1,72 @@
+"""Disk backed write buffer for the InfluxDB integration."""
+from __future__ import annotations
+
+from itertools import islice
+import logging
+import os
+from typing import Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WriteBuffer:
+    """Spool of line protocol points that could not be written yet.
+
+    Points are appended while InfluxDB is unreachable and written in order
+    once it is back. Writing a point twice is harmless, InfluxDB overwrites
+    points with the same measurement, tag set and timestamp.
+    """
+
+    def __init__(self, path: str, max_size: int) -> None:
+        """Initialize the buffer, picking up points left by a previous run."""
+        self.path = path
+        self.max_size = max_size
+        self._offset = 0
+        try:
+            self._size = os.path.getsize(path)
+        except OSError:
+            self._size = 0
+
+    @property
+    def pending(self) -> bool:
+        """Return True if there are points waiting to be written."""
+        return self._size > self._offset
+
+    def append(self, lines: list[str]) -> bool:
+        """Append lines to the buffer, return False if they did not fit."""
+        data = "".join(f"{line}\n" for line in lines).encode("utf-8")
+        if self._size + len(data) > self.max_size:
+            return False
+
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "ab") as file:
+                file.write(data)
+        except OSError as err:
+            _LOGGER.error("Unable to write to buffer %s: %s", self.path, err)
+            return False
+
+        self._size += len(data)
+        return True
+
+    def flush(self, write: Callable[[str], None], batch_size: int) -> int:
+        """Write buffered lines in batches, return the number of lines written.
+
+        A ConnectionError raised by write is passed on, the lines that were
+        not written yet stay buffered.
+        """
+        written = 0
+        with open(self.path, "rb") as file:
+            file.seek(self._offset)
+            while batch := list(islice(file, batch_size)):
+                try:
+                    write(b"".join(batch).decode("utf-8"))
+                except ValueError as err:
+                    _LOGGER.error(err)
+                else:
+                    written += len(batch)
+                self._offset = file.tell()
+
+        os.remove(self.path)
+        self._offset = self._size = 0
+        return written
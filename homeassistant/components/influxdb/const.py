@@ -32,6 +32,10 @@ CONF_RETRY_COUNT = "max_retries"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
 CONF_PRECISION = "precision"
 CONF_SSL_CA_CERT = "ssl_ca_cert"
+CONF_BATCH_SIZE = "batch_size"
+CONF_FLUSH_INTERVAL = "flush_interval"
+CONF_GZIP = "gzip"
+CONF_MAX_BUFFER_SIZE = "max_buffer_size"
 
 CONF_LANGUAGE = "language"
 CONF_QUERIES = "queries"
@@ -78,11 +82,14 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+BUFFER_FILE = "influxdb.buffer"
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
 TEST_QUERY_V2 = "buckets()"
 CODE_INVALID_INPUTS = 400
+# InfluxDB V2 precision names which are spelled differently in line protocol
+LINE_PROTOCOL_PRECISION = {"ns": "n", "us": "u"}
 
 MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=10)
 
@@ -120,6 +127,9 @@ RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
 WROTE_MESSAGE = "Wrote %d events."
+BUFFERING_MESSAGE = "%s Buffering events in %s until InfluxDB is reachable again."
+BUFFER_FULL_MESSAGE = "Buffer %s is full, dropping events."
+WROTE_BUFFERED_MESSAGE = "Wrote %d buffered events."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
 QUERY_MULTIPLE_RESULTS_MESSAGE = (
@@ -14,8 +14,12 @@ from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.history import sqlalchemy_filter_from_include_exclude_conf
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder.models import (
+    STATE_CHANGED,
     Events,
+    SchemaChanges,
+    StateAttributes,
     States,
+    process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.util import session_scope
@@ -94,6 +98,14 @@ EVENT_COLUMNS = [
     Events.context_parent_id,
 ]
 
+# Rows recorded before schema 21 keep their attributes in the row
+STATE_ATTRIBUTES = sqlalchemy.func.coalesce(
+    StateAttributes.shared_attrs, States.attributes
+)
+
+# Events recorded before schema 23 have no entity_id column
+EVENTS_ENTITY_ID_SCHEMA_VERSION = 23
+
 SCRIPT_AUTOMATION_EVENTS = [EVENT_AUTOMATION_TRIGGERED, EVENT_SCRIPT_STARTED]
 
 LOG_MESSAGE_SCHEMA = vol.Schema(
@@ -238,22 +250,20 @@ class LogbookView(HomeAssistantView):
                 "Can't combine entity with context_id", HTTP_BAD_REQUEST
             )
 
-        def json_events():
-            """Fetch events and generate JSON."""
-            return self.json(
-                _get_events(
-                    hass,
-                    start_day,
-                    end_day,
-                    entity_ids,
-                    self.filters,
-                    self.entities_filter,
-                    entity_matches_only,
-                    context_id,
-                )
+        def events():
+            """Fetch events as they are streamed."""
+            return _get_events(
+                hass,
+                start_day,
+                end_day,
+                entity_ids,
+                self.filters,
+                self.entities_filter,
+                entity_matches_only,
+                context_id,
             )
 
-        return await hass.async_add_executor_job(json_events)
+        return await self.async_json_stream(request, events)
 
 
 def humanify(hass, events, entity_attr_cache, context_lookup):
@@ -420,7 +430,7 @@ def _get_events(
     entity_matches_only=False,
     context_id=None,
 ):
-    """Get events for a period of time."""
+    """Yield the logbook entries for a period of time."""
     assert not (
         entity_ids and context_id
     ), "can't pass in both entity_ids and context_id"
@@ -443,7 +453,7 @@ def _get_events(
     if entity_ids is not None:
         entities_filter = generate_filter([], entity_ids, [], [])
 
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         old_state = aliased(States, name="old_state")
 
         if entity_ids is not None:
@@ -455,7 +465,9 @@ def _get_events(
             if entity_matches_only:
                 # When entity_matches_only is provided, contexts and events that do not
                 # contain the entity_ids are not included in the logbook response.
-                query = _apply_event_entity_id_matchers(query, entity_ids)
+                query = _apply_event_entity_id_matchers(
+                    query, entity_ids, _legacy_events_before(session, start_day)
+                )
 
             query = query.union_all(
                 _generate_states_query(
@@ -467,10 +479,7 @@ def _get_events(
             query = _apply_event_time_filter(query, start_day, end_day)
             query = _apply_events_types_and_states_filter(
                 hass, query, old_state
-            ).filter(
-                (States.last_updated == States.last_changed)
-                | (Events.event_type != EVENT_STATE_CHANGED)
-            )
+            ).filter(STATE_CHANGED | (Events.event_type != EVENT_STATE_CHANGED))
             if filters:
                 query = query.filter(
                     filters.entity_filter() | (Events.event_type != EVENT_STATE_CHANGED)
@@ -481,8 +490,8 @@ def _get_events(
 
         query = query.order_by(Events.time_fired)
 
-        return list(
-            humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
+        yield from humanify(
+            hass, yield_events(query), entity_attr_cache, context_lookup
         )
 
 
@@ -492,7 +501,7 @@ def _generate_events_query(session):
         States.state,
         States.entity_id,
         States.domain,
-        States.attributes,
+        STATE_ATTRIBUTES.label("attributes"),
     )
 
 
@@ -510,20 +519,23 @@ def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
     return (
         _generate_events_query(session)
         .outerjoin(Events, (States.event_id == Events.event_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
         .filter(_missing_state_matcher(old_state))
         .filter(_continuous_entity_matcher())
         .filter((States.last_updated > start_day) & (States.last_updated < end_day))
-        .filter(
-            (States.last_updated == States.last_changed)
-            & States.entity_id.in_(entity_ids)
-        )
+        .filter(STATE_CHANGED & States.entity_id.in_(entity_ids))
     )
 
 
 def _apply_events_types_and_states_filter(hass, query, old_state):
     events_query = (
         query.outerjoin(States, (Events.event_id == States.event_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
         .filter(
             (Events.event_type != EVENT_STATE_CHANGED)
@@ -554,7 +566,7 @@ def _continuous_entity_matcher():
     #
     return sqlalchemy.or_(
         sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS)),
-        sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON)),
+        sqlalchemy.not_(STATE_ATTRIBUTES.contains(UNIT_OF_MEASUREMENT_JSON)),
     )
 
 
@@ -570,15 +582,40 @@ def _apply_event_types_filter(hass, query, event_types):
     )
 
 
-def _apply_event_entity_id_matchers(events_query, entity_ids):
-    return events_query.filter(
-        sqlalchemy.or_(
-            *(
-                Events.event_data.contains(ENTITY_ID_JSON_TEMPLATE.format(entity_id))
-                for entity_id in entity_ids
-            )
-        )
+def _legacy_events_before(session, start_day):
+    """Return until when events were recorded without an entity_id column.
+
+    None is returned when the requested period has no such events.
+    """
+    entity_id_recorded_since = (
+        session.query(sqlalchemy.func.min(SchemaChanges.changed))
+        .filter(SchemaChanges.schema_version >= EVENTS_ENTITY_ID_SCHEMA_VERSION)
+        .scalar()
     )
+    if entity_id_recorded_since is None:
+        return dt_util.utcnow()
+    entity_id_recorded_since = process_timestamp(entity_id_recorded_since)
+    if entity_id_recorded_since <= dt_util.as_utc(start_day):
+        return None
+    return entity_id_recorded_since
+
+
+def _apply_event_entity_id_matchers(events_query, entity_ids, legacy_events_before):
+    matchers = Events.entity_id.in_(entity_ids)
+    if legacy_events_before is not None:
+        legacy_matchers = sqlalchemy.and_(
+            Events.time_fired < legacy_events_before,
+            sqlalchemy.or_(
+                *(
+                    Events.event_data.contains(
+                        ENTITY_ID_JSON_TEMPLATE.format(entity_id)
+                    )
+                    for entity_id in entity_ids
+                )
+            ),
+        )
+        matchers = sqlalchemy.or_(matchers, legacy_matchers)
+    return events_query.filter(matchers)
 
 
 def _keep_event(hass, event, entities_filter):
@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 import asyncio
-from functools import lru_cache, partial, wraps
+from collections import deque
+from functools import partial, wraps
 import inspect
 from itertools import groupby
 import logging
 from operator import attrgetter
 import ssl
+import threading
 import time
 from typing import Any, Awaitable, Callable, Union, cast
 import uuid
@@ -73,8 +75,10 @@ from .const import (
     PROTOCOL_311,
 )
 from .discovery import LAST_DISCOVERY
+from .matcher import TopicTrie
 from .models import (
     AsyncMessageCallbackType,
+    MessageBatchStats,
     MessageCallbackType,
     PublishMessage,
     PublishPayloadType,
@@ -417,6 +421,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     websocket_api.async_register_command(hass, websocket_subscribe)
     websocket_api.async_register_command(hass, websocket_remove_device)
     websocket_api.async_register_command(hass, websocket_mqtt_info)
+    websocket_api.async_register_command(hass, websocket_message_stats)
 
     if conf is None:
         # If we have a config entry, setup is done by that config entry.
@@ -556,7 +561,6 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
@@ -580,6 +584,7 @@ class MQTT:
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: list[Subscription] = []
+        self._subscription_trie: TopicTrie[Subscription] = TopicTrie()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -588,6 +593,12 @@ class MQTT:
 
         self._pending_operations: dict[str, asyncio.Event] = {}
 
+        # Messages received by the paho thread, waiting for the event loop
+        self._pending_messages: deque[tuple[Any, float]] = deque()
+        self._pending_messages_lock = threading.Lock()
+        self._drain_scheduled = False
+        self.message_stats = MessageBatchStats()
+
         if self.hass.state == CoreState.running:
             self._ha_started.set()
         else:
@@ -755,11 +766,9 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        self._subscription_trie.add(topic, subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -772,9 +781,9 @@ class MQTT:
             if subscription not in self.subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
+            self._subscription_trie.remove(topic, subscription)
 
-            if any(other.topic == topic for other in self.subscriptions):
+            if self._subscription_trie.has_filter(topic):
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
@@ -862,16 +871,37 @@ class MQTT:
             )
 
     def _mqtt_on_message(self, _mqttc, _userdata, msg) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
+
+        Messages are queued and the event loop is only woken up once for all
+        messages that arrive before it gets to drain the queue.
+        """
+        with self._pending_messages_lock:
+            self._pending_messages.append((msg, time.monotonic()))
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        self.hass.loop.call_soon_threadsafe(self._mqtt_handle_pending_messages)
+
+    @callback
+    def _mqtt_handle_pending_messages(self) -> None:
+        """Handle all messages queued by the paho thread."""
+        with self._pending_messages_lock:
+            self._drain_scheduled = False
+            if not (pending := self._pending_messages):
+                return
+            self._pending_messages = deque()
+
+        self.message_stats.record_batch(len(pending), time.monotonic() - pending[0][1])
+        for msg, _ in pending:
+            try:
+                self._mqtt_handle_message(msg)
+            except Exception:  # pylint: disable=broad-except
+                # Don't let one failing message drop the rest of the batch
+                _LOGGER.exception("Error handling MQTT message on %s", msg.topic)
 
-    @lru_cache(2048)
-    def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+    def _matching_subscriptions(self, topic: str) -> list[Subscription]:
+        return list(self._subscription_trie.iter_match(topic))
 
     @callback
     def _mqtt_handle_message(self, msg) -> None:
@@ -983,16 +1013,6 @@ def _raise_on_error(result_code: int | None) -> None:
         )
 
 
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
-
-
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/debug_info", vol.Required("device_id"): str}
 )
@@ -1005,6 +1025,14 @@ async def websocket_mqtt_info(hass, connection, msg):
     connection.send_result(msg["id"], mqtt_info)
 
 
+@websocket_api.websocket_command({vol.Required("type"): "mqtt/message_stats"})
+@websocket_api.require_admin
+@callback
+def websocket_message_stats(hass, connection, msg):
+    """Get the batch size and queue latency of received MQTT messages."""
+    connection.send_result(msg["id"], hass.data[DATA_MQTT].message_stats.as_dict())
+
+
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/remove", vol.Required("device_id"): str}
 )
@@ -0,0 +1,117 @@
+"""Topic filter index used to dispatch MQTT messages to subscriptions."""
+from __future__ import annotations
+
+from typing import Generic, Iterator, TypeVar
+
+_T = TypeVar("_T")
+
+SINGLE_LEVEL_WILDCARD = "+"
+MULTI_LEVEL_WILDCARD = "#"
+
+
+class _Node(Generic[_T]):
+    """Node of the topic trie, one per topic level."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _Node[_T]] = {}
+        self.values: list[_T] = []
+
+
+class TopicTrie(Generic[_T]):
+    """Wildcard aware trie of MQTT topic filters.
+
+    Every topic filter is split in levels and stored as a path in the trie, so
+    finding the values that match a topic costs time proportional to the depth
+    of the topic rather than to the number of filters. The trie is updated
+    incrementally when filters are added or removed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _Node[_T] = _Node()
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of values stored in the trie."""
+        return self._count
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Associate a value with a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            child = node.children.get(level)
+            if child is None:
+                child = node.children[level] = _Node()
+            node = child
+        node.values.append(value)
+        self._count += 1
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value associated with a topic filter.
+
+        Raises KeyError if the value is not associated with the filter.
+        """
+        path: list[tuple[_Node[_T], str]] = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                raise KeyError(topic_filter)
+            path.append((node, level))
+            node = child
+
+        try:
+            node.values.remove(value)
+        except ValueError as err:
+            raise KeyError(topic_filter) from err
+        self._count -= 1
+
+        # Prune the nodes that no longer lead to any value
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.values or child.children:
+                break
+            del parent.children[level]
+
+    def has_filter(self, topic_filter: str) -> bool:
+        """Return if any value is associated with this exact topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.values)
+
+    def iter_match(self, topic: str) -> Iterator[_T]:
+        """Iterate over the values of all topic filters matching the topic."""
+        levels = topic.split("/")
+        depth = len(levels)
+        # Wildcards on the first level must not match topics starting with $
+        wildcards_at_root = not topic.startswith("$")
+        stack: list[tuple[_Node[_T], int]] = [(self._root, 0)]
+
+        while stack:
+            node, index = stack.pop()
+            children = node.children
+            allow_wildcards = index > 0 or wildcards_at_root
+
+            if (
+                allow_wildcards
+                and (multi := children.get(MULTI_LEVEL_WILDCARD)) is not None
+            ):
+                yield from multi.values
+
+            if index == depth:
+                yield from node.values
+                continue
+
+            if (
+                allow_wildcards
+                and (single := children.get(SINGLE_LEVEL_WILDCARD)) is not None
+            ):
+                stack.append((single, index + 1))
+
+            if (exact := children.get(levels[index])) is not None:
+                stack.append((exact, index + 1))
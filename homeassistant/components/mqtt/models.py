@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import Awaitable, Callable, Union
+from typing import Any, Awaitable, Callable, Union
 
 import attr
 
@@ -32,5 +32,30 @@ class ReceiveMessage:
     timestamp: dt.datetime = attr.ib(default=None)
 
 
+@attr.s(slots=True)
+class MessageBatchStats:
+    """Statistics about batches of messages handed off by the paho thread."""
+
+    batches: int = attr.ib(default=0)
+    messages: int = attr.ib(default=0)
+    last_batch_size: int = attr.ib(default=0)
+    max_batch_size: int = attr.ib(default=0)
+    last_queue_latency: float = attr.ib(default=0.0)
+    max_queue_latency: float = attr.ib(default=0.0)
+
+    def record_batch(self, size: int, queue_latency: float) -> None:
+        """Record a batch of messages drained by the event loop."""
+        self.batches += 1
+        self.messages += size
+        self.last_batch_size = size
+        self.max_batch_size = max(self.max_batch_size, size)
+        self.last_queue_latency = queue_latency
+        self.max_queue_latency = max(self.max_queue_latency, queue_latency)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        return attr.asdict(self)
+
+
 AsyncMessageCallbackType = Callable[[ReceiveMessage], Awaitable[None]]
 MessageCallbackType = Callable[[ReceiveMessage], None]
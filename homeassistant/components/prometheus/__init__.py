@@ -1,9 +1,11 @@
 """Support for Prometheus metrics export."""
 import logging
 import string
+import time
 
 from aiohttp import web
 import prometheus_client
+from prometheus_client.utils import floatToGoString
 import voluptuous as vol
 
 from homeassistant import core as hacore
@@ -84,8 +86,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass, config):
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(prometheus_client))
-
     conf = config[DOMAIN]
     entity_filter = conf[CONF_FILTER]
     namespace = conf.get(CONF_PROM_NAMESPACE)
@@ -108,6 +108,7 @@ def setup(hass, config):
         default_metric,
     )
 
+    hass.http.register_view(PrometheusView(metrics))
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_event)
     return True
 
@@ -144,8 +145,19 @@ class PrometheusMetrics:
         else:
             self.metrics_prefix = ""
         self._metrics = {}
+        # Series of the metrics of each entity, dropped when its friendly_name
+        # changes as that is one of the labels
+        self._entity_series = {}
         self._climate_units = climate_units
 
+    def generate_latest(self):
+        """Return the metrics of the registry and of the entities as text."""
+        return (
+            self.prometheus_cli.generate_latest()
+            + "".join(metric.render() for metric in self._metrics.values()).encode()
+        )
+
+    @hacore.callback
     def handle_event(self, event):
         """Listen for new messages on the bus, and add them to Prometheus."""
         state = event.data.get("new_state")
@@ -166,29 +178,31 @@ class PrometheusMetrics:
         if hasattr(self, handler) and state.state not in ignored_states:
             getattr(self, handler)(state)
 
-        labels = self._labels(state)
-        state_change = self._metric(
-            "state_change", self.prometheus_cli.Counter, "The number of state changes"
-        )
-        state_change.labels(**labels).inc()
+        self._series(
+            state,
+            "state_change",
+            self.prometheus_cli.Counter,
+            "The number of state changes",
+        ).inc()
 
-        entity_available = self._metric(
+        self._series(
+            state,
             "entity_available",
             self.prometheus_cli.Gauge,
             "Entity is available (not in the unavailable or unknown state)",
-        )
-        entity_available.labels(**labels).set(float(state.state not in ignored_states))
+        ).set(float(state.state not in ignored_states))
 
-        last_updated_time_seconds = self._metric(
+        self._series(
+            state,
             "last_updated_time_seconds",
             self.prometheus_cli.Gauge,
             "The last_updated timestamp",
-        )
-        last_updated_time_seconds.labels(**labels).set(state.last_updated.timestamp())
+        ).set(state.last_updated.timestamp())
 
     def _handle_attributes(self, state):
         for key, value in state.attributes.items():
-            metric = self._metric(
+            series = self._series(
+                state,
                 f"{state.domain}_attr_{key.lower()}",
                 self.prometheus_cli.Gauge,
                 f"{key} attribute of {state.domain} entity",
@@ -196,22 +210,39 @@ class PrometheusMetrics:
 
             try:
                 value = float(value)
-                metric.labels(**self._labels(state)).set(value)
+                series.set(value)
             except (ValueError, TypeError):
                 pass
 
-    def _metric(self, metric, factory, documentation, extra_labels=None):
-        labels = ["entity", "friendly_name", "domain"]
-        if extra_labels is not None:
-            labels.extend(extra_labels)
+    def _series(self, state, metric, factory, documentation, **extra_labels):
+        """Return the series of a metric for the entity of the state."""
+        friendly_name = state.attributes.get(ATTR_FRIENDLY_NAME)
+        entity_series = self._entity_series.get(state.entity_id)
+        if entity_series is None or entity_series[0] != friendly_name:
+            entity_series = self._entity_series[state.entity_id] = (friendly_name, {})
+        key = (metric, *extra_labels.values())
+        try:
+            return entity_series[1][key]
+        except KeyError:
+            series = entity_series[1][key] = self._metric(
+                metric, factory, documentation
+            ).labels(**self._labels(state), **extra_labels)
+            return series
 
+    def _metric(self, metric, factory, documentation):
+        """Return a metric, factory is the prometheus_client class of its type."""
         try:
             return self._metrics[metric]
         except KeyError:
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric}"
             )
-            self._metrics[metric] = factory(full_metric_name, documentation, labels)
+            # Rendered separately from the metrics of the registry
+            self._metrics[metric] = RenderedMetric(
+                full_metric_name,
+                documentation,
+                factory is self.prometheus_cli.Counter,
+            )
             return self._metrics[metric]
 
     @staticmethod
@@ -248,53 +279,61 @@ class PrometheusMetrics:
 
     def _battery(self, state):
         if "battery_level" in state.attributes:
-            metric = self._metric(
+            series = self._series(
+                state,
                 "battery_level_percent",
                 self.prometheus_cli.Gauge,
                 "Battery level as a percentage of its capacity",
             )
             try:
                 value = float(state.attributes[ATTR_BATTERY_LEVEL])
-                metric.labels(**self._labels(state)).set(value)
+                series.set(value)
             except ValueError:
                 pass
 
     def _handle_binary_sensor(self, state):
-        metric = self._metric(
+        series = self._series(
+            state,
             "binary_sensor_state",
             self.prometheus_cli.Gauge,
             "State of the binary sensor (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        series.set(value)
 
     def _handle_input_boolean(self, state):
-        metric = self._metric(
+        series = self._series(
+            state,
             "input_boolean_state",
             self.prometheus_cli.Gauge,
             "State of the input boolean (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        series.set(value)
 
     def _handle_device_tracker(self, state):
-        metric = self._metric(
+        series = self._series(
+            state,
             "device_tracker_state",
             self.prometheus_cli.Gauge,
             "State of the device tracker (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        series.set(value)
 
     def _handle_person(self, state):
-        metric = self._metric(
-            "person_state", self.prometheus_cli.Gauge, "State of the person (0/1)"
+        series = self._series(
+            state,
+            "person_state",
+            self.prometheus_cli.Gauge,
+            "State of the person (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        series.set(value)
 
     def _handle_light(self, state):
-        metric = self._metric(
+        series = self._series(
+            state,
             "light_brightness_percent",
             self.prometheus_cli.Gauge,
             "Light brightness percentage (0..100)",
@@ -306,28 +345,29 @@ class PrometheusMetrics:
             else:
                 value = self.state_as_number(state)
             value = value * 100
-            metric.labels(**self._labels(state)).set(value)
+            series.set(value)
         except ValueError:
             pass
 
     def _handle_lock(self, state):
-        metric = self._metric(
-            "lock_state", self.prometheus_cli.Gauge, "State of the lock (0/1)"
+        series = self._series(
+            state, "lock_state", self.prometheus_cli.Gauge, "State of the lock (0/1)"
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        series.set(value)
 
     def _handle_climate_temp(self, state, attr, metric_name, metric_description):
         temp = state.attributes.get(attr)
         if temp:
             if self._climate_units == TEMP_FAHRENHEIT:
                 temp = fahrenheit_to_celsius(temp)
-            metric = self._metric(
+            series = self._series(
+                state,
                 metric_name,
                 self.prometheus_cli.Gauge,
                 metric_description,
             )
-            metric.labels(**self._labels(state)).set(temp)
+            series.set(temp)
 
     def _handle_climate(self, state):
         self._handle_climate_temp(
@@ -357,51 +397,49 @@ class PrometheusMetrics:
 
         current_action = state.attributes.get(ATTR_HVAC_ACTION)
         if current_action:
-            metric = self._metric(
-                "climate_action",
-                self.prometheus_cli.Gauge,
-                "HVAC action",
-                ["action"],
-            )
             for action in CURRENT_HVAC_ACTIONS:
-                metric.labels(**dict(self._labels(state), action=action)).set(
-                    float(action == current_action)
-                )
+                self._series(
+                    state,
+                    "climate_action",
+                    self.prometheus_cli.Gauge,
+                    "HVAC action",
+                    action=action,
+                ).set(float(action == current_action))
 
     def _handle_humidifier(self, state):
         humidifier_target_humidity_percent = state.attributes.get(ATTR_HUMIDITY)
         if humidifier_target_humidity_percent:
-            metric = self._metric(
+            series = self._series(
+                state,
                 "humidifier_target_humidity_percent",
                 self.prometheus_cli.Gauge,
                 "Target Relative Humidity",
             )
-            metric.labels(**self._labels(state)).set(humidifier_target_humidity_percent)
+            series.set(humidifier_target_humidity_percent)
 
-        metric = self._metric(
+        series = self._series(
+            state,
             "humidifier_state",
             self.prometheus_cli.Gauge,
             "State of the humidifier (0/1)",
         )
         try:
             value = self.state_as_number(state)
-            metric.labels(**self._labels(state)).set(value)
+            series.set(value)
         except ValueError:
             pass
 
         current_mode = state.attributes.get(ATTR_MODE)
         available_modes = state.attributes.get(ATTR_AVAILABLE_MODES)
         if current_mode and available_modes:
-            metric = self._metric(
-                "humidifier_mode",
-                self.prometheus_cli.Gauge,
-                "Humidifier Mode",
-                ["mode"],
-            )
             for mode in available_modes:
-                metric.labels(**dict(self._labels(state), mode=mode)).set(
-                    float(mode == current_mode)
-                )
+                self._series(
+                    state,
+                    "humidifier_mode",
+                    self.prometheus_cli.Gauge,
+                    "Humidifier Mode",
+                    mode=mode,
+                ).set(float(mode == current_mode))
 
     def _handle_sensor(self, state):
         unit = self._unit_string(state.attributes.get(ATTR_UNIT_OF_MEASUREMENT))
@@ -412,15 +450,18 @@ class PrometheusMetrics:
                 break
 
         if metric is not None:
-            _metric = self._metric(
-                metric, self.prometheus_cli.Gauge, f"Sensor data measured in {unit}"
+            series = self._series(
+                state,
+                metric,
+                self.prometheus_cli.Gauge,
+                f"Sensor data measured in {unit}",
             )
 
             try:
                 value = self.state_as_number(state)
                 if state.attributes.get(ATTR_UNIT_OF_MEASUREMENT) == TEMP_FAHRENHEIT:
                     value = fahrenheit_to_celsius(value)
-                _metric.labels(**self._labels(state)).set(value)
+                series.set(value)
             except ValueError:
                 pass
 
@@ -472,13 +513,16 @@ class PrometheusMetrics:
         return units.get(unit, default)
 
     def _handle_switch(self, state):
-        metric = self._metric(
-            "switch_state", self.prometheus_cli.Gauge, "State of the switch (0/1)"
+        series = self._series(
+            state,
+            "switch_state",
+            self.prometheus_cli.Gauge,
+            "State of the switch (0/1)",
         )
 
         try:
             value = self.state_as_number(state)
-            metric.labels(**self._labels(state)).set(value)
+            series.set(value)
         except ValueError:
             pass
 
@@ -488,13 +532,107 @@ class PrometheusMetrics:
         self._battery(state)
 
     def _handle_automation(self, state):
-        metric = self._metric(
+        series = self._series(
+            state,
             "automation_triggered_count",
             self.prometheus_cli.Counter,
             "Count of times an automation has been triggered",
         )
 
-        metric.labels(**self._labels(state)).inc()
+        series.inc()
+
+
+class RenderedMetric:
+    """Keep the exposition text of each series of a metric.
+
+    Only the series updated since the last scrape are rendered again. The
+    text is the same as prometheus_client 0.7.1 renders, with the labels
+    sorted by name and no HELP line for the _created samples of counters.
+    """
+
+    def __init__(self, name, documentation, counter):
+        """Initialize the rendered metric."""
+        self._counter = counter
+        self._name = name
+        self._sample_name = f"{name}_total" if counter else name
+        documentation = documentation.replace("\\", r"\\").replace("\n", r"\n")
+        metric_type = "counter" if counter else "gauge"
+        self._header = (
+            f"# HELP {self._sample_name} {documentation}\n"
+            f"# TYPE {self._sample_name} {metric_type}\n"
+        )
+        self._values = {}
+        self._samples = {}
+        self._created = {}
+        # Ordered, so new series are rendered in the order they were added
+        self._updated = {}
+        self._text = None
+
+    def labels(self, **labels):
+        """Return the series of the labels."""
+        return RenderedSeries(
+            self,
+            ",".join(
+                f'{key}="{_escape_label_value(str(value))}"'
+                for key, value in sorted(labels.items())
+            ),
+        )
+
+    def value(self, labelstr):
+        """Return the value of a series."""
+        return self._values.get(labelstr, 0.0)
+
+    def update(self, labelstr, value):
+        """Set the value of a series to render it again."""
+        if self._counter and labelstr not in self._created:
+            self._created[labelstr] = (
+                f"{self._name}_created{{{labelstr}}} "
+                f"{floatToGoString(time.time())}\n"
+            )
+        self._values[labelstr] = value
+        self._updated[labelstr] = None
+        self._text = None
+
+    def render(self):
+        """Return the exposition text of the metric."""
+        if self._text is not None:
+            return self._text
+        for labelstr in self._updated:
+            self._samples[labelstr] = (
+                f"{self._sample_name}{{{labelstr}}} "
+                f"{floatToGoString(self._values[labelstr])}\n"
+            )
+        self._updated.clear()
+        self._text = self._header + "".join(self._samples.values())
+        if self._created:
+            self._text += f"# TYPE {self._name}_created gauge\n" + "".join(
+                self._created.values()
+            )
+        return self._text
+
+
+class RenderedSeries:
+    """A series of a rendered metric."""
+
+    __slots__ = ("_metric", "_labelstr")
+
+    def __init__(self, metric, labelstr):
+        """Initialize the series."""
+        self._metric = metric
+        self._labelstr = labelstr
+
+    def set(self, value):
+        """Set the value of the series."""
+        self._metric.update(self._labelstr, float(value))
+
+    def inc(self, amount=1):
+        """Increment the value of the series."""
+        self._metric.update(self._labelstr, self._metric.value(self._labelstr) + amount)
+
+
+def _escape_label_value(value):
+    """Escape a label value for the exposition format."""
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
 
 
 class PrometheusView(HomeAssistantView):
@@ -503,15 +641,18 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, prometheus_cli):
+    def __init__(self, metrics):
         """Initialize Prometheus view."""
-        self.prometheus_cli = prometheus_cli
+        self.metrics = metrics
 
     async def get(self, request):
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
-        return web.Response(
-            body=self.prometheus_cli.generate_latest(),
+        response = web.Response(
+            body=self.metrics.generate_latest(),
             content_type=CONTENT_TYPE_TEXT_PLAIN,
         )
+        # Compressed when the scraper accepts it
+        response.enable_compression()
+        return response
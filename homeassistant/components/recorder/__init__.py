@@ -2,9 +2,13 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 import concurrent.futures
 from datetime import datetime, timedelta
+from functools import partial
 import logging
+import os
+from pathlib import Path
 import queue
 import sqlite3
 import threading
@@ -26,10 +30,9 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
-    EVENT_TIME_CHANGED,
     MATCH_ALL,
 )
-from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.core import CoreState, Event, HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
@@ -51,15 +54,17 @@ import homeassistant.util.dt as dt_util
 
 from . import history, migration, purge, statistics
 from .const import CONF_DB_INTEGRITY_CHECK, DATA_INSTANCE, DOMAIN, SQLITE_URL_PREFIX
+from .history_cache import HistoryCache
 from .models import (
     Base,
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     process_timestamp,
 )
-from .pool import RecorderPool
+from .pool import ReadOnlyPool, RecorderPool
 from .util import (
     dburl_to_path,
     end_incomplete_runs,
@@ -69,6 +74,7 @@ from .util import (
     setup_connection_for_dialect,
     validate_or_move_away_sqlite_database,
 )
+from .writer import BULK_INSERT_DIALECTS, BulkWriter, OldState
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -117,6 +123,10 @@ KEEPALIVE_TIME = 30
 # States and Events objects
 EXPIRE_AFTER_COMMITS = 120
 
+# The number of most recently used attributes_id
+# we keep in memory to avoid looking them up
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
+
 CONF_AUTO_PURGE = "auto_purge"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
@@ -125,6 +135,11 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BULK_INSERT = "bulk_insert"
+CONF_COMPACT_STATES = "compact_states"
+CONF_HISTORY_CACHE_SIZE = "history_cache_size"
+CONF_READ_DB_URL = "read_db_url"
+CONF_READ_POOL_SIZE = "read_pool_size"
 
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
@@ -162,6 +177,11 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(CONF_BULK_INSERT, default=False): cv.boolean,
+                    vol.Optional(CONF_COMPACT_STATES, default=False): cv.boolean,
+                    vol.Optional(CONF_HISTORY_CACHE_SIZE, default=0): cv.positive_int,
+                    vol.Optional(CONF_READ_DB_URL): cv.string,
+                    vol.Optional(CONF_READ_POOL_SIZE, default=0): cv.positive_int,
                 }
             ),
         )
@@ -258,6 +278,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_t=exclude_t,
+        bulk_insert=conf[CONF_BULK_INSERT],
+        compact_states=conf[CONF_COMPACT_STATES],
+        history_cache_size=conf[CONF_HISTORY_CACHE_SIZE],
+        read_db_url=conf.get(CONF_READ_DB_URL),
+        read_pool_size=conf[CONF_READ_POOL_SIZE],
     )
     instance.async_initialize()
     instance.start()
@@ -272,6 +297,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 async def _process_recorder_platform(hass, domain, platform):
     """Process a recorder platform."""
     hass.data[DOMAIN][domain] = platform
+    if hasattr(platform, "async_record_state_changed"):
+        hass.data[DATA_INSTANCE].async_add_state_changed_listener(
+            partial(platform.async_record_state_changed, hass)
+        )
 
 
 @callback
@@ -350,6 +379,14 @@ class WaitTask:
     """An object to insert into the recorder queue to tell it set the _queue_watch event."""
 
 
+class CommitTask:
+    """An object to insert into the recorder queue to commit the event session."""
+
+
+class KeepAliveTask:
+    """An object to insert into the recorder queue to keep the connection alive."""
+
+
 class Recorder(threading.Thread):
     """A threaded recorder class."""
 
@@ -364,6 +401,11 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_t: list[str],
+        bulk_insert: bool = False,
+        compact_states: bool = False,
+        history_cache_size: int = 0,
+        read_db_url: str | None = None,
+        read_pool_size: int = 0,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -385,25 +427,43 @@ class Recorder(threading.Thread):
 
         self.entity_filter = entity_filter
         self.exclude_t = exclude_t
+        self.bulk_insert = bulk_insert
+        # Store last_changed as NULL when it equals last_updated
+        self.compact_states = compact_states
+        # Recent states kept in memory per entity to answer history queries
+        self.history_cache: HistoryCache | None = (
+            HistoryCache(history_cache_size) if history_cache_size else None
+        )
+        self.read_db_url = read_db_url
+        self.read_pool_size = read_pool_size
 
-        self._timechanges_seen = 0
         self._commits_without_expire = 0
-        self._keepalive_count = 0
-        self._old_states: dict[str, States] = {}
+        self._old_states: dict[str, States | OldState] = {}
+        self._state_attributes_ids: OrderedDict[str, int] = OrderedDict()
+        self._pending_state_attributes: dict[str, StateAttributes] = {}
         self._pending_expunge: list[States] = []
+        self._bulk_writer: BulkWriter | None = None
         self.event_session = None
         self.get_session = None
+        self.read_engine: Any = None
+        self.get_read_session = None
         self._completed_first_database_setup = None
         self._event_listener = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
         self._queue_watcher = None
+        self._commit_listener = None
+        self._keep_alive_listener = None
+        self._state_changed_listeners: list[Callable[[Event], None]] = []
 
         self.enabled = True
 
     def set_enable(self, enable):
         """Enable or disable recording events and states."""
         self.enabled = enable
+        if self.history_cache is not None:
+            # The states recorded while disabled are missing
+            self.history_cache.clear()
 
     @callback
     def async_initialize(self):
@@ -414,6 +474,25 @@ class Recorder(threading.Thread):
         self._queue_watcher = async_track_time_interval(
             self.hass, self._async_check_queue, timedelta(minutes=10)
         )
+        if self.commit_interval:
+            self._commit_listener = async_track_time_interval(
+                self.hass,
+                self._async_commit,
+                timedelta(seconds=self.commit_interval),
+            )
+        self._keep_alive_listener = async_track_time_interval(
+            self.hass, self._async_keep_alive, timedelta(seconds=KEEPALIVE_TIME)
+        )
+
+    @callback
+    def _async_commit(self, now):
+        """Queue a commit of the event session."""
+        self.queue.put(CommitTask())
+
+    @callback
+    def _async_keep_alive(self, now):
+        """Queue a keep alive of the database connection."""
+        self.queue.put(KeepAliveTask())
 
     @callback
     def _async_check_queue(self, *_):
@@ -437,6 +516,12 @@ class Recorder(threading.Thread):
         if self._queue_watcher:
             self._queue_watcher()
             self._queue_watcher = None
+        if self._commit_listener:
+            self._commit_listener()
+            self._commit_listener = None
+        if self._keep_alive_listener:
+            self._keep_alive_listener()
+            self._keep_alive_listener = None
         if self._event_listener:
             self._event_listener()
             self._event_listener = None
@@ -564,8 +649,8 @@ class Recorder(threading.Thread):
             self.queue.put(PerodicCleanupTask())
 
     @callback
-    def async_hourly_statistics(self, now):
-        """Trigger the hourly statistics run."""
+    def async_periodic_statistics(self, now):
+        """Trigger the 5-minute statistics run."""
         start = statistics.get_start_time()
         self.queue.put(StatisticsTask(start))
 
@@ -581,9 +666,12 @@ class Recorder(threading.Thread):
             self.hass, self.async_nightly_tasks, hour=4, minute=12, second=0
         )
 
-        # Compile hourly statistics every hour at *:12
+        # Compile short term statistics every 5 minutes
         async_track_time_change(
-            self.hass, self.async_hourly_statistics, minute=12, second=0
+            self.hass,
+            self.async_periodic_statistics,
+            minute=range(0, 60, 5),
+            second=10,
         )
 
     def run(self):
@@ -736,6 +824,8 @@ class Recorder(threading.Thread):
 
     def _run_purge_entities(self, entity_filter):
         """Purge entities from the database."""
+        if self.history_cache is not None:
+            self.history_cache.evict(entity_filter)
         if purge.purge_entity_data(self, entity_filter):
             return
         # Schedule a new purge task if this one didn't finish
@@ -751,10 +841,15 @@ class Recorder(threading.Thread):
     def _process_one_event(self, event):
         """Process one event."""
         if isinstance(event, PurgeTask):
+            # Commit first, pending states may use attributes the purge deletes
+            self._commit_event_session_or_retry()
             self._run_purge(event.purge_before, event.repack, event.apply_filter)
+            self._reset_bulk_writer()
             return
         if isinstance(event, PurgeEntitiesTask):
+            self._commit_event_session_or_retry()
             self._run_purge_entities(event.entity_filter)
+            self._reset_bulk_writer()
             return
         if isinstance(event, PerodicCleanupTask):
             perodic_db_cleanups(self)
@@ -765,21 +860,20 @@ class Recorder(threading.Thread):
         if isinstance(event, WaitTask):
             self._queue_watch.set()
             return
-        if event.event_type == EVENT_TIME_CHANGED:
-            self._keepalive_count += 1
-            if self._keepalive_count >= KEEPALIVE_TIME:
-                self._keepalive_count = 0
-                self._send_keep_alive()
-            if self.commit_interval:
-                self._timechanges_seen += 1
-                if self._timechanges_seen >= self.commit_interval:
-                    self._timechanges_seen = 0
-                    self._commit_event_session_or_retry()
+        if isinstance(event, CommitTask):
+            self._commit_event_session_or_retry()
+            return
+        if isinstance(event, KeepAliveTask):
+            self._send_keep_alive()
             return
 
         if not self.enabled:
             return
 
+        if self._bulk_writer is not None:
+            self._bulk_write_event(event)
+            return
+
         try:
             if event.event_type == EVENT_STATE_CHANGED:
                 dbevent = Events.from_event(event, event_data="{}")
@@ -793,14 +887,15 @@ class Recorder(threading.Thread):
 
         if event.event_type == EVENT_STATE_CHANGED:
             try:
-                dbstate = States.from_event(event)
+                dbstate = States.from_event(event, self.compact_states)
                 has_new_state = event.data.get("new_state")
-                if dbstate.entity_id in self._old_states:
-                    old_state = self._old_states.pop(dbstate.entity_id)
+                old_state = self._old_states.pop(dbstate.entity_id, None)
+                if old_state is not None:
                     if old_state.state_id:
                         dbstate.old_state_id = old_state.state_id
                     else:
                         dbstate.old_state = old_state
+                self._set_state_attributes(dbstate, old_state, event)
                 if not has_new_state:
                     dbstate.state = None
                 dbstate.event = dbevent
@@ -820,6 +915,168 @@ class Recorder(threading.Thread):
         if not self.commit_interval:
             self._commit_event_session_or_retry()
 
+    def _bulk_write_event(self, event):
+        """Queue the rows of an event for the next bulk insert."""
+        writer = self._bulk_writer
+        try:
+            if event.event_type == EVENT_STATE_CHANGED:
+                event_id = writer.add_event(event, event_data="{}")
+            else:
+                event_id = writer.add_event(event)
+        except (TypeError, ValueError):
+            _LOGGER.warning("Event is not JSON serializable: %s", event)
+            return
+
+        if event.event_type == EVENT_STATE_CHANGED:
+            new_state = event.data.get("new_state")
+            try:
+                attributes_id = self._bulk_state_attributes_id(event)
+            except (TypeError, ValueError):
+                _LOGGER.warning("State is not JSON serializable: %s", new_state)
+            else:
+                entity_id = event.data["entity_id"]
+                old_state = self._old_states.pop(entity_id, None)
+                state_id = writer.add_state(
+                    event,
+                    event_id,
+                    old_state.state_id if old_state is not None else None,
+                    attributes_id,
+                )
+                if new_state is not None:
+                    self._old_states[entity_id] = OldState(
+                        state_id, attributes_id, new_state.last_updated
+                    )
+
+        if not self.commit_interval:
+            self._commit_event_session_or_retry()
+
+    def _bulk_state_attributes_id(self, event):
+        """Return the attributes_id of a state, queueing unseen attributes."""
+        new_state = event.data.get("new_state")
+        old_native_state = event.data.get("old_state")
+        old_state = self._old_states.get(event.data["entity_id"])
+
+        # The attributes did not change since the previously recorded
+        # state of the entity, share them without serializing them again
+        if (
+            old_state is not None
+            and new_state is not None
+            and old_native_state is not None
+            and old_state.last_updated == old_native_state.last_updated
+            and old_native_state.attributes == new_state.attributes
+        ):
+            return old_state.attributes_id
+
+        shared_attrs = StateAttributes.shared_attrs_from_event(event)
+
+        # Matching attributes were recently used or are waiting to be written
+        if attributes_id := self._state_attributes_ids.get(shared_attrs):
+            self._state_attributes_ids.move_to_end(shared_attrs)
+            return attributes_id
+
+        attributes_hash = StateAttributes.hash_shared_attrs(shared_attrs)
+        attributes = (
+            self.event_session.query(StateAttributes.attributes_id)
+            .filter(StateAttributes.hash == attributes_hash)
+            .filter(StateAttributes.shared_attrs == shared_attrs)
+            .first()
+        )
+        if attributes:
+            attributes_id = attributes[0]
+        else:
+            attributes_id = self._bulk_writer.add_state_attributes(
+                shared_attrs, attributes_hash
+            )
+        self._cache_state_attributes_id(shared_attrs, attributes_id)
+        return attributes_id
+
+    def _set_state_attributes(self, dbstate, old_state, event):
+        """Link the state to shared attributes, only inserting unseen ones."""
+        new_state = event.data.get("new_state")
+        old_native_state = event.data.get("old_state")
+
+        # The attributes did not change since the previously recorded
+        # state of the entity, share them without serializing them again
+        if (
+            old_state is not None
+            and new_state is not None
+            and old_native_state is not None
+            and old_state.last_updated == old_native_state.last_updated
+            and old_native_state.attributes == new_state.attributes
+        ):
+            if old_state.attributes_id:
+                dbstate.attributes_id = old_state.attributes_id
+                return
+            if old_state.state_attributes is not None:
+                dbstate.state_attributes = old_state.state_attributes
+                return
+
+        shared_attrs = StateAttributes.shared_attrs_from_event(event)
+
+        # Matching attributes are waiting for the next commit
+        if pending_attributes := self._pending_state_attributes.get(shared_attrs):
+            dbstate.state_attributes = pending_attributes
+            return
+
+        # Matching attributes were recently used
+        if attributes_id := self._state_attributes_ids.get(shared_attrs):
+            self._state_attributes_ids.move_to_end(shared_attrs)
+            dbstate.attributes_id = attributes_id
+            return
+
+        attributes_hash = StateAttributes.hash_shared_attrs(shared_attrs)
+        with self.event_session.no_autoflush:
+            attributes = (
+                self.event_session.query(StateAttributes.attributes_id)
+                .filter(StateAttributes.hash == attributes_hash)
+                .filter(StateAttributes.shared_attrs == shared_attrs)
+                .first()
+            )
+        # Matching attributes found in the database
+        if attributes:
+            dbstate.attributes_id = attributes[0]
+            self._cache_state_attributes_id(shared_attrs, attributes[0])
+            return
+
+        # No matching attributes found, insert them with the next commit
+        dbstate_attributes = StateAttributes(
+            shared_attrs=shared_attrs, hash=attributes_hash
+        )
+        dbstate.state_attributes = dbstate_attributes
+        self._pending_state_attributes[shared_attrs] = dbstate_attributes
+        self.event_session.add(dbstate_attributes)
+
+    def _cache_state_attributes_id(self, shared_attrs, attributes_id):
+        """Remember the id of recently used attributes."""
+        self._state_attributes_ids[shared_attrs] = attributes_id
+        self._state_attributes_ids.move_to_end(shared_attrs)
+        if len(self._state_attributes_ids) > STATE_ATTRIBUTES_ID_CACHE_SIZE:
+            self._state_attributes_ids.popitem(last=False)
+
+    def _evict_purged_state_attributes(self, attributes_ids):
+        """Forget attributes that were deleted by a purge."""
+        for shared_attrs, attributes_id in list(self._state_attributes_ids.items()):
+            if attributes_id in attributes_ids:
+                del self._state_attributes_ids[shared_attrs]
+
+    def _evict_purged_states(self, state_ids):
+        """Forget the last states of entities that were deleted by a purge."""
+        for entity_id, old_state in list(self._old_states.items()):
+            if old_state.state_id in state_ids:
+                del self._old_states[entity_id]
+
+    def _shift_bulk_ids(self, _event_shift, state_shift, attributes_shift):
+        """Follow pending rows the bulk writer moved above another writer."""
+        for entity_id, old_state in self._old_states.items():
+            self._old_states[entity_id] = old_state._replace(
+                state_id=state_shift.apply(old_state.state_id),
+                attributes_id=attributes_shift.apply(old_state.attributes_id),
+            )
+        for shared_attrs, attributes_id in self._state_attributes_ids.items():
+            self._state_attributes_ids[shared_attrs] = attributes_shift.apply(
+                attributes_id
+            )
+
     def _handle_database_error(self, err):
         """Handle a database error that may result in moving away the corrupt db."""
         if isinstance(err.__cause__, sqlite3.DatabaseError):
@@ -832,7 +1089,11 @@ class Recorder(threading.Thread):
 
     def _commit_event_session_or_retry(self):
         """Commit the event session if there is work to do."""
-        if not self.event_session.new and not self.event_session.dirty:
+        if (
+            not self.event_session.new
+            and not self.event_session.dirty
+            and not self._bulk_writer
+        ):
             return
         tries = 1
         while tries <= self.db_max_retries:
@@ -863,7 +1124,20 @@ class Recorder(threading.Thread):
                 if dbstate in self.event_session:
                     self.event_session.expunge(dbstate)
             self._pending_expunge = []
+        if self._bulk_writer and (
+            shifts := self._bulk_writer.write(self.event_session)
+        ):
+            self._shift_bulk_ids(*shifts)
         self.event_session.commit()
+        if self._bulk_writer is not None:
+            self._bulk_writer.clear()
+
+        # The pending attributes now have an id
+        for shared_attrs, dbstate_attributes in self._pending_state_attributes.items():
+            self._cache_state_attributes_id(
+                shared_attrs, dbstate_attributes.attributes_id
+            )
+        self._pending_state_attributes = {}
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -883,6 +1157,8 @@ class Recorder(threading.Thread):
     def _close_event_session(self):
         """Close the event session."""
         self._old_states = {}
+        self._state_attributes_ids.clear()
+        self._pending_state_attributes = {}
 
         if not self.event_session:
             return
@@ -904,16 +1180,32 @@ class Recorder(threading.Thread):
         """Open the event session."""
         self.event_session = self.get_session()
         self.event_session.expire_on_commit = False
+        self._reset_bulk_writer()
+
+    def _reset_bulk_writer(self):
+        """Continue the bulk writer from the ids in the database."""
+        if self._bulk_writer is not None:
+            self._bulk_writer.reset(self.event_session)
 
     def _send_keep_alive(self):
         """Send a keep alive to keep the db connection open."""
         _LOGGER.debug("Sending keepalive")
         self.event_session.connection().scalar(select([1]))
 
+    @callback
+    def async_add_state_changed_listener(self, listener):
+        """Add a listener for the state_changed events that are recorded."""
+        self._state_changed_listeners.append(listener)
+
     @callback
     def event_listener(self, event):
         """Listen for new events and put them in the process queue."""
         self.queue.put(event)
+        if self.enabled and event.event_type == EVENT_STATE_CHANGED:
+            if self.history_cache is not None:
+                self.history_cache.async_add(event)
+            for listener in self._state_changed_listeners:
+                listener(event)
 
     def block_till_done(self):
         """Block till all events processed.
@@ -962,9 +1254,70 @@ class Recorder(threading.Thread):
         sqlalchemy_event.listen(self.engine, "connect", setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
+        self._setup_bulk_writer()
         self.get_session = scoped_session(sessionmaker(bind=self.engine))
+        self._setup_read_connection()
         _LOGGER.debug("Connected to recorder database")
 
+    def _setup_read_connection(self):
+        """Set up the read only pool used by queries outside the recorder thread.
+
+        SQLite databases in WAL mode are read through connections opened
+        read only, other databases can be read from a replica.
+        """
+        self.read_engine = None
+        self.get_read_session = None
+        if not self.read_pool_size:
+            return
+
+        kwargs: dict[str, Any] = {
+            "poolclass": ReadOnlyPool,
+            "pool_size": self.read_pool_size,
+            "max_overflow": 0,
+        }
+        if self.read_db_url:
+            read_db_url = self.read_db_url
+        elif self._using_file_sqlite:
+            database_uri = Path(os.path.realpath(dburl_to_path(self.db_url))).as_uri()
+            read_db_url = SQLITE_URL_PREFIX
+            kwargs["creator"] = partial(
+                sqlite3.connect,
+                f"{database_uri}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+            )
+        elif self.db_url.startswith(SQLITE_URL_PREFIX):
+            # An in memory database cannot be shared between connections
+            return
+        else:
+            read_db_url = self.db_url
+
+        self.read_engine = create_engine(read_db_url, **kwargs)
+
+        def setup_read_connection(dbapi_connection, connection_record):
+            """Dbapi specific connection settings."""
+            setup_connection_for_dialect(
+                self.read_engine.dialect.name, dbapi_connection, False
+            )
+
+        sqlalchemy_event.listen(self.read_engine, "connect", setup_read_connection)
+        self.get_read_session = scoped_session(sessionmaker(bind=self.read_engine))
+
+    def _setup_bulk_writer(self):
+        """Set up the bulk insert write path if enabled and supported."""
+        self._bulk_writer = None
+        if not self.bulk_insert:
+            return
+        dialect_name = self.engine.dialect.name
+        if dialect_name not in BULK_INSERT_DIALECTS:
+            _LOGGER.warning(
+                "Bulk insert is not supported with the %s database engine, "
+                "falling back to the default write path",
+                dialect_name,
+            )
+            return
+        self._bulk_writer = BulkWriter(dialect_name, self.compact_states)
+
     @property
     def _using_file_sqlite(self):
         """Short version to check if we are using sqlite3 as a file."""
@@ -977,6 +1330,10 @@ class Recorder(threading.Thread):
         self.engine.dispose()
         self.engine = None
         self.get_session = None
+        if self.read_engine is not None:
+            self.read_engine.dispose()
+            self.read_engine = None
+            self.get_read_session = None
 
     def _setup_run(self):
         """Log the start of the current run and schedule any needed jobs."""
@@ -994,20 +1351,21 @@ class Recorder(threading.Thread):
     def _schedule_compile_missing_statistics(self, session: Session) -> None:
         """Add tasks for missing statistics runs."""
         now = dt_util.utcnow()
-        last_hour = now.replace(minute=0, second=0, microsecond=0)
+        last_period_minutes = now.minute - now.minute % 5
+        last_period = now.replace(minute=last_period_minutes, second=0, microsecond=0)
         start = now - timedelta(days=self.keep_days)
         start = start.replace(minute=0, second=0, microsecond=0)
 
         # Find the newest statistics run, if any
         if last_run := session.query(func.max(StatisticsRuns.start)).scalar():
-            start = max(start, process_timestamp(last_run) + timedelta(hours=1))
+            start = max(start, process_timestamp(last_run) + timedelta(minutes=5))
 
         # Add tasks
-        while start < last_hour:
-            end = start + timedelta(hours=1)
+        while start < last_period:
+            end = start + timedelta(minutes=5)
             _LOGGER.debug("Compiling missing statistics for %s-%s", start, end)
             self.queue.put(StatisticsTask(start))
-            start = start + timedelta(hours=1)
+            start = end
 
     def _end_session(self):
         """End the recorder session."""
@@ -10,7 +10,10 @@ from sqlalchemy import and_, bindparam, func
 from sqlalchemy.ext import baked
 
 from homeassistant.components import recorder
+from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
+    STATE_CHANGED,
+    StateAttributes,
     States,
     process_timestamp_to_utc_isoformat,
 )
@@ -47,7 +50,8 @@ QUERY_STATES = [
     States.domain,
     States.entity_id,
     States.state,
-    States.attributes,
+    # Rows recorded before schema 21 keep their attributes in the row
+    func.coalesce(StateAttributes.shared_attrs, States.attributes).label("attributes"),
     States.last_changed,
     States.last_updated,
 ]
@@ -60,6 +64,13 @@ def async_setup(hass):
     hass.data[HISTORY_BAKERY] = baked.bakery()
 
 
+def _query_states(session):
+    """Query the state columns joined with their shared attributes."""
+    return session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
+
+
 def get_significant_states(hass, *args, **kwargs):
     """Wrap _get_significant_states with a sql session."""
     with session_scope(hass=hass) as session:
@@ -86,16 +97,68 @@ def _get_significant_states(
     """
     timer_start = time.perf_counter()
 
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
+    history_cache = hass.data[DATA_INSTANCE].history_cache
+    if (
+        history_cache is not None
+        and entity_ids is not None
+        and (
+            cached := history_cache.get_states_during_period(
+                start_time, end_time, entity_ids, significant_changes_only
+            )
+        )
+        is not None
+    ):
+        start_time_states, states = cached
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            elapsed = time.perf_counter() - timer_start
+            _LOGGER.debug("get_significant_states from cache took %fs", elapsed)
+        return _sorted_states_to_dict(
+            hass,
+            session,
+            states,
+            start_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            minimal_response,
+            [LazyState(row) for row in start_time_states],
+        )
+
+    baked_query = _significant_states_query(
+        hass, entity_ids, filters, end_time, significant_changes_only
+    )
+
+    states = execute(
+        baked_query(session).params(
+            start_time=start_time, end_time=end_time, entity_ids=entity_ids
+        )
+    )
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_significant_states took %fs", elapsed)
+
+    return _sorted_states_to_dict(
+        hass,
+        session,
+        states,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        minimal_response,
     )
 
+
+def _significant_states_query(
+    hass, entity_ids, filters, end_time, significant_changes_only
+):
+    """Bake the query of the significant states ordered by entity_id."""
+    baked_query = hass.data[HISTORY_BAKERY](_query_states)
+
     if significant_changes_only:
         baked_query += lambda q: q.filter(
-            (
-                States.domain.in_(SIGNIFICANT_DOMAINS)
-                | (States.last_changed == States.last_updated)
-            )
+            (States.domain.in_(SIGNIFICANT_DOMAINS) | STATE_CHANGED)
             & (States.last_updated > bindparam("start_time"))
         )
     else:
@@ -115,38 +178,79 @@ def _get_significant_states(
 
     baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
 
-    states = execute(
-        baked_query(session).params(
-            start_time=start_time, end_time=end_time, entity_ids=entity_ids
-        )
-    )
+    return baked_query
 
-    if _LOGGER.isEnabledFor(logging.DEBUG):
-        elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("get_significant_states took %fs", elapsed)
 
-    return _sorted_states_to_dict(
-        hass,
-        session,
-        states,
-        start_time,
-        entity_ids,
-        filters,
-        include_start_time_state,
-        minimal_response,
+def _iter_significant_states(
+    hass,
+    session,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+    significant_changes_only=True,
+    minimal_response=False,
+):
+    """Yield the significant states of one entity at a time.
+
+    Like _get_significant_states but yields (entity_id, states) instead of
+    building a dict, so only the states of one entity are held in memory.
+    Given entity_ids are queried one by one in their order, otherwise the
+    states of all entities are read in batches in entity_id order.
+    """
+    if entity_ids is not None:
+        for entity_id in entity_ids:
+            yield from _get_significant_states(
+                hass,
+                session,
+                start_time,
+                end_time,
+                [entity_id],
+                filters,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+            ).items()
+        return
+
+    start_time_states = {}
+    if include_start_time_state:
+        run = recorder.run_information_from_instance(hass, start_time)
+        for state in _get_states_with_session(
+            hass, session, start_time, None, run=run, filters=filters
+        ):
+            state.last_changed = start_time
+            state.last_updated = start_time
+            start_time_states[state.entity_id] = state
+
+    baked_query = _significant_states_query(
+        hass, None, filters, end_time, significant_changes_only
+    )
+    states = (
+        baked_query(session)
+        .params(start_time=start_time, end_time=end_time)
+        .with_post_criteria(lambda q: q.yield_per(1000))
     )
+    for ent_id, group in groupby(states, lambda state: state.entity_id):
+        ent_results = []
+        if (start_time_state := start_time_states.pop(ent_id, None)) is not None:
+            ent_results.append(start_time_state)
+        _extend_entity_states(ent_results, ent_id, group, minimal_response)
+        yield ent_id, ent_results
+
+    # Entities without changes during the period
+    for ent_id in sorted(start_time_states):
+        yield ent_id, [start_time_states[ent_id]]
 
 
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
-    with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+    with session_scope(hass=hass, read_only=True) as session:
+        baked_query = hass.data[HISTORY_BAKERY](_query_states)
 
         baked_query += lambda q: q.filter(
-            (States.last_changed == States.last_updated)
-            & (States.last_updated > bindparam("start_time"))
+            STATE_CHANGED & (States.last_updated > bindparam("start_time"))
         )
 
         if end_time is not None:
@@ -155,7 +259,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -175,14 +281,14 @@ def get_last_state_changes(hass, number_of_states, entity_id):
     """Return the last number_of_states."""
     start_time = dt_util.utcnow()
 
-    with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
-        baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
+    with session_scope(hass=hass, read_only=True) as session:
+        baked_query = hass.data[HISTORY_BAKERY](_query_states)
+        baked_query += lambda q: q.filter(STATE_CHANGED)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -218,7 +324,7 @@ def get_states(hass, utc_point_in_time, entity_ids=None, run=None, filters=None)
         if run is None:
             return []
 
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         return _get_states_with_session(
             hass, session, utc_point_in_time, entity_ids, run, filters
         )
@@ -243,7 +349,7 @@ def _get_states_with_session(
     # We have more than one entity to look at (most commonly we want
     # all entities,) so we need to do a search on all states since the
     # last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = _query_states(session)
 
     most_recent_states_by_date = session.query(
         States.entity_id.label("max_entity_id"),
@@ -291,9 +397,7 @@ def _get_states_with_session(
 def _get_single_entity_states_with_session(hass, session, utc_point_in_time, entity_id):
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](_query_states)
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
         States.entity_id == bindparam("entity_id"),
@@ -317,6 +421,7 @@ def _sorted_states_to_dict(
     filters=None,
     include_start_time_state=True,
     minimal_response=False,
+    start_time_states=None,
 ):
     """Convert SQL results into JSON friendly data structure.
 
@@ -327,7 +432,7 @@ def _sorted_states_to_dict(
 
     We also need to go back and create a synthetic zero data point for
     each list of states, otherwise our graphs won't start on the Y
-    axis correctly.
+    axis correctly. They are queried unless start_time_states are given.
     """
     result = defaultdict(list)
     # Set all entity IDs to empty lists in result set to maintain the order
@@ -338,10 +443,12 @@ def _sorted_states_to_dict(
     # Get the states at the start time
     timer_start = time.perf_counter()
     if include_start_time_state:
-        run = recorder.run_information_from_instance(hass, start_time)
-        for state in _get_states_with_session(
-            hass, session, start_time, entity_ids, run=run, filters=filters
-        ):
+        if start_time_states is None:
+            run = recorder.run_information_from_instance(hass, start_time)
+            start_time_states = _get_states_with_session(
+                hass, session, start_time, entity_ids, run=run, filters=filters
+            )
+        for state in start_time_states:
             state.last_changed = start_time
             state.last_updated = start_time
             result[state.entity_id].append(state)
@@ -350,53 +457,53 @@ def _sorted_states_to_dict(
         elapsed = time.perf_counter() - timer_start
         _LOGGER.debug("getting %d first datapoints took %fs", len(result), elapsed)
 
-    # Called in a tight loop so cache the function
-    # here
-    _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
-
     # Append all changes to it
     for ent_id, group in groupby(states, lambda state: state.entity_id):
-        domain = split_entity_id(ent_id)[0]
-        ent_results = result[ent_id]
-        if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
-            ent_results.extend(LazyState(db_state) for db_state in group)
-
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
-            ent_results.append(LazyState(next(group)))
-
-        prev_state = ent_results[-1]
-        initial_state_count = len(ent_results)
-
-        for db_state in group:
-            # With minimal response we do not care about attribute
-            # changes so we can filter out duplicate states
-            if db_state.state == prev_state.state:
-                continue
-
-            ent_results.append(
-                {
-                    STATE_KEY: db_state.state,
-                    LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
-                        db_state.last_changed
-                    ),
-                }
-            )
-            prev_state = db_state
-
-        if prev_state and len(ent_results) != initial_state_count:
-            # There was at least one state change
-            # replace the last minimal state with
-            # a full state
-            ent_results[-1] = LazyState(prev_state)
+        _extend_entity_states(result[ent_id], ent_id, group, minimal_response)
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
 
 
+def _extend_entity_states(ent_results, ent_id, group, minimal_response):
+    """Append the states of a group of rows of one entity to its results."""
+    domain = split_entity_id(ent_id)[0]
+    if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
+        ent_results.extend(LazyState(db_state) for db_state in group)
+
+    # With minimal response we only provide a native
+    # State for the first and last response. All the states
+    # in-between only provide the "state" and the
+    # "last_changed".
+    if not ent_results:
+        ent_results.append(LazyState(next(group)))
+
+    prev_state = ent_results[-1]
+    initial_state_count = len(ent_results)
+
+    for db_state in group:
+        # With minimal response we do not care about attribute
+        # changes so we can filter out duplicate states
+        if db_state.state == prev_state.state:
+            continue
+
+        ent_results.append(
+            {
+                STATE_KEY: db_state.state,
+                LAST_CHANGED_KEY: process_timestamp_to_utc_isoformat(
+                    db_state.last_changed or db_state.last_updated
+                ),
+            }
+        )
+        prev_state = db_state
+
+    if prev_state and len(ent_results) != initial_state_count:
+        # There was at least one state change
+        # replace the last minimal state with
+        # a full state
+        ent_results[-1] = LazyState(prev_state)
+
+
 def get_state(hass, utc_point_in_time, entity_id, run=None):
     """Return a state at a specific point in time."""
     states = get_states(hass, utc_point_in_time, (entity_id,), run)
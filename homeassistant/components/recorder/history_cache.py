@@ -0,0 +1,294 @@
+"""In-memory cache of the recent history of entities."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta
+import sys
+import threading
+from typing import NamedTuple
+
+from homeassistant.core import Event, State, split_entity_id
+import homeassistant.util.dt as dt_util
+
+from .history import SIGNIFICANT_DOMAINS
+from .models import database_json_dumps
+
+# States are only kept for this long
+MAX_AGE = timedelta(days=1)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_util.UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class CachedRow(NamedTuple):
+    """A cached state in the shape of a history query row."""
+
+    domain: str
+    entity_id: str
+    state: str
+    attributes: str
+    last_changed: datetime
+    last_updated: datetime
+
+
+def _timestamp(point_in_time: datetime) -> int:
+    """Return the UTC timestamp in whole microseconds."""
+    return (dt_util.as_utc(point_in_time) - _EPOCH) // _MICROSECOND
+
+
+def _attributes_json(state: State) -> str:
+    """Return the attributes the recorder stores for a state."""
+    try:
+        return state.attributes_json()
+    except ValueError:
+        return database_json_dumps(dict(state.attributes))
+
+
+class _EntityHistory:
+    """The recent states of an entity ordered by last_updated.
+
+    Only what a history row needs is kept, in parallel arrays: the
+    timestamps and the state and attributes strings, with consecutive
+    states sharing the attributes string when it did not change.
+    """
+
+    __slots__ = ("last_updated", "last_changed", "states", "attributes")
+
+    def __init__(self) -> None:
+        """Initialize the entity history."""
+        self.last_updated = array("q")
+        self.last_changed = array("q")
+        self.states: list[str] = []
+        self.attributes: list[str] = []
+
+    def __len__(self) -> int:
+        """Return the number of cached states."""
+        return len(self.states)
+
+    def append(self, state: State, attributes: str) -> None:
+        """Append a state."""
+        last_updated = _timestamp(state.last_updated)
+        if self.last_updated and last_updated < self.last_updated[-1]:
+            # Out of order, we can no longer tell what happened before
+            self.trim(len(self))
+        if self.attributes and self.attributes[-1] == attributes:
+            attributes = self.attributes[-1]
+        self.last_updated.append(last_updated)
+        self.last_changed.append(_timestamp(state.last_changed))
+        self.states.append(state.state)
+        self.attributes.append(attributes)
+
+    def trim(self, count: int) -> None:
+        """Drop the count oldest states."""
+        del self.last_updated[:count]
+        del self.last_changed[:count]
+        del self.states[:count]
+        del self.attributes[:count]
+
+    def trim_before(self, oldest: int) -> int:
+        """Drop the states before oldest and return how many were dropped.
+
+        The last state before the oldest point is kept as the state at
+        that point.
+        """
+        if len(self.last_updated) < 2 or self.last_updated[1] >= oldest:
+            return 0
+        count = bisect_left(self.last_updated, oldest) - 1
+        self.trim(count)
+        return count
+
+    def row(self, domain: str, entity_id: str, index: int) -> CachedRow:
+        """Return the state at index as a history row."""
+        return CachedRow(
+            domain,
+            entity_id,
+            self.states[index],
+            self.attributes[index],
+            _EPOCH + self.last_changed[index] * _MICROSECOND,
+            _EPOCH + self.last_updated[index] * _MICROSECOND,
+        )
+
+    def memory(self) -> int:
+        """Return an estimate of the memory used by the cached states."""
+        shared: set[int] = set()
+        size = sum(
+            sys.getsizeof(buffer)
+            for buffer in (
+                self.last_updated,
+                self.last_changed,
+                self.states,
+                self.attributes,
+            )
+        )
+        for value in (*self.states, *self.attributes):
+            if id(value) not in shared:
+                shared.add(id(value))
+                size += sys.getsizeof(value)
+        return size
+
+
+class HistoryCacheStats(NamedTuple):
+    """Diagnostics of the history cache."""
+
+    entities: int
+    states: int
+    hits: int
+    misses: int
+    memory: int
+
+
+class HistoryCache:
+    """Keep the recent states of entities to answer history queries in memory.
+
+    The states are fed from the state_changed events the recorder
+    records. At most max_states states are kept over all entities, when
+    there are more the entities with the most states lose their oldest
+    states first. A query can only be answered when, for every entity,
+    the state at the start of the period is still cached, otherwise the
+    caller has to fall back to the database.
+    """
+
+    def __init__(self, max_states: int) -> None:
+        """Initialize the cache."""
+        self.max_states = max_states
+        self.hits = 0
+        self.misses = 0
+        self._entities: dict[str, _EntityHistory] = {}
+        self._states = 0
+        self._lock = threading.Lock()
+
+    def async_add(self, event: Event) -> None:
+        """Add the new state of a state_changed event."""
+        entity_id = event.data["entity_id"]
+        new_state: State | None = event.data.get("new_state")
+        old_state: State | None = event.data.get("old_state")
+        try:
+            attributes = None if new_state is None else _attributes_json(new_state)
+            old_attributes = (
+                None
+                if old_state is None or entity_id in self._entities
+                else _attributes_json(old_state)
+            )
+        except TypeError:
+            # Not serializable, so it is not recorded either
+            attributes = None
+        with self._lock:
+            if attributes is None:
+                self._remove(entity_id)
+                return
+            assert new_state is not None
+            if (history := self._entities.get(entity_id)) is None:
+                history = self._entities[entity_id] = _EntityHistory()
+                if old_attributes is not None:
+                    assert old_state is not None
+                    history.append(old_state, old_attributes)
+            self._states -= len(history)
+            history.append(new_state, attributes)
+            history.trim_before(_timestamp(event.time_fired - MAX_AGE))
+            self._states += len(history)
+
+            # Trim in batches so adding stays cheap
+            if self._states > self.max_states + self.max_states // 4:
+                self._trim()
+
+    def _remove(self, entity_id: str) -> None:
+        """Forget the states of an entity."""
+        if (history := self._entities.pop(entity_id, None)) is not None:
+            self._states -= len(history)
+
+    def _trim(self) -> None:
+        """Drop the oldest states of the largest entities to fit max_states."""
+        sizes = sorted(len(history) for history in self._entities.values())
+        # Find the most states every entity can keep within the budget
+        cap = self.max_states
+        budget = self.max_states
+        for idx, size in enumerate(sizes):
+            if size * (len(sizes) - idx) > budget:
+                cap = max(budget // (len(sizes) - idx), 1)
+                break
+            budget -= size
+        for history in self._entities.values():
+            if (count := len(history) - cap) > 0:
+                history.trim(count)
+                self._states -= count
+
+    def clear(self) -> None:
+        """Forget all cached states."""
+        with self._lock:
+            self._entities = {}
+            self._states = 0
+
+    def evict(self, entity_filter: Callable[[str], bool]) -> None:
+        """Forget the states of entities matching the filter."""
+        with self._lock:
+            for entity_id in [
+                entity_id for entity_id in self._entities if entity_filter(entity_id)
+            ]:
+                self._remove(entity_id)
+
+    def get_states_during_period(
+        self,
+        start_time: datetime,
+        end_time: datetime | None,
+        entity_ids: Iterable[str],
+        significant_changes_only: bool,
+    ) -> tuple[list[CachedRow], list[CachedRow]] | None:
+        """Return the states at start_time and the changes during the period.
+
+        The changes are sorted by entity_id and last_updated like the
+        rows of the database query. Returns None when the cache does not
+        cover the period.
+        """
+        start = _timestamp(start_time)
+        end = None if end_time is None else _timestamp(end_time)
+        start_time_states: list[CachedRow] = []
+        changes: list[CachedRow] = []
+
+        with self._lock:
+            for entity_id in sorted(set(entity_ids)):
+                history = self._entities.get(entity_id)
+                # The state at start_time must be known
+                if (
+                    history is None
+                    or (index := bisect_left(history.last_updated, start)) == 0
+                ):
+                    self.misses += 1
+                    return None
+                end_index = (
+                    len(history)
+                    if end is None
+                    else bisect_left(history.last_updated, end)
+                )
+                domain = split_entity_id(entity_id)[0]
+                significant_domain = domain in SIGNIFICANT_DOMAINS
+                start_time_states.append(history.row(domain, entity_id, index - 1))
+                changes.extend(
+                    history.row(domain, entity_id, idx)
+                    for idx in range(index, end_index)
+                    # States updated exactly at start_time are not part
+                    # of the period, like in the database query
+                    if history.last_updated[idx] != start
+                    and (
+                        not significant_changes_only
+                        or significant_domain
+                        or history.last_changed[idx] == history.last_updated[idx]
+                    )
+                )
+            self.hits += 1
+
+        return start_time_states, changes
+
+    def stats(self) -> HistoryCacheStats:
+        """Return diagnostics of the cache.
+
+        The memory is an estimate of the buffers and the strings they keep.
+        """
+        with self._lock:
+            histories = list(self._entities.values())
+            states = self._states
+        memory = sys.getsizeof(self._entities) + sum(
+            history.memory() for history in histories
+        )
+        return HistoryCacheStats(len(histories), states, self.hits, self.misses, memory)
@@ -3,7 +3,7 @@ from datetime import timedelta
 import logging
 
 import sqlalchemy
-from sqlalchemy import ForeignKeyConstraint, MetaData, Table, text
+from sqlalchemy import ForeignKeyConstraint, MetaData, Table, func, text
 from sqlalchemy.exc import (
     InternalError,
     OperationalError,
@@ -12,6 +12,7 @@ from sqlalchemy.exc import (
 )
 from sqlalchemy.schema import AddConstraint, DropConstraint
 
+from homeassistant.const import MAX_LENGTH_STATE_ENTITY_ID
 import homeassistant.util.dt as dt_util
 
 from .models import (
@@ -22,7 +23,10 @@ from .models import (
     Statistics,
     StatisticsMeta,
     StatisticsRuns,
+    StatisticsShortTerm,
+    process_timestamp,
 )
+from .statistics import get_start_time
 from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
@@ -467,17 +471,21 @@ def _apply_update(engine, session, new_version, old_version):  # noqa: C901
     elif new_version == 18:
         # Recreate the statistics and statistics meta tables.
         #
-        # Order matters! Statistics has a relation with StatisticsMeta,
-        # so statistics need to be deleted before meta (or in pair depending
-        # on the SQL backend); and meta needs to be created before statistics.
-        if sqlalchemy.inspect(engine).has_table(
-            StatisticsMeta.__tablename__
-        ) or sqlalchemy.inspect(engine).has_table(Statistics.__tablename__):
-            Base.metadata.drop_all(
-                bind=engine, tables=[Statistics.__table__, StatisticsMeta.__table__]
-            )
+        # Order matters! Statistics and StatisticsShortTerm have a relation with
+        # StatisticsMeta, so statistics need to be deleted before meta (or in pair
+        # depending on the SQL backend); and meta needs to be created before
+        # statistics.
+        Base.metadata.drop_all(
+            bind=engine,
+            tables=[
+                StatisticsShortTerm.__table__,
+                Statistics.__table__,
+                StatisticsMeta.__table__,
+            ],
+        )
 
         StatisticsMeta.__table__.create(engine)
+        StatisticsShortTerm.__table__.create(engine)
         Statistics.__table__.create(engine)
     elif new_version == 19:
         # This adds the statistic runs table, insert a fake run to prevent duplicating
@@ -501,6 +509,54 @@ def _apply_update(engine, session, new_version, old_version):  # noqa: C901
                     "sum DOUBLE PRECISION",
                 ],
             )
+    elif new_version == 21:
+        # The state_attributes table is created by create_all, new states
+        # share their attributes through it, existing states keep theirs
+        _add_columns(connection, "states", ["attributes_id INTEGER"])
+        _create_index(connection, "states", "ix_states_attributes_id")
+    elif new_version == 22:
+        # The statistics_short_term table is created by create_all, hourly
+        # statistics are now rolled up from it.
+        #
+        # Block 5-minute statistics for the rest of the hour of the last run,
+        # they would otherwise overlap with the existing hourly statistics.
+        if session.query(Statistics.id).count() and (
+            last_run_string := session.query(func.max(StatisticsRuns.start)).scalar()
+        ):
+            last_run_start_time = process_timestamp(last_run_string)
+            fake_start_time = last_run_start_time + timedelta(minutes=5)
+            while fake_start_time < last_run_start_time + timedelta(hours=1):
+                session.add(StatisticsRuns(start=fake_start_time))
+                fake_start_time += timedelta(minutes=5)
+
+        # Copy the last hourly statistic of sums to the 5-minute statistics
+        # table, the next 5-minute sums continue from there
+        sum_metadata_ids = session.query(StatisticsMeta.id).filter(
+            StatisticsMeta.has_sum.isnot(False)
+        )
+        for (metadata_id,) in sum_metadata_ids:
+            last_statistic = (
+                session.query(Statistics)
+                .filter_by(metadata_id=metadata_id)
+                .order_by(Statistics.start.desc())
+                .first()
+            )
+            if last_statistic:
+                session.add(
+                    StatisticsShortTerm(
+                        metadata_id=last_statistic.metadata_id,
+                        start=last_statistic.start,
+                        last_reset=last_statistic.last_reset,
+                        state=last_statistic.state,
+                        sum=last_statistic.sum,
+                    )
+                )
+    elif new_version == 23:
+        # Events recorded before this version are matched by their event_data
+        _add_columns(
+            connection, "events", [f"entity_id VARCHAR({MAX_LENGTH_STATE_ENTITY_ID})"]
+        )
+        _create_index(connection, "events", "ix_events_entity_id_time_fired")
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
@@ -520,10 +576,7 @@ def _inspect_schema_version(engine, session):
     for index in indexes:
         if index["column_names"] == ["time_fired"]:
             # Schema addition from version 1 detected. New DB.
-            now = dt_util.utcnow()
-            start = now.replace(minute=0, second=0, microsecond=0)
-            start = start - timedelta(hours=1)
-            session.add(StatisticsRuns(start=start))
+            session.add(StatisticsRuns(start=get_start_time()))
             session.add(SchemaChanges(schema_version=SCHEMA_VERSION))
             return SCHEMA_VERSION
 
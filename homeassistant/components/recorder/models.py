@@ -1,12 +1,14 @@
 """Models for SQLAlchemy."""
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
 import logging
-from typing import TypedDict
+from typing import Any, TypedDict
+import zlib
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -18,12 +20,16 @@ from sqlalchemy import (
     String,
     Text,
     distinct,
+    or_,
 )
 from sqlalchemy.dialects import mysql, oracle, postgresql
+from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.orm.session import Session
 
 from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    EVENT_STATE_CHANGED,
     MAX_LENGTH_EVENT_CONTEXT_ID,
     MAX_LENGTH_EVENT_EVENT_TYPE,
     MAX_LENGTH_EVENT_ORIGIN,
@@ -32,14 +38,14 @@ from homeassistant.const import (
     MAX_LENGTH_STATE_STATE,
 )
 from homeassistant.core import Context, Event, EventOrigin, State, split_entity_id
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import json_dumps
 import homeassistant.util.dt as dt_util
 
 # SQLAlchemy Schema
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 20
+SCHEMA_VERSION = 23
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -47,20 +53,24 @@ DB_TIMEZONE = "+00:00"
 
 TABLE_EVENTS = "events"
 TABLE_STATES = "states"
+TABLE_STATE_ATTRIBUTES = "state_attributes"
 TABLE_RECORDER_RUNS = "recorder_runs"
 TABLE_SCHEMA_CHANGES = "schema_changes"
 TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
+TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
 
 ALL_TABLES = [
     TABLE_STATES,
+    TABLE_STATE_ATTRIBUTES,
     TABLE_EVENTS,
     TABLE_RECORDER_RUNS,
     TABLE_SCHEMA_CHANGES,
     TABLE_STATISTICS,
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
+    TABLE_STATISTICS_SHORT_TERM,
 ]
 
 DATETIME_TYPE = DateTime(timezone=True).with_variant(
@@ -81,6 +91,8 @@ class Events(Base):  # type: ignore
         # Used for fetching events at a specific time
         # see logbook
         Index("ix_events_event_type_time_fired", "event_type", "time_fired"),
+        # Used for fetching the events of an entity, see logbook
+        Index("ix_events_entity_id_time_fired", "entity_id", "time_fired"),
         {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
     )
     __tablename__ = TABLE_EVENTS
@@ -93,6 +105,7 @@ class Events(Base):  # type: ignore
     context_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID), index=True)
     context_user_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID), index=True)
     context_parent_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID), index=True)
+    entity_id = Column(String(MAX_LENGTH_STATE_ENTITY_ID))
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -108,13 +121,13 @@ class Events(Base):  # type: ignore
         """Create an event database object from a native event."""
         return Events(
             event_type=event.event_type,
-            event_data=event_data
-            or json.dumps(event.data, cls=JSONEncoder, separators=(",", ":")),
+            event_data=event_data or database_json_dumps(event.data),
             origin=str(event.origin.value),
             time_fired=event.time_fired,
             context_id=event.context.id,
             context_user_id=event.context.user_id,
             context_parent_id=event.context.parent_id,
+            entity_id=event_entity_id(event),
         )
 
     def to_native(self, validate_entity_id=True):
@@ -156,12 +169,17 @@ class States(Base):  # type: ignore
     event_id = Column(
         Integer, ForeignKey("events.event_id", ondelete="CASCADE"), index=True
     )
-    last_changed = Column(DATETIME_TYPE, default=dt_util.utcnow)
+    # NULL when it equals last_updated with the compact_states option
+    last_changed = Column(DATETIME_TYPE)
     last_updated = Column(DATETIME_TYPE, default=dt_util.utcnow, index=True)
     created = Column(DATETIME_TYPE, default=dt_util.utcnow)
     old_state_id = Column(Integer, ForeignKey("states.state_id"), index=True)
+    attributes_id = Column(
+        Integer, ForeignKey("state_attributes.attributes_id"), index=True
+    )
     event = relationship("Events", uselist=False)
     old_state = relationship("States", remote_side=[state_id])
+    state_attributes = relationship("StateAttributes")
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -175,39 +193,48 @@ class States(Base):  # type: ignore
         )
 
     @staticmethod
-    def from_event(event):
-        """Create object from a state_changed event."""
+    def from_event(event, compact=False):
+        """Create object from a state_changed event.
+
+        The attributes are not part of the row, they are stored
+        deduplicated in the state_attributes table. In the compact
+        layout last_changed is only stored when it differs from
+        last_updated.
+        """
         entity_id = event.data["entity_id"]
         state = event.data.get("new_state")
 
-        dbstate = States(entity_id=entity_id)
+        dbstate = States(entity_id=entity_id, attributes=None)
 
         # State got deleted
         if state is None:
             dbstate.state = ""
             dbstate.domain = split_entity_id(entity_id)[0]
-            dbstate.attributes = "{}"
-            dbstate.last_changed = event.time_fired
+            dbstate.last_changed = None if compact else event.time_fired
             dbstate.last_updated = event.time_fired
         else:
             dbstate.domain = state.domain
             dbstate.state = state.state
-            dbstate.attributes = json.dumps(
-                dict(state.attributes), cls=JSONEncoder, separators=(",", ":")
-            )
-            dbstate.last_changed = state.last_changed
+            if compact and state.last_changed == state.last_updated:
+                dbstate.last_changed = None
+            else:
+                dbstate.last_changed = state.last_changed
             dbstate.last_updated = state.last_updated
 
         return dbstate
 
     def to_native(self, validate_entity_id=True):
         """Convert to an HA state object."""
+        # Rows recorded before schema 21 keep their attributes in the row
+        attributes = self.attributes
+        if attributes is None and self.state_attributes is not None:
+            attributes = self.state_attributes.shared_attrs
         try:
             return State(
                 self.entity_id,
                 self.state,
-                json.loads(self.attributes),
-                process_timestamp(self.last_changed),
+                json.loads(attributes) if attributes else {},
+                process_timestamp(self.last_changed or self.last_updated),
                 process_timestamp(self.last_updated),
                 # Join the events table on event_id to get the context instead
                 # as it will always be there for state_changed events
@@ -220,6 +247,70 @@ class States(Base):  # type: ignore
             return None
 
 
+# Matches the states whose state changed, in both the default layout and
+# the compact layout where last_changed is NULL when it equals last_updated
+STATE_CHANGED = or_(
+    States.last_changed.is_(None), States.last_changed == States.last_updated
+)
+
+
+class StateAttributes(Base):  # type: ignore
+    """State attribute change history, shared between states."""
+
+    __table_args__ = (
+        {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+    __tablename__ = TABLE_STATE_ATTRIBUTES
+    attributes_id = Column(Integer, Identity(), primary_key=True)
+    hash = Column(BigInteger, index=True)
+    shared_attrs = Column(Text().with_variant(mysql.LONGTEXT, "mysql"))
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.StateAttributes("
+            f"id={self.attributes_id}, hash='{self.hash}', "
+            f"attributes='{self.shared_attrs}'"
+            f")>"
+        )
+
+    @staticmethod
+    def from_event(event):
+        """Create object from a state_changed event."""
+        shared_attrs = StateAttributes.shared_attrs_from_event(event)
+        return StateAttributes(
+            shared_attrs=shared_attrs,
+            hash=StateAttributes.hash_shared_attrs(shared_attrs),
+        )
+
+    @staticmethod
+    def shared_attrs_from_event(event) -> str:
+        """Serialize the attributes of the new state of a state_changed event."""
+        state = event.data.get("new_state")
+        # State got deleted
+        if state is None:
+            return "{}"
+        return state.attributes_json()
+
+    @staticmethod
+    def hash_shared_attrs(shared_attrs: str) -> int:
+        """Return the hash of serialized attributes.
+
+        The hash is only used to narrow down the lookup of existing
+        attributes, collisions are resolved by comparing shared_attrs.
+        """
+        return zlib.crc32(shared_attrs.encode("utf-8"))
+
+    def to_native(self):
+        """Convert to a state attributes dictionary."""
+        try:
+            return json.loads(self.shared_attrs)
+        except ValueError:
+            # When json.loads fails
+            _LOGGER.exception("Error converting row to state attributes: %s", self)
+            return {}
+
+
 class StatisticData(TypedDict, total=False):
     """Statistic data class."""
 
@@ -231,21 +322,21 @@ class StatisticData(TypedDict, total=False):
     sum: float
 
 
-class Statistics(Base):  # type: ignore
-    """Statistics."""
+class StatisticsBase:
+    """Statistics base class."""
 
-    __table_args__ = (
-        # Used for fetching statistics for a certain entity at a specific time
-        Index("ix_statistics_statistic_id_start", "metadata_id", "start"),
-    )
-    __tablename__ = TABLE_STATISTICS
     id = Column(Integer, primary_key=True)
     created = Column(DATETIME_TYPE, default=dt_util.utcnow)
-    metadata_id = Column(
-        Integer,
-        ForeignKey(f"{TABLE_STATISTICS_META}.id", ondelete="CASCADE"),
-        index=True,
-    )
+
+    @declared_attr
+    def metadata_id(self):
+        """Define the metadata_id column for sub classes."""
+        return Column(
+            Integer,
+            ForeignKey(f"{TABLE_STATISTICS_META}.id", ondelete="CASCADE"),
+            index=True,
+        )
+
     start = Column(DATETIME_TYPE, index=True)
     mean = Column(DOUBLE_TYPE)
     min = Column(DOUBLE_TYPE)
@@ -254,16 +345,40 @@ class Statistics(Base):  # type: ignore
     state = Column(DOUBLE_TYPE)
     sum = Column(DOUBLE_TYPE)
 
-    @staticmethod
-    def from_stats(metadata_id: str, start: datetime, stats: StatisticData):
+    @classmethod
+    def from_stats(cls, metadata_id: str, start: datetime, stats: StatisticData):
         """Create object from a statistics."""
-        return Statistics(
+        return cls(  # type: ignore
             metadata_id=metadata_id,
             start=start,
             **stats,
         )
 
 
+class Statistics(Base, StatisticsBase):  # type: ignore
+    """Long term statistics."""
+
+    duration = timedelta(hours=1)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index("ix_statistics_statistic_id_start", "metadata_id", "start"),
+    )
+    __tablename__ = TABLE_STATISTICS
+
+
+class StatisticsShortTerm(Base, StatisticsBase):  # type: ignore
+    """Short term statistics."""
+
+    duration = timedelta(minutes=5)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index("ix_statistics_short_term_statistic_id_start", "metadata_id", "start"),
+    )
+    __tablename__ = TABLE_STATISTICS_SHORT_TERM
+
+
 class StatisticMetaData(TypedDict, total=False):
     """Statistic meta data class."""
 
@@ -386,6 +501,28 @@ class StatisticsRuns(Base):  # type: ignore
         )
 
 
+def event_entity_id(event: Event) -> str | None:
+    """Return the entity_id to index an event by.
+
+    State changes are found through the states table, other events are
+    indexed when their data references a single entity.
+    """
+    if event.event_type == EVENT_STATE_CHANGED:
+        return None
+    entity_id = event.data.get(ATTR_ENTITY_ID)
+    if isinstance(entity_id, str) and len(entity_id) <= MAX_LENGTH_STATE_ENTITY_ID:
+        return entity_id
+    return None
+
+
+def database_json_dumps(data: Any) -> str:
+    """Serialize data to be stored in the database.
+
+    NaN and infinity are stored as null with either JSON backend.
+    """
+    return json_dumps(data)
+
+
 def process_timestamp(ts):
     """Process a timestamp into datetime object."""
     if ts is None:
@@ -463,7 +600,10 @@ class LazyState(State):
     def last_changed(self):
         """Last changed datetime."""
         if not self._last_changed:
-            self._last_changed = process_timestamp(self._row.last_changed)
+            if self._row.last_changed is None:
+                self._last_changed = self.last_updated
+            else:
+                self._last_changed = process_timestamp(self._row.last_changed)
         return self._last_changed
 
     @last_changed.setter
@@ -490,18 +630,20 @@ class LazyState(State):
 
         To be used for JSON serialization.
         """
-        if self._last_changed:
-            last_changed_isoformat = self._last_changed.isoformat()
-        else:
-            last_changed_isoformat = process_timestamp_to_utc_isoformat(
-                self._row.last_changed
-            )
         if self._last_updated:
             last_updated_isoformat = self._last_updated.isoformat()
         else:
             last_updated_isoformat = process_timestamp_to_utc_isoformat(
                 self._row.last_updated
             )
+        if self._last_changed:
+            last_changed_isoformat = self._last_changed.isoformat()
+        elif self._row.last_changed is None:
+            last_changed_isoformat = last_updated_isoformat
+        else:
+            last_changed_isoformat = process_timestamp_to_utc_isoformat(
+                self._row.last_changed
+            )
         return {
             "entity_id": self.entity_id,
             "state": self.state,
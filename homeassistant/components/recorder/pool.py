@@ -1,7 +1,10 @@
-"""A pool for sqlite connections."""
+"""Pools for the recorder connections."""
+from __future__ import annotations
+
 import threading
+from typing import NamedTuple
 
-from sqlalchemy.pool import NullPool, StaticPool
+from sqlalchemy.pool import NullPool, QueuePool, StaticPool
 
 
 class RecorderPool(StaticPool, NullPool):
@@ -32,3 +35,49 @@ class RecorderPool(StaticPool, NullPool):
         return super(  # pylint: disable=bad-super-call
             NullPool, self
         )._create_connection()
+
+
+class ReadPoolStats(NamedTuple):
+    """Diagnostics of the read only pool."""
+
+    size: int
+    checked_out: int
+    max_checked_out: int
+    checkouts: int
+    waits: int
+
+
+class ReadOnlyPool(QueuePool):
+    """A bounded pool for the connections used by queries.
+
+    Counts the checkouts that had to wait for a connection to be returned.
+    """
+
+    def __init__(self, *args, **kw):
+        """Create the pool."""
+        super().__init__(*args, **kw)
+        self._stats_lock = threading.Lock()
+        self._checkouts = 0
+        self._waits = 0
+        self._max_checked_out = 0
+
+    def _do_get(self):
+        with self._stats_lock:
+            self._checkouts += 1
+            if self.checkedout() >= self.size() + max(self._max_overflow, 0):
+                self._waits += 1
+        conn = super()._do_get()
+        with self._stats_lock:
+            self._max_checked_out = max(self._max_checked_out, self.checkedout())
+        return conn
+
+    def stats(self) -> ReadPoolStats:
+        """Return diagnostics of the pool."""
+        with self._stats_lock:
+            return ReadPoolStats(
+                self.size(),
+                self.checkedout(),
+                self._max_checked_out,
+                self._checkouts,
+                self._waits,
+            )
@@ -1,15 +1,23 @@
 """Purge old data helper."""
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
+import time
 from typing import TYPE_CHECKING, Callable
 
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import distinct
 
 from .const import MAX_ROWS_TO_PURGE
-from .models import Events, RecorderRuns, States
+from .models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+    StatisticsShortTerm,
+    process_timestamp,
+)
 from .repack import repack_database
 from .util import retryable_database_job, session_scope
 
@@ -25,7 +33,9 @@ def purge_old_data(
 ) -> bool:
     """Purge events and states older than purge_before.
 
-    Cleans up an timeframe of an hour, based on the oldest record.
+    Cleans up a time range of at most MAX_ROWS_TO_PURGE events and states,
+    starting at the oldest record. The recorder schedules the next time
+    range after the work already in its queue, so commits interleave.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
@@ -33,15 +43,25 @@ def purge_old_data(
     )
 
     with session_scope(session=instance.get_session()) as session:  # type: ignore
-        # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
-        event_ids = _select_event_ids_to_purge(session, purge_before)
-        state_ids = _select_state_ids_to_purge(session, purge_before, event_ids)
+        timer_start = time.perf_counter()
+        purge_end = _select_purge_end(session, purge_before)
+        state_ids, attributes_ids = _select_state_and_attributes_ids_to_purge(
+            session, purge_end
+        )
         if state_ids:
-            _purge_state_ids(session, state_ids)
-        if event_ids:
-            _purge_event_ids(session, event_ids)
+            _purge_states_before(instance, session, purge_end, state_ids)
+        if attributes_ids:
+            _purge_unused_attributes_ids(instance, session, attributes_ids)
+        purged_events = _purge_events_before(session, purge_end)
+        short_term_statistics = _select_short_term_statistics_to_purge(
+            session, purge_before
+        )
+        if short_term_statistics:
+            _purge_short_term_statistics(session, short_term_statistics)
+        if state_ids or purged_events or short_term_statistics:
             # If states or events purging isn't processing the purge_before yet,
             # return false, as we are not done yet.
+            _log_purge_progress(timer_start, purge_end, len(state_ids) + purged_events)
             _LOGGER.debug("Purging hasn't fully completed yet")
             return False
         if apply_filter and _purge_filtered_data(instance, session) is False:
@@ -53,35 +73,138 @@ def purge_old_data(
     return True
 
 
-def _select_event_ids_to_purge(session: Session, purge_before: datetime) -> list[int]:
-    """Return a list of event ids to purge."""
-    events = (
-        session.query(Events.event_id)
-        .filter(Events.time_fired < purge_before)
-        .limit(MAX_ROWS_TO_PURGE)
-        .all()
+def _select_purge_end(session: Session, purge_before: datetime) -> datetime:
+    """Return the end of the time range to purge next.
+
+    The range ends after the oldest MAX_ROWS_TO_PURGE events and states,
+    which are found through the time_fired and last_updated indices.
+    """
+    purge_end = purge_before
+    for column in (Events.time_fired, States.last_updated):
+        last_in_range = (
+            session.query(column)
+            .filter(column < purge_before)
+            .order_by(column)
+            .offset(MAX_ROWS_TO_PURGE - 1)
+            .limit(1)
+            .scalar()
+        )
+        if last_in_range is not None:
+            last_in_range = process_timestamp(last_in_range) + timedelta.resolution
+            purge_end = min(purge_end, last_in_range)
+    return purge_end
+
+
+def _log_purge_progress(timer_start: float, purge_end: datetime, rows: int) -> None:
+    """Log how far the purge got and how fast it is."""
+    elapsed = time.perf_counter() - timer_start
+    _LOGGER.debug(
+        "Purged %s states and events before %s in %.3fs (%.0f rows/s)",
+        rows,
+        purge_end.isoformat(sep=" ", timespec="seconds"),
+        elapsed,
+        rows / elapsed if elapsed else 0,
     )
-    _LOGGER.debug("Selected %s event ids to remove", len(events))
-    return [event.event_id for event in events]
 
 
-def _select_state_ids_to_purge(
-    session: Session, purge_before: datetime, event_ids: list[int]
-) -> list[int]:
-    """Return a list of state ids to purge."""
-    if not event_ids:
-        return []
+def _select_state_and_attributes_ids_to_purge(
+    session: Session, purge_end: datetime
+) -> tuple[set[int], set[int]]:
+    """Return a list of state ids and the attributes ids they use to purge."""
     states = (
-        session.query(States.state_id)
-        .filter(States.last_updated < purge_before)
-        .filter(States.event_id.in_(event_ids))
+        session.query(States.state_id, States.attributes_id)
+        .filter(States.last_updated < purge_end)
         .all()
     )
     _LOGGER.debug("Selected %s state ids to remove", len(states))
-    return [state.state_id for state in states]
+    state_ids = set()
+    attributes_ids = set()
+    for state in states:
+        state_ids.add(state.state_id)
+        if state.attributes_id:
+            attributes_ids.add(state.attributes_id)
+    return state_ids, attributes_ids
+
+
+def _select_short_term_statistics_to_purge(
+    session: Session, purge_before: datetime
+) -> list[int]:
+    """Return a list of short term statistics to purge."""
+    statistics = (
+        session.query(StatisticsShortTerm.id)
+        .filter(StatisticsShortTerm.start < purge_before)
+        .limit(MAX_ROWS_TO_PURGE)
+        .all()
+    )
+    _LOGGER.debug("Selected %s short term statistics to remove", len(statistics))
+    return [statistic.id for statistic in statistics]
 
 
-def _purge_state_ids(session: Session, state_ids: list[int]) -> None:
+def _purge_unused_attributes_ids(
+    instance: Recorder, session: Session, attributes_ids: set[int]
+) -> None:
+    """Delete the attributes that are no longer used by any state."""
+    keep_attributes_ids = {
+        state.attributes_id
+        for state in session.query(States.attributes_id)
+        .filter(States.attributes_id.in_(attributes_ids))
+        .distinct()
+    }
+    if not (unused_attributes_ids := attributes_ids - keep_attributes_ids):
+        return
+
+    deleted_rows = (
+        session.query(StateAttributes)
+        .filter(StateAttributes.attributes_id.in_(unused_attributes_ids))
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s attribute states", deleted_rows)
+
+    # Make sure the recorder does not link new states to deleted attributes
+    instance._evict_purged_state_attributes(  # pylint: disable=protected-access
+        unused_attributes_ids
+    )
+
+
+def _purge_states_before(
+    instance: Recorder, session: Session, purge_end: datetime, state_ids: set[int]
+) -> None:
+    """Disconnect and delete the states of a time range."""
+
+    # Update old_state_id to NULL before deleting to ensure
+    # the delete does not fail due to a foreign key constraint
+    # since some databases (MSSQL) cannot do the ON DELETE SET NULL
+    # for us.
+    disconnected_rows = (
+        session.query(States)
+        .filter(States.old_state_id.in_(state_ids))
+        .update({"old_state_id": None}, synchronize_session=False)
+    )
+    _LOGGER.debug("Updated %s states to remove old_state_id", disconnected_rows)
+
+    deleted_rows = (
+        session.query(States)
+        .filter(States.last_updated < purge_end)
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s states", deleted_rows)
+
+    # Make sure the recorder does not link new states to deleted states
+    instance._evict_purged_states(state_ids)  # pylint: disable=protected-access
+
+
+def _purge_events_before(session: Session, purge_end: datetime) -> int:
+    """Delete the events of a time range."""
+    deleted_rows = (
+        session.query(Events)
+        .filter(Events.time_fired < purge_end)
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s events", deleted_rows)
+    return deleted_rows
+
+
+def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int]) -> None:
     """Disconnect states and delete by state id."""
 
     # Update old_state_id to NULL before deleting to ensure
@@ -102,6 +225,9 @@ def _purge_state_ids(session: Session, state_ids: list[int]) -> None:
     )
     _LOGGER.debug("Deleted %s states", deleted_rows)
 
+    # Make sure the recorder does not link new states to deleted states
+    instance._evict_purged_states(state_ids)  # pylint: disable=protected-access
+
 
 def _purge_event_ids(session: Session, event_ids: list[int]) -> None:
     """Delete by event id."""
@@ -113,6 +239,18 @@ def _purge_event_ids(session: Session, event_ids: list[int]) -> None:
     _LOGGER.debug("Deleted %s events", deleted_rows)
 
 
+def _purge_short_term_statistics(
+    session: Session, short_term_statistics: list[int]
+) -> None:
+    """Delete by id."""
+    deleted_rows = (
+        session.query(StatisticsShortTerm)
+        .filter(StatisticsShortTerm.id.in_(short_term_statistics))
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
+
+
 def _purge_old_recorder_runs(
     instance: Recorder, session: Session, purge_before: datetime
 ) -> None:
@@ -138,7 +276,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
         if not instance.entity_filter(entity_id)
     ]
     if len(excluded_entity_ids) > 0:
-        _purge_filtered_states(session, excluded_entity_ids)
+        _purge_filtered_states(instance, session, excluded_entity_ids)
         return False
 
     # Check if excluded event_types are in database
@@ -148,19 +286,22 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
         if event_type in instance.exclude_t
     ]
     if len(excluded_event_types) > 0:
-        _purge_filtered_events(session, excluded_event_types)
+        _purge_filtered_events(instance, session, excluded_event_types)
         return False
 
     return True
 
 
-def _purge_filtered_states(session: Session, excluded_entity_ids: list[str]) -> None:
+def _purge_filtered_states(
+    instance: Recorder, session: Session, excluded_entity_ids: list[str]
+) -> None:
     """Remove filtered states and linked events."""
     state_ids: list[int]
     event_ids: list[int | None]
-    state_ids, event_ids = zip(
+    attributes_ids: list[int | None]
+    state_ids, event_ids, attributes_ids = zip(
         *(
-            session.query(States.state_id, States.event_id)
+            session.query(States.state_id, States.event_id, States.attributes_id)
             .filter(States.entity_id.in_(excluded_entity_ids))
             .limit(MAX_ROWS_TO_PURGE)
             .all()
@@ -170,11 +311,15 @@ def _purge_filtered_states(session: Session, excluded_entity_ids: list[str]) ->
     _LOGGER.debug(
         "Selected %s state_ids to remove that should be filtered", len(state_ids)
     )
-    _purge_state_ids(session, state_ids)
+    _purge_state_ids(instance, session, set(state_ids))
     _purge_event_ids(session, event_ids)  # type: ignore  # type of event_ids already narrowed to 'list[int]'
+    if unique_attributes_ids := {id_ for id_ in attributes_ids if id_ is not None}:
+        _purge_unused_attributes_ids(instance, session, unique_attributes_ids)
 
 
-def _purge_filtered_events(session: Session, excluded_event_types: list[str]) -> None:
+def _purge_filtered_events(
+    instance: Recorder, session: Session, excluded_event_types: list[str]
+) -> None:
     """Remove filtered events and linked states."""
     events: list[Events] = (
         session.query(Events.event_id)
@@ -187,11 +332,18 @@ def _purge_filtered_events(session: Session, excluded_event_types: list[str]) ->
         "Selected %s event_ids to remove that should be filtered", len(event_ids)
     )
     states: list[States] = (
-        session.query(States.state_id).filter(States.event_id.in_(event_ids)).all()
+        session.query(States.state_id, States.attributes_id)
+        .filter(States.event_id.in_(event_ids))
+        .all()
     )
-    state_ids: list[int] = [state.state_id for state in states]
-    _purge_state_ids(session, state_ids)
+    state_ids: set[int] = {state.state_id for state in states}
+    attributes_ids: set[int] = {
+        state.attributes_id for state in states if state.attributes_id
+    }
+    _purge_state_ids(instance, session, state_ids)
     _purge_event_ids(session, event_ids)
+    if attributes_ids:
+        _purge_unused_attributes_ids(instance, session, attributes_ids)
 
 
 @retryable_database_job("purge")
@@ -206,7 +358,7 @@ def purge_entity_data(instance: Recorder, entity_filter: Callable[[str], bool])
         _LOGGER.debug("Purging entity data for %s", selected_entity_ids)
         if len(selected_entity_ids) > 0:
             # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
-            _purge_filtered_states(session, selected_entity_ids)
+            _purge_filtered_states(instance, session, selected_entity_ids)
             _LOGGER.debug("Purging entity data hasn't fully completed yet")
             return False
 
@@ -5,9 +5,9 @@ from collections import defaultdict
 from datetime import datetime, timedelta
 from itertools import groupby
 import logging
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Literal
 
-from sqlalchemy import bindparam
+from sqlalchemy import bindparam, func
 from sqlalchemy.ext import baked
 from sqlalchemy.orm.scoping import scoped_session
 
@@ -25,12 +25,14 @@ import homeassistant.util.temperature as temperature_util
 from homeassistant.util.unit_system import UnitSystem
 import homeassistant.util.volume as volume_util
 
-from .const import DOMAIN
+from .const import DATA_INSTANCE, DOMAIN
 from .models import (
+    StatisticData,
     StatisticMetaData,
     Statistics,
     StatisticsMeta,
     StatisticsRuns,
+    StatisticsShortTerm,
     process_timestamp_to_utc_isoformat,
 )
 from .util import execute, retryable_database_job, session_scope
@@ -49,6 +51,31 @@ QUERY_STATISTICS = [
     Statistics.sum,
 ]
 
+QUERY_STATISTICS_SHORT_TERM = [
+    StatisticsShortTerm.metadata_id,
+    StatisticsShortTerm.start,
+    StatisticsShortTerm.mean,
+    StatisticsShortTerm.min,
+    StatisticsShortTerm.max,
+    StatisticsShortTerm.last_reset,
+    StatisticsShortTerm.state,
+    StatisticsShortTerm.sum,
+]
+
+QUERY_STATISTICS_SUMMARY_MEAN = [
+    StatisticsShortTerm.metadata_id,
+    func.avg(StatisticsShortTerm.mean),
+    func.min(StatisticsShortTerm.min),
+    func.max(StatisticsShortTerm.max),
+]
+
+QUERY_STATISTICS_SUMMARY_SUM = [
+    StatisticsShortTerm.metadata_id,
+    StatisticsShortTerm.last_reset,
+    StatisticsShortTerm.state,
+    StatisticsShortTerm.sum,
+]
+
 QUERY_STATISTIC_META = [
     StatisticsMeta.id,
     StatisticsMeta.statistic_id,
@@ -64,6 +91,9 @@ QUERY_STATISTIC_META_ID = [
 
 STATISTICS_BAKERY = "recorder_statistics_bakery"
 STATISTICS_META_BAKERY = "recorder_statistics_bakery"
+STATISTICS_SHORT_TERM_BAKERY = "recorder_statistics_short_term_bakery"
+
+STATISTIC_PERIODS = {"5minute": timedelta(minutes=5), "hour": timedelta(hours=1)}
 
 # Convert pressure and temperature statistics from the native unit used for statistics
 # to the units configured by the user
@@ -92,6 +122,7 @@ def async_setup(hass: HomeAssistant) -> None:
     """Set up the history hooks."""
     hass.data[STATISTICS_BAKERY] = baked.bakery()
     hass.data[STATISTICS_META_BAKERY] = baked.bakery()
+    hass.data[STATISTICS_SHORT_TERM_BAKERY] = baked.bakery()
 
     def entity_id_changed(event: Event) -> None:
         """Handle entity_id changed."""
@@ -120,10 +151,11 @@ def async_setup(hass: HomeAssistant) -> None:
 
 
 def get_start_time() -> datetime:
-    """Return start time."""
-    last_hour = dt_util.utcnow() - timedelta(hours=1)
-    start = last_hour.replace(minute=0, second=0, microsecond=0)
-    return start
+    """Return start time of the last completed 5-minute period."""
+    now = dt_util.utcnow()
+    current_period_minutes = now.minute - now.minute % 5
+    current_period = now.replace(minute=current_period_minutes, second=0, microsecond=0)
+    return current_period - StatisticsShortTerm.duration
 
 
 def _get_metadata_ids(
@@ -188,11 +220,51 @@ def _update_or_add_metadata(
     return metadata_id
 
 
+def _compile_hourly_statistics(session: scoped_session, start: datetime) -> None:
+    """Compile hourly statistics.
+
+    This summarizes the 5-minute statistics of one hour:
+    - mean, min and max are computed by the database
+    - last_reset, state and sum are taken from the last 5-minute period
+    """
+    end = start + Statistics.duration
+    summary: dict[str, StatisticData] = {}
+
+    query = session.query(*QUERY_STATISTICS_SUMMARY_MEAN)
+    query = query.filter(StatisticsShortTerm.start >= start)
+    query = query.filter(StatisticsShortTerm.start < end)
+    query = query.group_by(StatisticsShortTerm.metadata_id)
+    for metadata_id, _mean, _min, _max in execute(query) or []:
+        summary[metadata_id] = {"mean": _mean, "min": _min, "max": _max}
+
+    query = session.query(*QUERY_STATISTICS_SUMMARY_SUM)
+    query = query.filter(StatisticsShortTerm.start >= start)
+    query = query.filter(StatisticsShortTerm.start < end)
+    query = query.filter(StatisticsShortTerm.sum.isnot(None))
+    query = query.order_by(
+        StatisticsShortTerm.metadata_id, StatisticsShortTerm.start.desc()
+    )
+    stats = execute(query) or []
+    for metadata_id, group in groupby(stats, lambda stat: stat.metadata_id):  # type: ignore
+        _, last_reset, state, _sum = next(group)
+        summary.setdefault(metadata_id, {}).update(
+            {"last_reset": last_reset, "state": state, "sum": _sum}
+        )
+
+    for metadata_id, stat in summary.items():
+        session.add(Statistics.from_stats(metadata_id, start, stat))
+
+
 @retryable_database_job("statistics")
 def compile_statistics(instance: Recorder, start: datetime) -> bool:
-    """Compile statistics."""
+    """Compile 5-minute statistics for all integrations with a recorder platform.
+
+    The actual calculation is delegated to the platforms. When the last
+    5-minute period of an hour is compiled, hourly statistics are rolled up
+    from the 5-minute statistics.
+    """
     start = dt_util.as_utc(start)
-    end = start + timedelta(hours=1)
+    end = start + StatisticsShortTerm.duration
 
     with session_scope(session=instance.get_session()) as session:  # type: ignore
         if session.query(StatisticsRuns).filter_by(start=start).first():
@@ -215,7 +287,12 @@ def compile_statistics(instance: Recorder, start: datetime) -> bool:
                 metadata_id = _update_or_add_metadata(
                     instance.hass, session, entity_id, stat["meta"]
                 )
-                session.add(Statistics.from_stats(metadata_id, start, stat["stat"]))
+                session.add(
+                    StatisticsShortTerm.from_stats(metadata_id, start, stat["stat"])
+                )
+        if start.minute == 55:
+            # A full hour of 5-minute statistics is now available
+            _compile_hourly_statistics(session, start.replace(minute=0))
         session.add(StatisticsRuns(start=start))
 
     return True
@@ -280,6 +357,18 @@ def get_metadata(
         return _get_metadata(hass, session, statistic_ids, None).get(metadata_ids[0])
 
 
+def get_metadata_for_statistic_ids(
+    hass: HomeAssistant,
+    statistic_ids: list[str],
+) -> dict[str, StatisticMetaData]:
+    """Return metadata for a list of statistic_ids, fetched in one query."""
+    if not statistic_ids:
+        return {}
+    with session_scope(hass=hass) as session:
+        metadata = _get_metadata(hass, session, statistic_ids, None)
+    return {meta["statistic_id"]: meta for meta in metadata.values()}
+
+
 def _configured_unit(unit: str, units: UnitSystem) -> str:
     """Return the pressure and temperature units configured by the user."""
     if unit == PRESSURE_PA:
@@ -299,7 +388,7 @@ def list_statistic_ids(
     """Return statistic_ids and meta data."""
     units = hass.config.units
     statistic_ids = {}
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         metadata = _get_metadata(hass, session, None, statistic_type)
 
         for meta in metadata.values():
@@ -331,36 +420,69 @@ def list_statistic_ids(
     ]
 
 
+def _statistics_table(
+    hass: HomeAssistant,
+    start_time: datetime,
+    period: Literal["5minute", "hour"] | timedelta,
+) -> type[Statistics | StatisticsShortTerm]:
+    """Return the table with the statistics to answer a query.
+
+    Short term statistics are purged together with the states, so they are
+    only used when the period is finer than an hour and they are still kept
+    for the whole range.
+    """
+    if isinstance(period, str):
+        period = STATISTIC_PERIODS[period]
+    if period >= timedelta(hours=1):
+        return Statistics
+    keep_days = hass.data[DATA_INSTANCE].keep_days
+    if start_time < dt_util.utcnow() - timedelta(days=keep_days):
+        return Statistics
+    return StatisticsShortTerm
+
+
 def statistics_during_period(
     hass: HomeAssistant,
     start_time: datetime,
     end_time: datetime | None = None,
     statistic_ids: list[str] | None = None,
+    period: Literal["5minute", "hour"] | timedelta = "hour",
 ) -> dict[str, list[dict[str, str]]]:
-    """Return states changes during UTC period start_time - end_time."""
+    """Return statistics during UTC period start_time - end_time.
+
+    The period is a resolution or a timedelta. Hourly statistics are returned
+    unless a finer period is requested and short term statistics are still
+    kept for the whole range.
+    """
     metadata = None
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         metadata = _get_metadata(hass, session, statistic_ids, None)
         if not metadata:
             return {}
 
-        baked_query = hass.data[STATISTICS_BAKERY](
-            lambda session: session.query(*QUERY_STATISTICS)
-        )
+        table = _statistics_table(hass, start_time, period)
+        if table is StatisticsShortTerm:
+            baked_query = hass.data[STATISTICS_SHORT_TERM_BAKERY](
+                lambda session: session.query(*QUERY_STATISTICS_SHORT_TERM)
+            )
+        else:
+            baked_query = hass.data[STATISTICS_BAKERY](
+                lambda session: session.query(*QUERY_STATISTICS)
+            )
 
-        baked_query += lambda q: q.filter(Statistics.start >= bindparam("start_time"))
+        baked_query += lambda q: q.filter(table.start >= bindparam("start_time"))
 
         if end_time is not None:
-            baked_query += lambda q: q.filter(Statistics.start < bindparam("end_time"))
+            baked_query += lambda q: q.filter(table.start < bindparam("end_time"))
 
         metadata_ids = None
         if statistic_ids is not None:
             baked_query += lambda q: q.filter(
-                Statistics.metadata_id.in_(bindparam("metadata_ids"))
+                table.metadata_id.in_(bindparam("metadata_ids"))
             )
             metadata_ids = list(metadata.keys())
 
-        baked_query += lambda q: q.order_by(Statistics.metadata_id, Statistics.start)
+        baked_query += lambda q: q.order_by(table.metadata_id, table.start)
 
         stats = execute(
             baked_query(session).params(
@@ -372,26 +494,34 @@ def statistics_during_period(
         return _sorted_statistics_to_dict(hass, stats, statistic_ids, metadata)
 
 
-def get_last_statistics(
-    hass: HomeAssistant, number_of_stats: int, statistic_id: str
+def _get_last_statistics(
+    hass: HomeAssistant,
+    number_of_stats: int,
+    statistic_id: str,
+    short_term: bool,
 ) -> dict[str, list[dict]]:
-    """Return the last number_of_stats statistics for a statistic_id."""
+    """Return the last number_of_stats statistics for a given statistic_id."""
     statistic_ids = [statistic_id]
     with session_scope(hass=hass) as session:
         metadata = _get_metadata(hass, session, statistic_ids, None)
         if not metadata:
             return {}
 
-        baked_query = hass.data[STATISTICS_BAKERY](
-            lambda session: session.query(*QUERY_STATISTICS)
-        )
+        if short_term:
+            baked_query = hass.data[STATISTICS_SHORT_TERM_BAKERY](
+                lambda session: session.query(*QUERY_STATISTICS_SHORT_TERM)
+            )
+            table: type[Statistics | StatisticsShortTerm] = StatisticsShortTerm
+        else:
+            baked_query = hass.data[STATISTICS_BAKERY](
+                lambda session: session.query(*QUERY_STATISTICS)
+            )
+            table = Statistics
 
         baked_query += lambda q: q.filter_by(metadata_id=bindparam("metadata_id"))
         metadata_id = next(iter(metadata.keys()))
 
-        baked_query += lambda q: q.order_by(
-            Statistics.metadata_id, Statistics.start.desc()
-        )
+        baked_query += lambda q: q.order_by(table.metadata_id, table.start.desc())
 
         baked_query += lambda q: q.limit(bindparam("number_of_stats"))
 
@@ -406,6 +536,20 @@ def get_last_statistics(
         return _sorted_statistics_to_dict(hass, stats, statistic_ids, metadata)
 
 
+def get_last_statistics(
+    hass: HomeAssistant, number_of_stats: int, statistic_id: str
+) -> dict[str, list[dict]]:
+    """Return the last number_of_stats hourly statistics for a statistic_id."""
+    return _get_last_statistics(hass, number_of_stats, statistic_id, False)
+
+
+def get_last_short_term_statistics(
+    hass: HomeAssistant, number_of_stats: int, statistic_id: str
+) -> dict[str, list[dict]]:
+    """Return the last number_of_stats short term statistics for a statistic_id."""
+    return _get_last_statistics(hass, number_of_stats, statistic_id, True)
+
+
 def _sorted_statistics_to_dict(
     hass: HomeAssistant,
     stats: list,
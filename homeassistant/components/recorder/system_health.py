@@ -0,0 +1,44 @@
+"""Provide info to system health."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components import system_health
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_INSTANCE
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, register: system_health.SystemHealthRegistration
+) -> None:
+    """Register system health callbacks."""
+    instance = hass.data[DATA_INSTANCE]
+    if instance.history_cache is not None or instance.read_engine is not None:
+        register.async_register_info(system_health_info)
+
+
+async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Get info for the info page."""
+    instance = hass.data[DATA_INSTANCE]
+    info: dict[str, Any] = {}
+    if instance.history_cache is not None:
+        stats = instance.history_cache.stats()
+        queries = stats.hits + stats.misses
+        info["history_cache_entities"] = stats.entities
+        info["history_cache_states"] = stats.states
+        info["history_cache_hit_rate"] = (
+            f"{stats.hits / queries:.1%}" if queries else "-"
+        )
+        info["history_cache_memory"] = f"{stats.memory / 1024 ** 2:.1f} MiB"
+    if (read_engine := instance.read_engine) is not None:
+        pool_stats = read_engine.pool.stats()
+        info["read_pool_in_use"] = f"{pool_stats.checked_out}/{pool_stats.size}"
+        info["read_pool_max_in_use"] = pool_stats.max_checked_out
+        info["read_pool_wait_rate"] = (
+            f"{pool_stats.waits / pool_stats.checkouts:.1%}"
+            if pool_stats.checkouts
+            else "-"
+        )
+    return info
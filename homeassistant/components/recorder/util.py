@@ -25,6 +25,7 @@ from .models import (
     TABLE_STATISTICS,
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
+    TABLE_STATISTICS_SHORT_TERM,
     RecorderRuns,
     process_timestamp,
 )
@@ -52,11 +53,21 @@ RETRYABLE_MYSQL_ERRORS = (1205, 1206, 1213)
 
 @contextmanager
 def session_scope(
-    *, hass: HomeAssistant | None = None, session: Session | None = None
+    *,
+    hass: HomeAssistant | None = None,
+    session: Session | None = None,
+    read_only: bool = False,
 ) -> Generator[Session, None, None]:
-    """Provide a transactional scope around a series of operations."""
+    """Provide a transactional scope around a series of operations.
+
+    Read only scopes use the read only pool of the recorder when it has one.
+    """
     if session is None and hass is not None:
-        session = hass.data[DATA_INSTANCE].get_session()
+        instance = hass.data[DATA_INSTANCE]
+        if read_only and instance.get_read_session is not None:
+            session = instance.get_read_session()
+        else:
+            session = instance.get_session()
 
     if session is None:
         raise RuntimeError("Session required")
@@ -185,7 +196,12 @@ def basic_sanity_check(cursor):
 
     for table in ALL_TABLES:
         # The statistics tables may not be present in old databases
-        if table in [TABLE_STATISTICS, TABLE_STATISTICS_META, TABLE_STATISTICS_RUNS]:
+        if table in [
+            TABLE_STATISTICS,
+            TABLE_STATISTICS_META,
+            TABLE_STATISTICS_RUNS,
+            TABLE_STATISTICS_SHORT_TERM,
+        ]:
             continue
         if table in (TABLE_RECORDER_RUNS, TABLE_SCHEMA_CHANGES):
             cursor.execute(f"SELECT * FROM {table};")  # nosec # not injection
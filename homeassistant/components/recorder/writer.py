@@ -0,0 +1,251 @@
+"""Bulk insert write path for the recorder."""
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+from typing import Any, NamedTuple
+
+from sqlalchemy import func, text
+from sqlalchemy.orm.session import Session
+
+from homeassistant.core import Event
+
+from .models import (
+    Events,
+    StateAttributes,
+    States,
+    database_json_dumps,
+    event_entity_id,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Dialects where rows can be inserted with primary keys
+# assigned by the recorder
+BULK_INSERT_DIALECTS = ("mysql", "postgresql", "sqlite")
+
+
+class IdShift(NamedTuple):
+    """Pending ids from start on that were moved up by offset."""
+
+    start: int
+    offset: int
+
+    def apply(self, row_id: int | None) -> int | None:
+        """Return the id after the shift."""
+        if row_id is not None and row_id >= self.start:
+            return row_id + self.offset
+        return row_id
+
+
+class OldState(NamedTuple):
+    """The last state written for an entity."""
+
+    state_id: int
+    attributes_id: int
+    last_updated: datetime
+
+
+class BulkWriter:
+    """Accumulate rows between commits and insert them with executemany.
+
+    Executemany does not return the primary keys of the inserted rows, so
+    the ids are assigned by the writer, continuing from the highest id in
+    each table. Links such as states.old_state_id and states.event_id are
+    resolved before anything is written. If another writer inserted rows
+    in the meantime, the pending rows are moved above its ids when they
+    are written. The writer must be reset after a purge as the highest ids
+    may have gone down.
+    """
+
+    def __init__(self, dialect_name: str, compact_states: bool = False) -> None:
+        """Initialize the writer."""
+        self.dialect_name = dialect_name
+        self.compact_states = compact_states
+        self._events: list[dict[str, Any]] = []
+        self._states: list[dict[str, Any]] = []
+        self._state_attributes: list[dict[str, Any]] = []
+        self._last_event_id = 0
+        self._last_state_id = 0
+        self._last_attributes_id = 0
+        # The highest ids in the database when the pending ids were assigned
+        self._written_ids = (0, 0, 0)
+
+    def __bool__(self) -> bool:
+        """Return if there are rows waiting to be written."""
+        return bool(self._events)
+
+    def reset(self, session: Session) -> None:
+        """Drop the pending rows and continue from the ids in the database."""
+        self._events = []
+        self._states = []
+        self._state_attributes = []
+        self._written_ids = self._max_ids(session)
+        (
+            self._last_event_id,
+            self._last_state_id,
+            self._last_attributes_id,
+        ) = self._written_ids
+
+    @staticmethod
+    def _max_ids(session: Session) -> tuple[int, int, int]:
+        """Return the highest event_id, state_id and attributes_id."""
+        max_ids = session.query(
+            session.query(func.max(Events.event_id)).scalar_subquery(),
+            session.query(func.max(States.state_id)).scalar_subquery(),
+            session.query(func.max(StateAttributes.attributes_id)).scalar_subquery(),
+        ).one()
+        return tuple(max_id or 0 for max_id in max_ids)  # type: ignore[return-value]
+
+    def add_event(self, event: Event, event_data: str | None = None) -> int:
+        """Add an event row and return its event_id."""
+        if event_data is None:
+            event_data = database_json_dumps(event.data)
+        self._last_event_id += 1
+        self._events.append(
+            {
+                "event_id": self._last_event_id,
+                "event_type": event.event_type,
+                "event_data": event_data,
+                "origin": str(event.origin.value),
+                "time_fired": event.time_fired,
+                "created": event.time_fired,
+                "context_id": event.context.id,
+                "context_user_id": event.context.user_id,
+                "context_parent_id": event.context.parent_id,
+                "entity_id": event_entity_id(event),
+            }
+        )
+        return self._last_event_id
+
+    def add_state(
+        self,
+        event: Event,
+        event_id: int,
+        old_state_id: int | None,
+        attributes_id: int,
+    ) -> int:
+        """Add a state row for a state_changed event and return its state_id."""
+        entity_id = event.data["entity_id"]
+        state = event.data.get("new_state")
+        self._last_state_id += 1
+        row = {
+            "state_id": self._last_state_id,
+            "entity_id": entity_id,
+            "attributes": None,
+            "event_id": event_id,
+            "created": event.time_fired,
+            "old_state_id": old_state_id,
+            "attributes_id": attributes_id,
+        }
+        # State got deleted
+        if state is None:
+            row["domain"] = entity_id.split(".", 1)[0]
+            row["state"] = None
+            row["last_changed"] = None if self.compact_states else event.time_fired
+            row["last_updated"] = event.time_fired
+        else:
+            row["domain"] = state.domain
+            row["state"] = state.state
+            if self.compact_states and state.last_changed == state.last_updated:
+                row["last_changed"] = None
+            else:
+                row["last_changed"] = state.last_changed
+            row["last_updated"] = state.last_updated
+        self._states.append(row)
+        return self._last_state_id
+
+    def add_state_attributes(self, shared_attrs: str, attributes_hash: int) -> int:
+        """Add a state attributes row and return its attributes_id."""
+        self._last_attributes_id += 1
+        self._state_attributes.append(
+            {
+                "attributes_id": self._last_attributes_id,
+                "hash": attributes_hash,
+                "shared_attrs": shared_attrs,
+            }
+        )
+        return self._last_attributes_id
+
+    def write(self, session: Session) -> tuple[IdShift, IdShift, IdShift] | None:
+        """Insert the pending rows in the transaction of the session.
+
+        Returns the shifts of the event, state and attributes ids if the
+        pending rows had to be moved above rows inserted by another writer.
+        """
+        max_ids = self._max_ids(session)
+        shifts = None
+        if any(
+            max_id > written_id
+            for max_id, written_id in zip(max_ids, self._written_ids)
+        ):
+            shifts = self._rebase(max_ids)
+        # Referenced rows are inserted first
+        for model, rows, column in (
+            (StateAttributes, self._state_attributes, "attributes_id"),
+            (Events, self._events, "event_id"),
+            (States, self._states, "state_id"),
+        ):
+            if not rows:
+                continue
+            session.execute(model.__table__.insert(), rows)
+            if self.dialect_name == "postgresql":
+                # Keep the sequence in line with the ids we assigned
+                session.execute(
+                    text("SELECT setval(pg_get_serial_sequence(:table, :column), :id)"),
+                    {
+                        "table": model.__tablename__,
+                        "column": column,
+                        "id": rows[-1][column],
+                    },
+                )
+        _LOGGER.debug(
+            "Inserted %s events, %s states and %s state attributes",
+            len(self._events),
+            len(self._states),
+            len(self._state_attributes),
+        )
+        return shifts
+
+    def _rebase(
+        self, max_ids: tuple[int, int, int]
+    ) -> tuple[IdShift, IdShift, IdShift]:
+        """Move the pending ids above the highest ids in the database."""
+        event_shift, state_shift, attributes_shift = (
+            IdShift(written_id + 1, max(max_id - written_id, 0))
+            for max_id, written_id in zip(max_ids, self._written_ids)
+        )
+        _LOGGER.warning(
+            "Rows were inserted by another writer of the database, moving "
+            "the pending ids from %s above %s",
+            self._written_ids,
+            max_ids,
+        )
+        for row in self._events:
+            row["event_id"] = event_shift.apply(row["event_id"])
+        for row in self._states:
+            row["state_id"] = state_shift.apply(row["state_id"])
+            row["event_id"] = event_shift.apply(row["event_id"])
+            row["old_state_id"] = state_shift.apply(row["old_state_id"])
+            row["attributes_id"] = attributes_shift.apply(row["attributes_id"])
+        for row in self._state_attributes:
+            row["attributes_id"] = attributes_shift.apply(row["attributes_id"])
+        self._last_event_id += event_shift.offset
+        self._last_state_id += state_shift.offset
+        self._last_attributes_id += attributes_shift.offset
+        self._written_ids = tuple(  # type: ignore[assignment]
+            max(max_id, written_id)
+            for max_id, written_id in zip(max_ids, self._written_ids)
+        )
+        return event_shift, state_shift, attributes_shift
+
+    def clear(self) -> None:
+        """Forget the rows that were committed."""
+        self._written_ids = (
+            self._last_event_id,
+            self._last_state_id,
+            self._last_attributes_id,
+        )
+        self._events = []
+        self._states = []
+        self._state_attributes = []
@@ -32,6 +32,7 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import make_entity_service_schema
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.reference_index import ReferenceIndex
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -52,6 +53,7 @@ from .const import (
     ATTR_VARIABLES,
     CONF_FIELDS,
     CONF_TRACE,
+    DATA_REFERENCES,
     DOMAIN,
     ENTITY_ID_FORMAT,
     EVENT_SCRIPT_STARTED,
@@ -76,16 +78,10 @@ def is_on(hass, entity_id):
 @callback
 def scripts_with_entity(hass: HomeAssistant, entity_id: str) -> list[str]:
     """Return all scripts that reference the entity."""
-    if DOMAIN not in hass.data:
+    if DATA_REFERENCES not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if entity_id in script_entity.script.referenced_entities
-    ]
+    return hass.data[DATA_REFERENCES].async_referencing_entity(entity_id)
 
 
 @callback
@@ -107,16 +103,10 @@ def entities_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def scripts_with_device(hass: HomeAssistant, device_id: str) -> list[str]:
     """Return all scripts that reference the device."""
-    if DOMAIN not in hass.data:
+    if DATA_REFERENCES not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if device_id in script_entity.script.referenced_devices
-    ]
+    return hass.data[DATA_REFERENCES].async_referencing_device(device_id)
 
 
 @callback
@@ -138,16 +128,10 @@ def devices_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def scripts_with_area(hass: HomeAssistant, area_id: str) -> list[str]:
     """Return all scripts that reference the area."""
-    if DOMAIN not in hass.data:
+    if DATA_REFERENCES not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if area_id in script_entity.script.referenced_areas
-    ]
+    return hass.data[DATA_REFERENCES].async_referencing_area(area_id)
 
 
 @callback
@@ -169,6 +153,7 @@ def areas_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
 async def async_setup(hass, config):
     """Load the scripts from the configuration."""
     hass.data[DOMAIN] = component = EntityComponent(LOGGER, DOMAIN, hass)
+    hass.data[DATA_REFERENCES] = ReferenceIndex()
 
     # To register scripts as valid domain for Blueprint
     async_get_blueprints(hass)
@@ -419,12 +404,20 @@ class ScriptEntity(ToggleEntity, RestoreEntity):
 
     async def async_added_to_hass(self) -> None:
         """Restore last triggered on startup."""
+        self.hass.data[DATA_REFERENCES].async_add(
+            self.entity_id,
+            self.script.referenced_entities,
+            self.script.referenced_devices,
+            self.script.referenced_areas,
+        )
+
         if state := await self.async_get_last_state():
             if last_triggered := state.attributes.get("last_triggered"):
                 self.script.last_triggered = parse_datetime(last_triggered)
 
     async def async_will_remove_from_hass(self):
         """Stop script and remove service when it will be removed from Home Assistant."""
+        self.hass.data[DATA_REFERENCES].async_remove(self.entity_id)
         await self.script.async_stop()
 
         # remove service
@@ -3,6 +3,8 @@ import logging
 
 DOMAIN = "script"
 
+DATA_REFERENCES = "script_references"
+
 ATTR_LAST_ACTION = "last_action"
 ATTR_LAST_TRIGGERED = "last_triggered"
 ATTR_VARIABLES = "variables"
@@ -4,9 +4,10 @@ from __future__ import annotations
 import datetime
 import itertools
 import logging
+import threading
 from typing import Callable
 
-from homeassistant.components.recorder import history, statistics
+from homeassistant.components.recorder import history, is_entity_recorded, statistics
 from homeassistant.components.sensor import (
     ATTR_STATE_CLASS,
     DEVICE_CLASS_ENERGY,
@@ -38,7 +39,7 @@ from homeassistant.const import (
     VOLUME_CUBIC_FEET,
     VOLUME_CUBIC_METERS,
 )
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers.entity import entity_sources
 import homeassistant.util.dt as dt_util
 import homeassistant.util.pressure as pressure_util
@@ -114,6 +115,14 @@ WARN_DIP = "sensor_warn_total_increasing_dip"
 WARN_UNSUPPORTED_UNIT = "sensor_warn_unsupported_unit"
 WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 
+# Running statistics of the recorded sensor states
+DATA_ACCUMULATOR = "sensor_statistics_accumulator"
+
+# Length of the periods statistics are compiled for
+PERIOD = datetime.timedelta(minutes=5)
+# Number of finished periods the accumulator keeps until they are compiled
+KEEP_PERIODS = 12
+
 
 def _get_entities(hass: HomeAssistant) -> list[tuple[str, str, str | None]]:
     """Get (entity_id, state_class, device_class) of all sensors for which to compile statistics."""
@@ -123,6 +132,8 @@ def _get_entities(hass: HomeAssistant) -> list[tuple[str, str, str | None]]:
     for state in all_sensors:
         if (state_class := state.attributes.get(ATTR_STATE_CLASS)) not in STATE_CLASSES:
             continue
+        if not is_entity_recorded(hass, state.entity_id):
+            continue
         device_class = state.attributes.get(ATTR_DEVICE_CLASS)
         entity_ids.append((state.entity_id, state_class, device_class))
 
@@ -297,6 +308,323 @@ def _wanted_statistics(
     return wanted_statistics
 
 
+def _period_start(point_in_time: datetime.datetime) -> datetime.datetime:
+    """Return the start of the period a point in time falls in."""
+    minute = point_in_time.minute - point_in_time.minute % 5
+    return point_in_time.replace(minute=minute, second=0, microsecond=0)
+
+
+class _MeanAccumulator:
+    """Running time weighted mean, min and max of a measurement sensor.
+
+    The states are accumulated in the same order and with the same
+    arithmetic as _time_weighted_average, so the result matches the one
+    computed from the recorded history.
+    """
+
+    def __init__(self, device_class: str | None, period: datetime.datetime) -> None:
+        """Initialize the accumulator."""
+        self.device_class = device_class
+        self.period = period
+        # The converted value and unit of the latest state, seeds the next period
+        self.last_value: float | None = None
+        self.last_unit: str | None = None
+        # The statistics of each finished period, None if there were no values
+        self.results: dict[datetime.datetime, tuple[str | None, dict] | None] = {}
+        # The accumulated values of the current period
+        self.value: float | None = None
+        self.since = self.window_start = period
+        self.weighted = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+        self.units: set[str | None] = set()
+        self.irregular = False
+
+    def _start_period(self, value: float | None, unit: str | None) -> None:
+        """Start accumulating the current period."""
+        self.value = None
+        self.since = self.window_start = self.period
+        self.weighted = 0.0
+        self.min = self.max = None
+        self.units = set()
+        self.irregular = False
+        if value is not None:
+            self._include(self.period, value, unit)
+
+    def _include(self, time: datetime.datetime, value: float, unit: str | None) -> None:
+        """Include a numerical value in the current period."""
+        if self.value is None:
+            self.window_start = time
+        else:
+            self.weighted += self.value * (time - self.since).total_seconds()
+        self.value = value
+        self.since = time
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.units.add(unit)
+
+    def _convert(self, state: State) -> tuple[float | None, str | None]:
+        """Return the normalized value and unit of a state."""
+        if not _is_number(state.state):
+            return None, None
+        value = float(state.state)
+        unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        if self.device_class not in UNIT_CONVERSIONS:
+            return value, unit
+        if unit not in UNIT_CONVERSIONS[self.device_class]:
+            # Leave the warning about the unit to the history fallback
+            self.irregular = True
+            return None, None
+        return (
+            UNIT_CONVERSIONS[self.device_class][unit](value),
+            DEVICE_CLASS_UNITS[self.device_class],
+        )
+
+    def roll_to(self, period: datetime.datetime) -> None:
+        """Finish the periods before a period."""
+        while self.period < period:
+            end = self.period + PERIOD
+            if self.irregular or len(self.units) > 1:
+                # Compile from history, which will warn about the units
+                self.results.pop(self.period, None)
+            elif self.value is None:
+                self.results[self.period] = None
+            else:
+                assert self.min is not None and self.max is not None
+                weighted = (
+                    self.weighted + self.value * (end - self.since).total_seconds()
+                )
+                self.results[self.period] = (
+                    next(iter(self.units)),
+                    {
+                        "max": self.max,
+                        "min": self.min,
+                        "mean": weighted / (end - self.window_start).total_seconds(),
+                    },
+                )
+            self.period = end
+            self._start_period(self.last_value, self.last_unit)
+
+        oldest = period - KEEP_PERIODS * PERIOD
+        for result_period in [key for key in self.results if key < oldest]:
+            del self.results[result_period]
+
+    def add(self, state: State) -> None:
+        """Add a state."""
+        if state.last_updated < self.period:
+            # States before the first period only seed it
+            self.last_value, self.last_unit = self._convert(state)
+            self._start_period(self.last_value, self.last_unit)
+            return
+        self.roll_to(_period_start(state.last_updated))
+        value, unit = self._convert(state)
+        self.last_value, self.last_unit = value, unit
+        # Statistics are compiled from significant states only
+        if value is not None and state.last_changed == state.last_updated:
+            self._include(state.last_updated, value, unit)
+
+    def pop(self, start: datetime.datetime) -> tuple[str | None, dict] | None:
+        """Pop the statistics of a finished period, raise KeyError if unknown."""
+        self.roll_to(start + PERIOD)
+        return self.results.pop(start)
+
+
+class _StateBuffer:
+    """The recent states of a sensor with sum statistics.
+
+    Sums depend on the last compiled statistics, so they are computed
+    from the buffered states when the period is compiled.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the buffer."""
+        self.states: list[State] = []
+
+    def add(self, state: State) -> datetime.datetime | None:
+        """Add a state, return the first period still fully buffered."""
+        self.states.append(state)
+        oldest = _period_start(state.last_updated) - KEEP_PERIODS * PERIOD
+        if self.states[0].last_updated >= oldest or len(self.states) < 2:
+            return None
+        # Keep the last state before the oldest period as its start state
+        while len(self.states) > 1 and self.states[1].last_updated < oldest:
+            del self.states[0]
+        return oldest
+
+    def pop(self, start: datetime.datetime, end: datetime.datetime) -> list[State]:
+        """Return the start state and the states of a period."""
+        period_states = []
+        for state in self.states:
+            if state.last_updated >= end:
+                break
+            if state.last_updated < start:
+                period_states = [state]
+            else:
+                period_states.append(state)
+        return period_states
+
+
+class _EntityTracker:
+    """Accumulate the statistics of a sensor."""
+
+    def __init__(
+        self,
+        state_class: str,
+        device_class: str | None,
+        sum_statistics: bool,
+        complete_from: datetime.datetime,
+    ) -> None:
+        """Initialize the tracker."""
+        self.key = (state_class, device_class)
+        self.complete_from = complete_from
+        self.buffer: _StateBuffer | None = None
+        self.mean: _MeanAccumulator | None = None
+        if sum_statistics:
+            self.buffer = _StateBuffer()
+        else:
+            self.mean = _MeanAccumulator(device_class, complete_from)
+        self.last_updated: datetime.datetime | None = None
+
+    def add(self, state: State) -> None:
+        """Add a state."""
+        self.last_updated = state.last_updated
+        if self.buffer is not None:
+            if not isinstance(state.attributes.get(ATTR_LAST_RESET), (str, type(None))):
+                # The recorded last_reset is serialized, which can not be
+                # compared with the native value, skip the periods using it
+                self.complete_from = max(
+                    self.complete_from,
+                    _period_start(state.last_updated) + 2 * PERIOD,
+                )
+            if oldest := self.buffer.add(state):
+                self.complete_from = max(self.complete_from, oldest)
+        else:
+            assert self.mean is not None
+            self.mean.add(state)
+
+
+class StatisticsAccumulator:
+    """Accumulate sensor statistics from the states the recorder records.
+
+    The periodic compile then only has to collect the accumulated
+    statistics instead of loading the history of the period. Entities
+    are only accumulated for periods during which every state they
+    recorded was seen, other periods are compiled from history.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the accumulator."""
+        # States recorded before we started listening are unknown
+        self.complete_from = _period_start(dt_util.utcnow()) + PERIOD
+        self._trackers: dict[str, _EntityTracker] = {}
+        self._lock = threading.Lock()
+
+    def async_add(self, event: Event) -> None:
+        """Add the new state of a state_changed event."""
+        entity_id: str = event.data["entity_id"]
+        new_state: State | None = event.data.get("new_state")
+        with self._lock:
+            if new_state is None or (
+                (state_class := new_state.attributes.get(ATTR_STATE_CLASS))
+                not in STATE_CLASSES
+            ):
+                self._trackers.pop(entity_id, None)
+                return
+
+            device_class = new_state.attributes.get(ATTR_DEVICE_CLASS)
+            tracker = self._trackers.get(entity_id)
+            if (
+                tracker is None
+                or tracker.key != (state_class, device_class)
+                or (
+                    tracker.last_updated is not None
+                    and new_state.last_updated < tracker.last_updated
+                )
+            ):
+                tracker = self._trackers[entity_id] = self._new_tracker(
+                    entity_id, state_class, device_class, event
+                )
+            tracker.add(new_state)
+
+    def _new_tracker(
+        self,
+        entity_id: str,
+        state_class: str,
+        device_class: str | None,
+        event: Event,
+    ) -> _EntityTracker:
+        """Create a tracker starting from the state before the event."""
+        new_state: State = event.data["new_state"]
+        old_state: State | None = event.data.get("old_state")
+        period = _period_start(new_state.last_updated)
+        # The period is only complete if no earlier state of it was missed
+        if old_state is not None and old_state.last_updated >= period:
+            period += PERIOD
+        tracker = _EntityTracker(
+            state_class,
+            device_class,
+            "sum"
+            in _wanted_statistics([(entity_id, state_class, device_class)])[entity_id],
+            max(period, self.complete_from),
+        )
+        if old_state is not None and old_state.last_updated < new_state.last_updated:
+            tracker.add(old_state)
+        return tracker
+
+    def pop_statistics(
+        self,
+        entities: list[tuple[str, str, str | None]],
+        start: datetime.datetime,
+        end: datetime.datetime,
+    ) -> tuple[dict[str, tuple[str | None, dict] | None], dict[str, list[State]]]:
+        """Pop the accumulated statistics of a finished period.
+
+        Returns the mean, min and max statistics by entity_id, None for
+        entities without a numerical state, and the states of entities
+        with sum statistics. Entities missing from both have to be
+        compiled from history.
+        """
+        accumulated: dict[str, tuple[str | None, dict] | None] = {}
+        buffered: dict[str, list[State]] = {}
+        if start != _period_start(start) or end != start + PERIOD:
+            return accumulated, buffered
+        if end > dt_util.utcnow():
+            return accumulated, buffered
+
+        with self._lock:
+            for entity_id, state_class, device_class in entities:
+                tracker = self._trackers.get(entity_id)
+                if (
+                    tracker is None
+                    or tracker.key != (state_class, device_class)
+                    or start < tracker.complete_from
+                ):
+                    continue
+                if tracker.buffer is not None:
+                    buffered[entity_id] = tracker.buffer.pop(start, end)
+                    continue
+                assert tracker.mean is not None
+                try:
+                    accumulated[entity_id] = tracker.mean.pop(start)
+                except KeyError:
+                    continue
+
+        return accumulated, buffered
+
+
+@callback
+def async_record_state_changed(hass: HomeAssistant, event: Event) -> None:
+    """Accumulate the statistics of a sensor state recorded by the recorder."""
+    entity_id = event.data["entity_id"]
+    if not entity_id.startswith(f"{DOMAIN}.") or not is_entity_recorded(
+        hass, entity_id
+    ):
+        return
+    if (accumulator := hass.data.get(DATA_ACCUMULATOR)) is None:
+        accumulator = hass.data[DATA_ACCUMULATOR] = StatisticsAccumulator()
+    accumulator.async_add(event)
+
+
 def compile_statistics(  # noqa: C901
     hass: HomeAssistant, start: datetime.datetime, end: datetime.datetime
 ) -> dict:
@@ -310,19 +638,31 @@ def compile_statistics(  # noqa: C901
 
     wanted_statistics = _wanted_statistics(entities)
 
-    # Get history between start and end
-    entities_full_history = [i[0] for i in entities if "sum" in wanted_statistics[i[0]]]
-    history_list = {}
+    # Use the statistics accumulated while the states were recorded
+    accumulated: dict[str, tuple[str | None, dict] | None] = {}
+    history_list: dict[str, list[State]] = {}
+    if (accumulator := hass.data.get(DATA_ACCUMULATOR)) is not None:
+        accumulated, history_list = accumulator.pop_statistics(entities, start, end)
+
+    # Get history between start and end for the other entities
+    entities_full_history = [
+        i[0]
+        for i in entities
+        if "sum" in wanted_statistics[i[0]] and i[0] not in history_list
+    ]
     if entities_full_history:
-        history_list = history.get_significant_states(  # type: ignore
+        _history_list = history.get_significant_states(  # type: ignore
             hass,
             start - datetime.timedelta.resolution,
             end,
             entity_ids=entities_full_history,
             significant_changes_only=False,
         )
+        history_list = {**history_list, **_history_list}
     entities_significant_history = [
-        i[0] for i in entities if "sum" not in wanted_statistics[i[0]]
+        i[0]
+        for i in entities
+        if "sum" not in wanted_statistics[i[0]] and i[0] not in accumulated
     ]
     if entities_significant_history:
         _history_list = history.get_significant_states(  # type: ignore
@@ -333,18 +673,31 @@ def compile_statistics(  # noqa: C901
         )
         history_list = {**history_list, **_history_list}
 
-    for entity_id, state_class, device_class in entities:
-        if entity_id not in history_list:
-            continue
+    # Load the metadata of all entities at once
+    old_metadatas = statistics.get_metadata_for_statistic_ids(
+        hass,
+        [i[0] for i in entities if i[0] in history_list or accumulated.get(i[0])],
+    )
 
-        entity_history = history_list[entity_id]
-        unit, fstates = _normalize_states(hass, entity_history, device_class, entity_id)
-
-        if not fstates:
+    for entity_id, state_class, device_class in entities:
+        fstates: list[tuple[float, State]] = []
+        if entity_id in accumulated:
+            if (accumulated_stat := accumulated[entity_id]) is None:
+                continue
+            unit, accumulated_mean = accumulated_stat
+        elif entity_id in history_list:
+            entity_history = history_list[entity_id]
+            unit, fstates = _normalize_states(
+                hass, entity_history, device_class, entity_id
+            )
+
+            if not fstates:
+                continue
+        else:
             continue
 
         # Check metadata
-        if old_metadata := statistics.get_metadata(hass, entity_id):
+        if old_metadata := old_metadatas.get(entity_id):
             if old_metadata["unit_of_measurement"] != unit:
                 if WARN_UNSTABLE_UNIT not in hass.data:
                     hass.data[WARN_UNSTABLE_UNIT] = set()
@@ -372,6 +725,12 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: dict = {}
+        if not fstates:
+            # Accumulated entities only have mean, min and max statistics
+            stat.update(accumulated_mean)
+            result[entity_id]["stat"] = stat
+            continue
+
         if "max" in wanted_statistics[entity_id]:
             stat["max"] = max(*itertools.islice(zip(*fstates), 1))
         if "min" in wanted_statistics[entity_id]:
@@ -384,7 +743,7 @@ def compile_statistics(  # noqa: C901
             last_reset = old_last_reset = None
             new_state = old_state = None
             _sum = 0
-            last_stats = statistics.get_last_statistics(hass, 1, entity_id)
+            last_stats = statistics.get_last_short_term_statistics(hass, 1, entity_id)
             if entity_id in last_stats:
                 # We have compiled history for this sensor before, use that as a starting point
                 last_reset = old_last_reset = last_stats[entity_id][0]["last_reset"]
@@ -480,6 +839,9 @@ def compile_statistics(  # noqa: C901
 def list_statistic_ids(hass: HomeAssistant, statistic_type: str | None = None) -> dict:
     """Return statistic_ids and meta data."""
     entities = _get_entities(hass)
+    metadatas = statistics.get_metadata_for_statistic_ids(
+        hass, [entity_id for entity_id, _, _ in entities]
+    )
 
     statistic_ids = {}
 
@@ -502,7 +864,7 @@ def list_statistic_ids(hass: HomeAssistant, statistic_type: str | None = None) -
         ):
             continue
 
-        metadata = statistics.get_metadata(hass, entity_id)
+        metadata = metadatas.get(entity_id)
         if metadata:
             native_unit: str | None = metadata["unit_of_measurement"]
         else:
@@ -0,0 +1,128 @@
+"""Rolling aggregates over the sampling window of a statistics sensor."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+import math
+
+
+class RollingStatistics:
+    """Aggregates of a window of values, updated per added or removed value.
+
+    Values are kept sorted for the order statistics, while the total, mean
+    and sum of squared deviations are updated in place. Those running values
+    are recomputed from the window each time it has been fully replaced, so
+    floating point errors can not build up.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty window."""
+        self._sorted: list[float] = []
+        self._total = 0.0
+        self._mean = 0.0
+        self._sum_squares = 0.0
+        self._removed = 0
+
+    def __len__(self) -> int:
+        """Return the number of values in the window."""
+        return len(self._sorted)
+
+    def add(self, value: float) -> None:
+        """Add a finite value to the window."""
+        if not math.isfinite(value):
+            raise ValueError(f"{value} is not a finite number")
+        insort(self._sorted, value)
+        self._total += value
+        delta = value - self._mean
+        self._mean += delta / len(self._sorted)
+        self._sum_squares += delta * (value - self._mean)
+
+    def remove(self, value: float) -> None:
+        """Remove a value which was added before from the window."""
+        idx = bisect_left(self._sorted, value)
+        if idx == len(self._sorted) or self._sorted[idx] != value:
+            raise ValueError(f"{value} is not in the window")
+        del self._sorted[idx]
+        count = len(self._sorted)
+        self._removed += 1
+        if self._removed >= count:
+            self._recompute()
+            return
+
+        self._total -= value
+        delta = value - self._mean
+        self._mean -= delta / count
+        self._sum_squares -= delta * (value - self._mean)
+
+    def _recompute(self) -> None:
+        """Recompute the running values from the window."""
+        self._removed = 0
+        self._total = math.fsum(self._sorted)
+        if not self._sorted:
+            self._mean = self._sum_squares = 0.0
+            return
+        self._mean = self._total / len(self._sorted)
+        self._sum_squares = math.fsum(
+            (value - self._mean) ** 2 for value in self._sorted
+        )
+
+    @property
+    def total(self) -> float:
+        """Return the sum of the values."""
+        return self._total
+
+    @property
+    def min(self) -> float:
+        """Return the smallest value."""
+        return self._sorted[0]
+
+    @property
+    def max(self) -> float:
+        """Return the largest value."""
+        return self._sorted[-1]
+
+    @property
+    def mean(self) -> float:
+        """Return the mean, requires at least one value."""
+        return self._total / len(self._sorted)
+
+    @property
+    def median(self) -> float:
+        """Return the median, requires at least one value."""
+        count = len(self._sorted)
+        middle = count // 2
+        if count % 2:
+            return self._sorted[middle]
+        return (self._sorted[middle - 1] + self._sorted[middle]) / 2
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, requires at least two values."""
+        return max(self._sum_squares, 0.0) / (len(self._sorted) - 1)
+
+    @property
+    def stdev(self) -> float:
+        """Return the sample standard deviation, requires at least two values."""
+        return math.sqrt(self.variance)
+
+    def quantiles(self, intervals: int, method: str) -> list[float]:
+        """Return the cut points like statistics.quantiles does."""
+        data = self._sorted
+        count = len(data)
+        result = []
+        if method == "inclusive":
+            scale = count - 1
+            for i in range(1, intervals):
+                j, delta = divmod(i * scale, intervals)
+                result.append(
+                    (data[j] * (intervals - delta) + data[j + 1] * delta) / intervals
+                )
+            return result
+
+        scale = count + 1
+        for i in range(1, intervals):
+            j = min(max(i * scale // intervals, 1), count - 1)
+            delta = i * scale - j * intervals
+            result.append(
+                (data[j - 1] * (intervals - delta) + data[j] * delta) / intervals
+            )
+        return result
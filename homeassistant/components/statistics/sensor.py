@@ -1,12 +1,12 @@
 """Support for statistics for sensor values."""
 from collections import deque
 import logging
-import statistics
+import math
 
 import voluptuous as vol
 
-from homeassistant.components.recorder.models import States
-from homeassistant.components.recorder.util import execute, session_scope
+from homeassistant.components.recorder.models import States, process_timestamp
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.sensor import PLATFORM_SCHEMA, SensorEntity
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
@@ -26,6 +26,7 @@ from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.util import dt as dt_util
 
 from . import DOMAIN, PLATFORMS
+from .rolling import RollingStatistics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -133,6 +134,7 @@ class StatisticsSensor(SensorEntity):
         self._unit_of_measurement = None
         self.states = deque(maxlen=self._sampling_size)
         self.ages = deque(maxlen=self._sampling_size)
+        self._statistics = RollingStatistics()
 
         self.count = 0
         self.mean = self.median = self.quantiles = self.stdev = self.variance = None
@@ -183,19 +185,31 @@ class StatisticsSensor(SensorEntity):
         if new_state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
             return
 
-        try:
-            if self.is_binary:
-                self.states.append(new_state.state)
-            else:
-                self.states.append(float(new_state.state))
+        self._add_value(new_state.state, new_state.last_updated)
+
+    def _add_value(self, state, last_updated):
+        """Add a state value and the time it was last updated to the queue."""
+        if self.is_binary:
+            value = state
+        else:
+            try:
+                value = float(state)
+            except ValueError:
+                value = None
+            if value is None or not math.isfinite(value):
+                _LOGGER.error(
+                    "%s: parsing error, expected number and received %s",
+                    self.entity_id,
+                    state,
+                )
+                return
 
-            self.ages.append(new_state.last_updated)
-        except ValueError:
-            _LOGGER.error(
-                "%s: parsing error, expected number and received %s",
-                self.entity_id,
-                new_state.state,
-            )
+            if len(self.states) == self._sampling_size:
+                self._statistics.remove(self.states[0])
+            self._statistics.add(value)
+
+        self.states.append(value)
+        self.ages.append(last_updated)
 
     @property
     def name(self):
@@ -263,7 +277,9 @@ class StatisticsSensor(SensorEntity):
                 (now - self.ages[0]),
             )
             self.ages.popleft()
-            self.states.popleft()
+            value = self.states.popleft()
+            if not self.is_binary:
+                self._statistics.remove(value)
 
     def _next_to_purge_timestamp(self):
         """Find the timestamp when the next purge would occur."""
@@ -283,33 +299,32 @@ class StatisticsSensor(SensorEntity):
         self.count = len(self.states)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            stats = self._statistics
+            if self.count:
+                self.mean = round(stats.mean, self._precision)
+                self.median = round(stats.median, self._precision)
+            else:
+                _LOGGER.debug("%s: no data points", self.entity_id)
                 self.mean = self.median = STATE_UNKNOWN
 
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
+            if self.count > 1:
+                self.stdev = round(stats.stdev, self._precision)
+                self.variance = round(stats.variance, self._precision)
                 if self._quantile_intervals < self.count:
                     self.quantiles = [
                         round(quantile, self._precision)
-                        for quantile in statistics.quantiles(
-                            self.states,
-                            n=self._quantile_intervals,
-                            method=self._quantile_method,
+                        for quantile in stats.quantiles(
+                            self._quantile_intervals, self._quantile_method
                         )
                     ]
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            else:
+                _LOGGER.debug("%s: less than two data points", self.entity_id)
                 self.stdev = self.variance = self.quantiles = STATE_UNKNOWN
 
             if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+                self.total = round(stats.total, self._precision)
+                self.min = round(stats.min, self._precision)
+                self.max = round(stats.max, self._precision)
 
                 self.min_age = self.ages[0]
                 self.max_age = self.ages[-1]
@@ -357,7 +372,20 @@ class StatisticsSensor(SensorEntity):
             )
 
     async def _async_initialize_from_database(self):
-        """Initialize the list of states from the database.
+        """Initialize the list of states from the database."""
+        _LOGGER.debug("%s: initializing values from the database", self.entity_id)
+
+        rows = await self.hass.async_add_executor_job(self._fetch_states_from_database)
+        for state, last_updated in reversed(rows):
+            if state not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+                self._add_value(state, process_timestamp(last_updated))
+
+        self.async_schedule_update_ha_state(True)
+
+        _LOGGER.debug("%s: initializing from database completed", self.entity_id)
+
+    def _fetch_states_from_database(self):
+        """Fetch the state values and update times in one query.
 
         The query will get the list of states in DESCENDING order so that we
         can limit the result to self._sample_size. Afterwards reverse the
@@ -366,11 +394,8 @@ class StatisticsSensor(SensorEntity):
         If MaxAge is provided then query will restrict to entries younger then
         current datetime - MaxAge.
         """
-
-        _LOGGER.debug("%s: initializing values from the database", self.entity_id)
-
-        with session_scope(hass=self.hass) as session:
-            query = session.query(States).filter(
+        with session_scope(hass=self.hass, read_only=True) as session:
+            query = session.query(States.state, States.last_updated).filter(
                 States.entity_id == self._entity_id.lower()
             )
 
@@ -388,11 +413,4 @@ class StatisticsSensor(SensorEntity):
             query = query.order_by(States.last_updated.desc()).limit(
                 self._sampling_size
             )
-            states = execute(query, to_native=True, validate_entity_ids=False)
-
-        for state in reversed(states):
-            self._add_state_to_queue(state)
-
-        self.async_schedule_update_ha_state(True)
-
-        _LOGGER.debug("%s: initializing from database completed", self.entity_id)
+            return query.all()
@@ -28,7 +28,11 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.service import async_get_all_descriptions
-from homeassistant.loader import IntegrationNotFound, async_get_integration
+from homeassistant.loader import (
+    DATA_IMPORT_TIME,
+    IntegrationNotFound,
+    async_get_integration,
+)
 from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
 
 from . import const, decorators, messages
@@ -238,7 +242,12 @@ def handle_get_states(
             if entity_perm(state.entity_id, "read")
         ]
 
-    connection.send_message(messages.result_message(msg["id"], states))
+    try:
+        states_json = f'[{",".join(state.as_dict_json() for state in states)}]'
+    except (ValueError, TypeError):
+        connection.send_message(messages.result_message(msg["id"], states))
+        return
+    connection.send_message(messages.result_message_json(msg["id"], states_json))
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -296,10 +305,17 @@ async def handle_integration_setup_info(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle integrations command."""
+    import_time = hass.data.get(DATA_IMPORT_TIME, {})
     connection.send_result(
         msg["id"],
         [
-            {"domain": integration, "seconds": timedelta.total_seconds()}
+            {
+                "domain": integration,
+                "seconds": timedelta.total_seconds(),
+                "import_seconds": import_time[integration].total_seconds()
+                if integration in import_time
+                else None,
+            }
             for integration, timedelta in hass.data[DATA_SETUP_TIME].items()
         ],
     )
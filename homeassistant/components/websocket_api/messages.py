@@ -71,7 +71,20 @@ def _cached_event_message(event: Event) -> str:
     The IDEN_TEMPLATE is used which will be replaced
     with the actual iden in cached_event_message
     """
-    return message_to_json(event_message(IDEN_TEMPLATE, event))
+    try:
+        event_json = event.as_dict_json()
+    except (ValueError, TypeError):
+        # Let message_to_json log the bad data and return an error
+        return message_to_json(event_message(IDEN_TEMPLATE, event))
+    return f'{{"id":{IDEN_JSON_TEMPLATE},"type":"event","event":{event_json}}}'
+
+
+def result_message_json(iden: int, result_json: str) -> str:
+    """Return a success result message with an already serialized result."""
+    return (
+        f'{{"id":{iden},"type":"{const.TYPE_RESULT}","success":true,'
+        f'"result":{result_json}}}'
+    )
 
 
 def message_to_json(message: dict[str, Any]) -> str:
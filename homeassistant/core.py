@@ -28,6 +28,7 @@ import yarl
 from homeassistant import block_async_io, loader, util
 from homeassistant.const import (
     ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_NOW,
     ATTR_SECONDS,
@@ -60,6 +61,7 @@ from homeassistant.exceptions import (
     ServiceNotFound,
     Unauthorized,
 )
+from homeassistant.helpers.json import json_dumps
 from homeassistant.util import location
 from homeassistant.util.async_ import (
     fire_coroutine_threadsafe,
@@ -111,6 +113,9 @@ SOURCE_YAML = "yaml"
 # How long to wait until things that run on startup have to finish.
 TIMEOUT_EVENT_START = 15
 
+# Events that are not sent to listeners of all events
+EVENTS_EXCLUDED_FROM_MATCH_ALL = {EVENT_HOMEASSISTANT_CLOSE, EVENT_TIME_CHANGED}
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -602,7 +607,14 @@ class EventOrigin(enum.Enum):
 class Event:
     """Representation of an event within the bus."""
 
-    __slots__ = ["event_type", "data", "origin", "time_fired", "context"]
+    __slots__ = [
+        "event_type",
+        "data",
+        "origin",
+        "time_fired",
+        "context",
+        "_as_dict_json",
+    ]
 
     def __init__(
         self,
@@ -618,6 +630,7 @@ class Event:
         self.origin = origin
         self.time_fired = time_fired or dt_util.utcnow()
         self.context: Context = context or Context()
+        self._as_dict_json: str | None = None
 
     def __hash__(self) -> int:
         """Make hashable."""
@@ -637,6 +650,22 @@ class Event:
             "context": self.context.as_dict(),
         }
 
+    def as_dict_json(self) -> str:
+        """Return a compact JSON representation of this Event.
+
+        The JSON is only computed once and states in the event data
+        reuse their own JSON representation. Async friendly.
+        """
+        if self._as_dict_json is None:
+            self._as_dict_json = (
+                f'{{"event_type":{json_dumps(self.event_type)},'
+                f'"data":{_event_data_json(self.data)},'
+                f'"origin":{json_dumps(str(self.origin.value))},'
+                f'"time_fired":{json_dumps(self.time_fired.isoformat())},'
+                f'"context":{json_dumps(self.context.as_dict())}}}'
+            )
+        return self._as_dict_json
+
     def __repr__(self) -> str:
         """Return the representation."""
         if self.data:
@@ -656,12 +685,29 @@ class Event:
         )
 
 
+def _event_data_json(data: dict[str, Any]) -> str:
+    """Serialize event data, reusing the JSON of the states it contains."""
+    if not any(isinstance(value, State) for value in data.values()) or not all(
+        isinstance(key, str) for key in data
+    ):
+        return json_dumps(data)
+    items = ",".join(
+        f"{json_dumps(key)}:"
+        f"{value.as_dict_json() if isinstance(value, State) else json_dumps(value)}"
+        for key, value in data.items()
+    )
+    return f"{{{items}}}"
+
+
 class EventBus:
     """Allow the firing of and listening for events."""
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[tuple[HassJob, Callable | None]]] = {}
+        self._entity_listeners: dict[
+            tuple[str, str], list[tuple[HassJob, Callable | None]]
+        ] = {}
         self._hass = hass
 
     @callback
@@ -670,7 +716,26 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        counts = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for (event_type, _), listeners in self._entity_listeners.items():
+            counts[event_type] = counts.get(event_type, 0) + len(listeners)
+        return counts
+
+    @callback
+    def async_has_listeners(self, event_type: str) -> bool:
+        """Return if firing an event of the type would reach any listener.
+
+        This method must be run in the event loop.
+        """
+        if self._listeners.get(event_type):
+            return True
+        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL and self._listeners.get(
+            MATCH_ALL
+        ):
+            return True
+        return any(
+            listener_type == event_type for listener_type, _ in self._entity_listeners
+        )
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -707,30 +772,45 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
+        listener_groups: list[list[tuple[HassJob, Callable | None]]] = []
 
-        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
+        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners and
+        # EVENT_TIME_CHANGED, fired every second, only to its own listeners
         match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+        if (
+            match_all_listeners is not None
+            and event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL
+        ):
+            listener_groups.append(match_all_listeners)
+
+        listeners = self._listeners.get(event_type)
+        if listeners is not None:
+            listener_groups.append(listeners)
+
+        # Listeners registered for a single entity_id are found with a
+        # dict lookup instead of filtering every event
+        if self._entity_listeners and event_data:
+            entity_id = event_data.get(ATTR_ENTITY_ID)
+            if isinstance(entity_id, str):
+                entity_listeners = self._entity_listeners.get((event_type, entity_id))
+                if entity_listeners is not None:
+                    listener_groups.append(entity_listeners)
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if event_type != EVENT_TIME_CHANGED:
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners:
-            return
-
-        for job, event_filter in listeners:
-            if event_filter is not None:
-                try:
-                    if not event_filter(event):
+        for listeners in listener_groups:
+            for job, event_filter in listeners:
+                if event_filter is not None:
+                    try:
+                        if not event_filter(event):
+                            continue
+                    except Exception:  # pylint: disable=broad-except
+                        _LOGGER.exception("Error in event filter")
                         continue
-                except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception("Error in event filter")
-                    continue
-            self._hass.async_add_hass_job(job, event)
+                self._hass.async_add_hass_job(job, event)
 
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
@@ -754,6 +834,7 @@ class EventBus:
         event_type: str,
         listener: Callable,
         event_filter: Callable | None = None,
+        entity_id: str | None = None,
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -764,13 +845,32 @@ class EventBus:
         @callback that returns a boolean value, determines if the
         listener callable should run.
 
+        An optional entity_id limits the listener to events of event_type
+        whose entity_id data matches. These listeners are looked up by
+        key when an event fires, so they do not cost anything for events
+        of other entities.
+
         This method must be run in the event loop.
         """
         if event_filter is not None and not is_callback(event_filter):
             raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
-        return self._async_listen_filterable_job(
-            event_type, (HassJob(listener), event_filter)
-        )
+        filterable_job = (HassJob(listener), event_filter)
+        if entity_id is None:
+            return self._async_listen_filterable_job(event_type, filterable_job)
+
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError(
+                "Listening to all events for a single entity_id is not supported"
+            )
+
+        key = (event_type, entity_id.lower())
+        self._entity_listeners.setdefault(key, []).append(filterable_job)
+
+        def remove_entity_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_entity_listener(key, filterable_job)
+
+        return remove_entity_listener
 
     @callback
     def _async_listen_filterable_job(
@@ -858,6 +958,25 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_entity_listener(
+        self, key: tuple[str, str], filterable_job: tuple[HassJob, Callable | None]
+    ) -> None:
+        """Remove a listener of a specific event_type and entity_id.
+
+        This method must be run in the event loop.
+        """
+        try:
+            self._entity_listeners[key].remove(filterable_job)
+
+            # delete key list if empty
+            if not self._entity_listeners[key]:
+                self._entity_listeners.pop(key)
+        except (KeyError, ValueError):
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+
 
 class State:
     """Object to represent a state within the state machine.
@@ -882,6 +1001,8 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_dict_json",
+        "_attributes_json",
     ]
 
     def __init__(
@@ -917,6 +1038,8 @@ class State:
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: dict[str, Collection[Any]] | None = None
+        self._as_dict_json: str | None = None
+        self._attributes_json: str | None = None
 
     @property
     def name(self) -> str:
@@ -949,6 +1072,35 @@ class State:
             }
         return self._as_dict
 
+    def as_dict_json(self) -> str:
+        """Return a compact JSON representation of the State.
+
+        Async friendly.
+
+        The JSON is only computed once, so it can be shared by everything
+        that sends or stores this state.
+        """
+        if self._as_dict_json is None:
+            as_dict = self.as_dict()
+            self._as_dict_json = (
+                f'{{"entity_id":{json_dumps(self.entity_id)},'
+                f'"state":{json_dumps(self.state)},'
+                f'"attributes":{self.attributes_json()},'
+                f'"last_changed":{json_dumps(as_dict["last_changed"])},'
+                f'"last_updated":{json_dumps(as_dict["last_updated"])},'
+                f'"context":{json_dumps(as_dict["context"])}}}'
+            )
+        return self._as_dict_json
+
+    def attributes_json(self) -> str:
+        """Return a compact JSON representation of the attributes.
+
+        Async friendly.
+        """
+        if self._attributes_json is None:
+            self._attributes_json = json_dumps(dict(self.attributes))
+        return self._attributes_json
+
     @classmethod
     def from_dict(cls, json_dict: dict) -> Any:
         """Initialize a state from a dict.
@@ -1786,9 +1938,15 @@ def _async_create_timer(hass: HomeAssistant) -> None:
         """Fire next time event."""
         now = dt_util.utcnow()
 
-        hass.bus.async_fire(
-            EVENT_TIME_CHANGED, {ATTR_NOW: now}, time_fired=now, context=timer_context
-        )
+        # The time trackers of the event helpers are scheduled on the event
+        # loop, the event is only fired for those listening to it directly
+        if hass.bus.async_has_listeners(EVENT_TIME_CHANGED):
+            hass.bus.async_fire(
+                EVENT_TIME_CHANGED,
+                {ATTR_NOW: now},
+                time_fired=now,
+                context=timer_context,
+            )
 
         # If we are more than a second late, a tick was missed
         late = monotonic() - target
@@ -47,6 +47,8 @@ ORPHANED_DEVICE_KEEP_SECONDS = 86400 * 30
 class _DeviceIndex(NamedTuple):
     identifiers: dict[tuple[str, str], str]
     connections: dict[tuple[str, str], str]
+    config_entries: dict[str, dict[str, None]]
+    areas: dict[str, dict[str, None]]
 
 
 @attr.s(slots=True, frozen=True)
@@ -218,18 +220,30 @@ class DeviceRegistry:
 
         _remove_device_from_index(devices_index, device)
 
-    def _update_device(self, old_device: DeviceEntry, new_device: DeviceEntry) -> None:
+    def _update_device(
+        self,
+        old_device: DeviceEntry | DeletedDeviceEntry,
+        new_device: DeviceEntry | DeletedDeviceEntry,
+    ) -> None:
         """Update a device and the index."""
-        self.devices[new_device.id] = new_device
+        if isinstance(new_device, DeletedDeviceEntry):
+            devices_index = self._deleted_index
+            self.deleted_devices[new_device.id] = new_device
+        else:
+            devices_index = self._registered_index
+            self.devices[new_device.id] = new_device
 
-        devices_index = self._registered_index
         _remove_device_from_index(devices_index, old_device)
         _add_device_to_index(devices_index, new_device)
 
     def _clear_index(self) -> None:
         """Clear the index."""
-        self._registered_index = _DeviceIndex(identifiers={}, connections={})
-        self._deleted_index = _DeviceIndex(identifiers={}, connections={})
+        self._registered_index = _DeviceIndex(
+            identifiers={}, connections={}, config_entries={}, areas={}
+        )
+        self._deleted_index = _DeviceIndex(
+            identifiers={}, connections={}, config_entries={}, areas={}
+        )
 
     def _rebuild_index(self) -> None:
         """Create the index after loading devices."""
@@ -574,23 +588,30 @@ class DeviceRegistry:
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for device in list(self.devices.values()):
-            self._async_update_device(device.id, remove_config_entry_id=config_entry_id)
-        for deleted_device in list(self.deleted_devices.values()):
+        for device_id in list(
+            self._registered_index.config_entries.get(config_entry_id, ())
+        ):
+            self._async_update_device(device_id, remove_config_entry_id=config_entry_id)
+        for device_id in list(
+            self._deleted_index.config_entries.get(config_entry_id, ())
+        ):
+            deleted_device = self.deleted_devices[device_id]
             config_entries = deleted_device.config_entries
-            if config_entry_id not in config_entries:
-                continue
             if config_entries == {config_entry_id}:
                 # Add a time stamp when the deleted device became orphaned
-                self.deleted_devices[deleted_device.id] = attr.evolve(
-                    deleted_device, orphaned_timestamp=now_time, config_entries=set()
+                self._update_device(
+                    deleted_device,
+                    attr.evolve(
+                        deleted_device,
+                        orphaned_timestamp=now_time,
+                        config_entries=set(),
+                    ),
                 )
             else:
                 config_entries = config_entries - {config_entry_id}
-                # No need to reindex here since we currently
-                # do not have a lookup by config entry
-                self.deleted_devices[deleted_device.id] = attr.evolve(
-                    deleted_device, config_entries=config_entries
+                self._update_device(
+                    deleted_device,
+                    attr.evolve(deleted_device, config_entries=config_entries),
                 )
             self.async_schedule_save()
 
@@ -615,9 +636,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self._async_update_device(dev_id, area_id=None)
+        for dev_id in list(self._registered_index.areas.get(area_id, ())):
+            self._async_update_device(dev_id, area_id=None)
 
 
 @callback
@@ -645,7 +665,10 @@ async def async_get_registry(hass: HomeAssistant) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return [
+        registry.devices[device_id]
+        for device_id in registry._registered_index.areas.get(area_id, ())
+    ]
 
 
 @callback
@@ -654,9 +677,10 @@ def async_entries_for_config_entry(
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
     return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
+        registry.devices[device_id]
+        for device_id in registry._registered_index.config_entries.get(
+            config_entry_id, ()
+        )
     ]
 
 
@@ -803,6 +827,10 @@ def _add_device_to_index(
         devices_index.identifiers[identifier] = device.id
     for connection in device.connections:
         devices_index.connections[connection] = device.id
+    for config_entry_id in device.config_entries:
+        devices_index.config_entries.setdefault(config_entry_id, {})[device.id] = None
+    if isinstance(device, DeviceEntry) and device.area_id is not None:
+        devices_index.areas.setdefault(device.area_id, {})[device.id] = None
 
 
 def _remove_device_from_index(
@@ -816,3 +844,19 @@ def _remove_device_from_index(
     for connection in device.connections:
         if connection in devices_index.connections:
             del devices_index.connections[connection]
+    for config_entry_id in device.config_entries:
+        _remove_from_secondary_index(
+            devices_index.config_entries, config_entry_id, device.id
+        )
+    if isinstance(device, DeviceEntry) and device.area_id is not None:
+        _remove_from_secondary_index(devices_index.areas, device.area_id, device.id)
+
+
+def _remove_from_secondary_index(
+    index: dict[str, dict[str, None]], key: str, device_id: str
+) -> None:
+    """Remove a device id from a secondary index."""
+    device_ids = index[key]
+    del device_ids[device_id]
+    if not device_ids:
+        del index[key]
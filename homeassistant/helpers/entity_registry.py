@@ -154,6 +154,9 @@ class EntityRegistry:
         self.hass = hass
         self.entities: dict[str, RegistryEntry]
         self._index: dict[tuple[str, str, str], str] = {}
+        self._device_index: dict[str, dict[str, RegistryEntry]] = {}
+        self._area_index: dict[str, dict[str, RegistryEntry]] = {}
+        self._config_entry_index: dict[str, dict[str, RegistryEntry]] = {}
         self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
@@ -562,19 +565,14 @@ class EntityRegistry:
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
+        for entity_id in list(self._config_entry_index.get(config_entry, ())):
             self.async_remove(entity_id)
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self._async_update_entity(entity_id, area_id=None)
+        for entity_id in list(self._area_index.get(area_id, ())):
+            self._async_update_entity(entity_id, area_id=None)
 
     def _register_entry(self, entry: RegistryEntry) -> None:
         self.entities[entry.entity_id] = entry
@@ -582,6 +580,8 @@ class EntityRegistry:
 
     def _add_index(self, entry: RegistryEntry) -> None:
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        for index, key in self._secondary_indexes(entry):
+            index.setdefault(key, {})[entry.entity_id] = entry
 
     def _unregister_entry(self, entry: RegistryEntry) -> None:
         self._remove_index(entry)
@@ -589,9 +589,29 @@ class EntityRegistry:
 
     def _remove_index(self, entry: RegistryEntry) -> None:
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        for index, key in self._secondary_indexes(entry):
+            entries = index[key]
+            del entries[entry.entity_id]
+            if not entries:
+                del index[key]
+
+    def _secondary_indexes(
+        self, entry: RegistryEntry
+    ) -> Iterable[tuple[dict[str, dict[str, RegistryEntry]], str]]:
+        """Return the secondary indexes an entry belongs in, with its key."""
+        for index, key in (
+            (self._device_index, entry.device_id),
+            (self._area_index, entry.area_id),
+            (self._config_entry_index, entry.config_entry_id),
+        ):
+            if key is not None:
+                yield index, key
 
     def _rebuild_index(self) -> None:
         self._index = {}
+        self._device_index = {}
+        self._area_index = {}
+        self._config_entry_index = {}
         for entry in self.entities.values():
             self._add_index(entry)
 
@@ -625,9 +645,8 @@ def async_entries_for_device(
     """Return entries that match a device."""
     return [
         entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
+        for entry in registry._device_index.get(device_id, {}).values()
+        if not entry.disabled_by or include_disabled_entities
     ]
 
 
@@ -636,7 +655,7 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return list(registry._area_index.get(area_id, {}).values())
 
 
 @callback
@@ -644,11 +663,7 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return list(registry._config_entry_index.get(config_entry_id, {}).values())
 
 
 @callback
@@ -15,10 +15,8 @@ import attr
 
 from homeassistant.const import (
     ATTR_ENTITY_ID,
-    ATTR_NOW,
     EVENT_CORE_CONFIG_UPDATE,
     EVENT_STATE_CHANGED,
-    EVENT_TIME_CHANGED,
     MATCH_ALL,
     SUN_EVENT_SUNRISE,
     SUN_EVENT_SUNSET,
@@ -54,6 +52,9 @@ TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
+TRACK_TIME_TICK_CALLBACKS = "track_time_tick_callbacks"
+TRACK_TIME_TICK_LISTENER = "track_time_tick_listener"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -243,53 +244,34 @@ def async_track_state_change_event(
     In order to avoid having to iterate a long list
     of EVENT_STATE_CHANGED and fire and create a job
     for each one, we keep a dict of entity ids that
-    care about the state change events so we can
-    do a fast dict lookup to route events.
+    care about the state change events and listen for
+    each of them on the event bus, which routes events
+    with a fast dict lookup.
     """
     entity_ids = _async_string_to_lower_list(entity_ids)
     if not entity_ids:
         return _remove_empty_listener
 
     entity_callbacks = hass.data.setdefault(TRACK_STATE_CHANGE_CALLBACKS, {})
-
-    if TRACK_STATE_CHANGE_LISTENER not in hass.data:
-
-        @callback
-        def _async_state_change_filter(event: Event) -> bool:
-            """Filter state changes by entity_id."""
-            return event.data.get("entity_id") in entity_callbacks
-
-        @callback
-        def _async_state_change_dispatcher(event: Event) -> None:
-            """Dispatch state changes by entity_id."""
-            entity_id = event.data.get("entity_id")
-
-            if entity_id not in entity_callbacks:
-                return
-
-            for job in entity_callbacks[entity_id][:]:
-                try:
-                    hass.async_run_hass_job(job, event)
-                except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception(
-                        "Error while processing state change for %s", entity_id
-                    )
-
-        hass.data[TRACK_STATE_CHANGE_LISTENER] = hass.bus.async_listen(
-            EVENT_STATE_CHANGED,
-            _async_state_change_dispatcher,
-            event_filter=_async_state_change_filter,
-        )
+    entity_listeners = hass.data.setdefault(TRACK_STATE_CHANGE_LISTENER, {})
 
     job = HassJob(action)
 
     for entity_id in entity_ids:
+        if entity_id not in entity_callbacks:
+            # The event bus looks up listeners keyed by entity_id, so the
+            # other state changes never reach the dispatcher
+            entity_listeners[entity_id] = hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                ft.partial(_async_dispatch_entity_id_event, hass, entity_callbacks),
+                entity_id=entity_id,
+            )
         entity_callbacks.setdefault(entity_id, []).append(job)
 
     @callback
     def remove_listener() -> None:
         """Remove state change listener."""
-        _async_remove_indexed_listeners(
+        _async_remove_entity_id_listeners(
             hass,
             TRACK_STATE_CHANGE_CALLBACKS,
             TRACK_STATE_CHANGE_LISTENER,
@@ -300,6 +282,42 @@ def async_track_state_change_event(
     return remove_listener
 
 
+@callback
+def _async_dispatch_entity_id_event(
+    hass: HomeAssistant, callbacks: dict[str, list[HassJob]], event: Event
+) -> None:
+    """Dispatch an event to the jobs of its entity_id."""
+    entity_id = event.data["entity_id"]
+
+    if entity_id not in callbacks:
+        return
+
+    for job in callbacks[entity_id][:]:
+        try:
+            hass.async_run_hass_job(job, event)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error while processing state change for %s", entity_id)
+
+
+@callback
+def _async_remove_entity_id_listeners(
+    hass: HomeAssistant,
+    data_key: str,
+    listener_key: str,
+    storage_keys: Iterable[str],
+    job: HassJob,
+) -> None:
+    """Remove a listener and the bus listeners of entity_ids left without jobs."""
+    callbacks = hass.data[data_key]
+    listeners = hass.data[listener_key]
+
+    for storage_key in storage_keys:
+        callbacks[storage_key].remove(job)
+        if len(callbacks[storage_key]) == 0:
+            del callbacks[storage_key]
+            listeners.pop(storage_key)()
+
+
 @callback
 def _remove_empty_listener() -> None:
     """Remove a listener that does nothing."""
@@ -1373,13 +1391,15 @@ def async_track_utc_time_change(
     # We do not have to wrap the function with time pattern matching logic
     # if no pattern given
     if all(val is None for val in (hour, minute, second)):
+        if not local:
+            return _async_track_time_tick(hass, job)
 
         @callback
-        def time_change_listener(event: Event) -> None:
-            """Fire every time event that comes in."""
-            hass.async_run_hass_job(job, event.data[ATTR_NOW])
+        def local_time_tick_listener(now: datetime) -> None:
+            """Fire every second with the local time."""
+            hass.async_run_hass_job(job, dt_util.as_local(now))
 
-        return hass.bus.async_listen(EVENT_TIME_CHANGED, time_change_listener)
+        return _async_track_time_tick(hass, HassJob(local_time_tick_listener))
 
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
@@ -1424,6 +1444,53 @@ def async_track_utc_time_change(
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
 
 
+@callback
+def _async_track_time_tick(hass: HomeAssistant, job: HassJob) -> CALLBACK_TYPE:
+    """Run a job at the start of every second.
+
+    All jobs share one callback scheduled on the event loop, instead of
+    each job scheduling its own or listening to every time event.
+    """
+    tick_callbacks: list[HassJob] = hass.data.setdefault(TRACK_TIME_TICK_CALLBACKS, [])
+
+    if TRACK_TIME_TICK_LISTENER not in hass.data:
+
+        @callback
+        def _async_time_tick(_: datetime) -> None:
+            """Run the jobs and schedule the next tick."""
+            now = time_tracker_utcnow()
+            hass.data[TRACK_TIME_TICK_LISTENER] = async_track_point_in_utc_time(
+                hass,
+                _async_time_tick,
+                now.replace(microsecond=0) + timedelta(seconds=1),
+            )
+            for tick_job in tick_callbacks[:]:
+                try:
+                    hass.async_run_hass_job(tick_job, now)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error while processing time tick")
+
+        hass.data[TRACK_TIME_TICK_LISTENER] = async_track_point_in_utc_time(
+            hass,
+            _async_time_tick,
+            dt_util.utcnow().replace(microsecond=0) + timedelta(seconds=1),
+        )
+
+    tick_callbacks.append(job)
+
+    @callback
+    def remove_listener() -> None:
+        """Remove the job from the time tick."""
+        if job not in tick_callbacks:
+            return
+        tick_callbacks.remove(job)
+        if not tick_callbacks:
+            hass.data.pop(TRACK_TIME_TICK_LISTENER)()
+            del hass.data[TRACK_TIME_TICK_CALLBACKS]
+
+    return remove_listener
+
+
 @callback
 @bind_hass
 def async_track_time_change(
@@ -1502,19 +1569,39 @@ def _render_infos_to_track_states(render_infos: Iterable[RenderInfo]) -> TrackSt
 def _event_triggers_rerender(event: Event, info: RenderInfo) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = cast(str, event.data.get(ATTR_ENTITY_ID))
+    new_state = event.data.get("new_state")
+    old_state = event.data.get("old_state")
 
     if info.filter(entity_id):
-        return True
+        return (
+            new_state is None
+            or old_state is None
+            or _state_change_read_by_template(entity_id, new_state, old_state, info)
+        )
 
-    if (
-        event.data.get("new_state") is not None
-        and event.data.get("old_state") is not None
-    ):
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
 
 
+@callback
+def _state_change_read_by_template(
+    entity_id: str, new_state: State, old_state: State, info: RenderInfo
+) -> bool:
+    """Determine if a state change touches a field the template has read."""
+    attributes = info.entity_attributes.get(entity_id)
+    if attributes is None:
+        return True
+
+    if entity_id in info.entity_states and new_state.state != old_state.state:
+        return True
+
+    new_attributes = new_state.attributes
+    old_attributes = old_state.attributes
+    return any(new_attributes.get(key) != old_attributes.get(key) for key in attributes)
+
+
 @callback
 def _rate_limit_for_event(
     event: Event, info: RenderInfo, track_template_: TrackTemplate
@@ -1,7 +1,15 @@
 """Helpers to help with encoding Home Assistant objects in JSON."""
+from __future__ import annotations
+
 from datetime import datetime, timedelta
 import json
-from typing import Any
+import math
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 
 class JSONEncoder(json.JSONEncoder):
@@ -22,6 +30,85 @@ class JSONEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, o)
 
 
+def json_encoder_default(obj: Any) -> Any:
+    """Convert Home Assistant objects for the native JSON encoder.
+
+    Datetimes are handled by the encoder itself.
+    Raises TypeError for other objects.
+    """
+    if isinstance(obj, (set, tuple)):
+        return list(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    raise TypeError
+
+
+def _finite(obj: Any) -> Any:
+    """Replace NaN and infinity with None, as orjson dumps them as null."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple, set)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+class _FiniteJSONEncoder(JSONEncoder):
+    """JSONEncoder that also replaces NaN and infinity in converted objects."""
+
+    def default(self, o: Any) -> Any:
+        """Convert Home Assistant objects without NaN and infinity."""
+        return _finite(super().default(o))
+
+
+def _json_dumps_stdlib(data: Any) -> str:
+    """Dump data to a compact JSON string with the standard library.
+
+    The output is the same as with orjson: non-ASCII characters are not
+    escaped and NaN and infinity are dumped as null.
+    """
+    try:
+        return json.dumps(
+            data,
+            cls=JSONEncoder,
+            allow_nan=False,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+    except ValueError:
+        # Out of range floats, only replaced when there are any
+        return json.dumps(
+            _finite(data),
+            cls=_FiniteJSONEncoder,
+            allow_nan=False,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+
+def _json_dumps_orjson(data: Any) -> str:
+    """Dump data to a compact JSON string with orjson.
+
+    NaN and infinity are dumped as null.
+    """
+    try:
+        return orjson.dumps(  # type: ignore[no-any-return]
+            data, default=json_encoder_default, option=orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    except TypeError:
+        # Let the standard library handle what orjson does not
+        # support, like integers larger than 64 bits, or raise
+        return _json_dumps_stdlib(data)
+
+
+# Use the native encoder when it is installed
+JSON_BACKEND = "json" if orjson is None else "orjson"
+json_dumps: Callable[[Any], str] = (
+    _json_dumps_stdlib if orjson is None else _json_dumps_orjson
+)
+
+
 class ExtendedJSONEncoder(JSONEncoder):
     """JSONEncoder that supports Home Assistant objects and falls back to repr(o)."""
 
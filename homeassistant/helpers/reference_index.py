@@ -0,0 +1,71 @@
+"""Index of the entities, devices and areas referenced by entities."""
+from __future__ import annotations
+
+from typing import Iterable
+
+from homeassistant.core import callback
+
+
+class ReferenceIndex:
+    """Map entities, devices and areas to the entities referencing them.
+
+    Integrations like automation and script add their entities with the items
+    they reference when the entities are added to Home Assistant and remove
+    them again when the entities are removed, so looking up what references
+    an item does not need to go over every entity.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._references: dict[str, tuple[set[str], set[str], set[str]]] = {}
+        self._entities: dict[str, set[str]] = {}
+        self._devices: dict[str, set[str]] = {}
+        self._areas: dict[str, set[str]] = {}
+
+    @property
+    def _indexes(self) -> tuple[dict[str, set[str]], ...]:
+        """Return the indexes of entities, devices and areas."""
+        return (self._entities, self._devices, self._areas)
+
+    @callback
+    def async_add(
+        self,
+        entity_id: str,
+        entities: Iterable[str] = (),
+        devices: Iterable[str] = (),
+        areas: Iterable[str] = (),
+    ) -> None:
+        """Add or replace the references of an entity."""
+        self.async_remove(entity_id)
+        references = (set(entities), set(devices), set(areas))
+        self._references[entity_id] = references
+        for index, items in zip(self._indexes, references):
+            for item in items:
+                index.setdefault(item, set()).add(entity_id)
+
+    @callback
+    def async_remove(self, entity_id: str) -> None:
+        """Remove the references of an entity."""
+        if (references := self._references.pop(entity_id, None)) is None:
+            return
+        for index, items in zip(self._indexes, references):
+            for item in items:
+                referencing = index[item]
+                referencing.discard(entity_id)
+                if not referencing:
+                    del index[item]
+
+    @callback
+    def async_referencing_entity(self, entity_id: str) -> list[str]:
+        """Return the entities referencing an entity."""
+        return list(self._entities.get(entity_id, ()))
+
+    @callback
+    def async_referencing_device(self, device_id: str) -> list[str]:
+        """Return the entities referencing a device."""
+        return list(self._devices.get(device_id, ()))
+
+    @callback
+    def async_referencing_area(self, area_id: str) -> list[str]:
+        """Return the entities referencing an area."""
+        return list(self._areas.get(area_id, ()))
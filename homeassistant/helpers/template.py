@@ -9,7 +9,7 @@ from collections.abc import Generator, Iterable
 from contextlib import suppress
 from contextvars import ContextVar
 from datetime import datetime, timedelta
-from functools import partial, wraps
+from functools import lru_cache, partial, wraps
 import json
 import logging
 import math
@@ -17,9 +17,9 @@ from operator import attrgetter
 import random
 import re
 import sys
+from types import CodeType
 from typing import Any, Callable, cast
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 import jinja2
 from jinja2 import pass_context
@@ -29,6 +29,7 @@ import voluptuous as vol
 
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    ATTR_FRIENDLY_NAME,
     ATTR_LATITUDE,
     ATTR_LONGITUDE,
     ATTR_UNIT_OF_MEASUREMENT,
@@ -84,6 +85,15 @@ _COLLECTABLE_STATE_ATTRIBUTES = {
     "object_id",
     "name",
 }
+# State fields which only change when the state changes
+_STATE_VALUE_FIELDS = {"state", "last_changed"}
+# State fields which never change for an entity
+_STATIC_STATE_FIELDS = {"domain", "object_id"}
+
+# Number of compiled template sources kept per environment, so templates
+# with the same source and templates created again on reload are only
+# compiled once. A compiled template takes a few KiB.
+TEMPLATE_CACHE_SIZE = 4096
 
 ALL_STATES_RATE_LIMIT = timedelta(minutes=1)
 DOMAIN_STATES_RATE_LIMIT = timedelta(seconds=1)
@@ -224,6 +234,11 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # Entities of which only the state value, specific attributes or
+        # fields that never change were read. Changes to anything else of
+        # these entities do not need a re-render.
+        self.entity_states: collections.abc.Set[str] = set()
+        self.entity_attributes: dict[str, set[str]] = {}
         self.rate_limit: timedelta | None = None
         self.has_time = False
 
@@ -257,12 +272,29 @@ class RenderInfo:
         self.all_states = False
 
     def _freeze_sets(self) -> None:
-        self.entities = frozenset(self.entities)
+        for entity_id in self.entities:
+            self.entity_attributes.pop(entity_id, None)
+        self.entities = frozenset(self.entities | self.entity_attributes.keys())
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
 
+    def _freeze_fields(self) -> None:
+        # Iterating over states reads every field of the states iterated
+        if self.all_states:
+            self.entity_attributes = {}
+        elif self.domains:
+            self.entity_attributes = {
+                entity_id: attributes
+                for entity_id, attributes in self.entity_attributes.items()
+                if split_entity_id(entity_id)[0] not in self.domains
+            }
+        self.entity_states = frozenset(
+            self.entity_states & self.entity_attributes.keys()
+        )
+
     def _freeze(self) -> None:
         self._freeze_sets()
+        self._freeze_fields()
 
         if self.rate_limit is None:
             if self.all_states or self.exception:
@@ -721,14 +753,18 @@ class TemplateState(State):
         if self._collect and _RENDER_INFO in self._hass.data:
             self._hass.data[_RENDER_INFO].entities.add(self._state.entity_id)
 
+    def _collect_field(self, field: str) -> None:
+        if self._collect:
+            _collect_state_field(self._hass, self._state.entity_id, field)
+
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item):
         """Return a property as an attribute for jinja."""
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
-            # _collect_state inlined here for performance
-            if self._collect and _RENDER_INFO in self._hass.data:
-                self._hass.data[_RENDER_INFO].entities.add(self._state.entity_id)
+            # _collect_field inlined here for performance
+            if self._collect:
+                _collect_state_field(self._hass, self._state.entity_id, item)
             return getattr(self._state, item)
         if item == "entity_id":
             return self._state.entity_id
@@ -747,7 +783,7 @@ class TemplateState(State):
     @property
     def state(self):
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_field("state")
         return self._state.state
 
     @property
@@ -759,7 +795,7 @@ class TemplateState(State):
     @property
     def last_changed(self):
         """Wrap State.last_changed."""
-        self._collect_state()
+        self._collect_field("last_changed")
         return self._state.last_changed
 
     @property
@@ -777,25 +813,29 @@ class TemplateState(State):
     @property
     def domain(self):
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_field("domain")
         return self._state.domain
 
     @property
     def object_id(self):
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_field("object_id")
         return self._state.object_id
 
     @property
     def name(self):
         """Wrap State.name."""
-        self._collect_state()
+        self._collect_field("name")
         return self._state.name
 
     @property
     def state_with_unit(self) -> str:
         """Return the state concatenated with the unit if available."""
-        self._collect_state()
+        if self._collect:
+            _collect_state_field(self._hass, self._state.entity_id, "state")
+            _collect_attribute(
+                self._hass, self._state.entity_id, ATTR_UNIT_OF_MEASUREMENT
+            )
         unit = self._state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         return f"{self._state.state} {unit}" if unit else self._state.state
 
@@ -815,6 +855,27 @@ def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
         entity_collect.entities.add(entity_id)
 
 
+def _collect_state_field(hass: HomeAssistant, entity_id: str, field: str) -> None:
+    entity_collect = hass.data.get(_RENDER_INFO)
+    if entity_collect is None:
+        return
+    if field in _STATE_VALUE_FIELDS:
+        entity_collect.entity_states.add(entity_id)
+        entity_collect.entity_attributes.setdefault(entity_id, set())
+    elif field in _STATIC_STATE_FIELDS:
+        entity_collect.entity_attributes.setdefault(entity_id, set())
+    elif field == "name":
+        _collect_attribute(hass, entity_id, ATTR_FRIENDLY_NAME)
+    else:
+        entity_collect.entities.add(entity_id)
+
+
+def _collect_attribute(hass: HomeAssistant, entity_id: str, name: str) -> None:
+    entity_collect = hass.data.get(_RENDER_INFO)
+    if entity_collect is not None:
+        entity_collect.entity_attributes.setdefault(entity_id, set()).add(name)
+
+
 def _state_generator(hass: HomeAssistant, domain: str | None) -> Generator:
     """State generator for a domain or all states."""
     for state in sorted(hass.states.async_all(domain), key=attrgetter("entity_id")):
@@ -1177,10 +1238,13 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
-    state_obj = _get_state(hass, entity_id)
-    if state_obj is not None:
-        return state_obj.attributes.get(name)
-    return None
+    state_obj = hass.states.get(entity_id)
+    if state_obj is None:
+        _collect_state(hass, entity_id)
+        return None
+
+    _collect_attribute(hass, state_obj.entity_id, name)
+    return state_obj.attributes.get(name)
 
 
 def now(hass: HomeAssistant) -> datetime:
@@ -1535,7 +1599,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             undefined = jinja2.StrictUndefined
         super().__init__(undefined=undefined)
         self.hass = hass
-        self.template_cache = weakref.WeakValueDictionary()
+        self._compile_cached: Callable[[str], CodeType] = lru_cache(
+            maxsize=TEMPLATE_CACHE_SIZE
+        )(super().compile)
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -1698,12 +1764,11 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             # any instance of this.
             return super().compile(source, name, filename, raw, defer_init)
 
-        cached = self.template_cache.get(source)
-
-        if cached is None:
-            cached = self.template_cache[source] = super().compile(source)
+        return self._compile_cached(source)
 
-        return cached
+    def cache_info(self) -> Any:
+        """Return hit and miss statistics of the compiled template cache."""
+        return self._compile_cached.cache_info()  # type: ignore[attr-defined]
 
 
 _NO_HASS_ENV = TemplateEnvironment(None)  # type: ignore[no-untyped-call]
@@ -8,12 +8,14 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import suppress
+from datetime import timedelta
 import functools as ft
 import importlib
 import json
 import logging
 import pathlib
 import sys
+from time import monotonic
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Callable, Dict, TypedDict, TypeVar, cast
 
@@ -45,6 +47,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_IMPORT_TIME = "import_time"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -513,7 +516,9 @@ class Integration:
         """Return the component."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         if self.domain not in cache:
+            start = monotonic()
             cache[self.domain] = importlib.import_module(self.pkg_path)
+            self._add_import_time(monotonic() - start)
         return cache[self.domain]  # type: ignore
 
     def get_platform(self, platform_name: str) -> ModuleType:
@@ -521,9 +526,19 @@ class Integration:
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         full_name = f"{self.domain}.{platform_name}"
         if full_name not in cache:
+            start = monotonic()
             cache[full_name] = self._import_platform(platform_name)
+            self._add_import_time(monotonic() - start)
         return cache[full_name]  # type: ignore
 
+    def _add_import_time(self, seconds: float) -> None:
+        """Add time spent importing the component or a platform."""
+        import_time = self.hass.data.setdefault(DATA_IMPORT_TIME, {})
+        if self.domain in import_time:
+            import_time[self.domain] += timedelta(seconds=seconds)
+        else:
+            import_time[self.domain] = timedelta(seconds=seconds)
+
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
         return importlib.import_module(f"{self.pkg_path}.{platform_name}")
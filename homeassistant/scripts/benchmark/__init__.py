@@ -5,7 +5,7 @@ import argparse
 import asyncio
 import collections
 from contextlib import suppress
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
 import logging
 from timeit import default_timer as timer
@@ -118,6 +118,75 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_events_with_entity_filters(hass):
+    """Fire a million events with 5000 listeners filtering on entity_id."""
+    count = 0
+    entity_id = "light.kitchen"
+    events_to_fire = 10 ** 6
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(5000):
+        listen_entity_id = f"{entity_id}{idx}"
+
+        @core.callback
+        def event_filter(event, listen_entity_id=listen_entity_id):
+            """Filter event."""
+            return event.data["entity_id"] == listen_entity_id
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, listener, event_filter=event_filter)
+
+    event_data = {"entity_id": f"{entity_id}0"}
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+    start = timer()
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def fire_events_with_entity_listeners(hass):
+    """Fire a million events with 5000 listeners keyed by entity_id."""
+    count = 0
+    entity_id = "light.kitchen"
+    events_to_fire = 10 ** 6
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(5000):
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED, listener, entity_id=f"{entity_id}{idx}"
+        )
+
+    event_data = {"entity_id": f"{entity_id}0"}
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+    start = timer()
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
 @benchmark
 async def time_changed_helper(hass):
     """Run a million events through time changed helper."""
@@ -146,6 +215,46 @@ async def time_changed_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def idle_time_trackers(hass):
+    """Measure the idle CPU time of a started instance with 2k time trackers.
+
+    Registers 2k interval trackers with intervals from 1 to 60 seconds and
+    100 trackers firing every second, then prints the CPU time spent idling
+    for 10 seconds without and with the trackers and returns the latter.
+    """
+    # pylint: disable=import-outside-toplevel
+    import time
+
+    count = 0
+
+    @core.callback
+    def listener(_):
+        """Handle time tracker."""
+        nonlocal count
+        count += 1
+
+    async def idle_cpu_time():
+        start = time.process_time()
+        await asyncio.sleep(10)
+        return time.process_time() - start
+
+    await hass.async_start()
+    baseline = await idle_cpu_time()
+
+    for idx in range(2000):
+        hass.helpers.event.async_track_time_interval(
+            listener, timedelta(seconds=1 + idx % 60)
+        )
+    for _ in range(100):
+        hass.helpers.event.async_track_utc_time_change(listener)
+
+    runtime = await idle_cpu_time()
+    print(f"Idle CPU time without trackers: {baseline:.3f}s")
+    print(f"Idle CPU time with trackers: {runtime:.3f}s ({count} callbacks)")
+    return runtime
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -390,6 +499,338 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def websocket_get_states(hass):
+    """Serialize the websocket get_states result for 5k entities 100 times."""
+    # pylint: disable=import-outside-toplevel
+    from unittest.mock import MagicMock
+
+    from homeassistant.components.websocket_api.commands import handle_get_states
+
+    connection = MagicMock()
+    connection.user.permissions.access_all_entities.return_value = True
+    attributes = {
+        "friendly_name": "Kitchen Lights",
+        "supported_features": 41,
+        "brightness": 255,
+        "rgb_color": [255, 255, 255],
+        "last_seen": dt_util.utcnow(),
+    }
+
+    runtime = 0
+    for idx in range(100):
+        # Fresh states so nothing is served from a cache
+        for entity_idx in range(5000):
+            hass.states.async_set(
+                f"light.kitchen_{entity_idx}", str(idx), attributes, force_update=True
+            )
+        start = timer()
+        handle_get_states(hass, connection, {"id": idx, "type": "get_states"})
+        runtime += timer() - start
+
+    return runtime
+
+
+@benchmark
+async def mqtt_topic_matching(hass):
+    """Match 50k MQTT messages against 10k subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.mqtt.matcher import TopicTrie
+
+    trie = TopicTrie()
+    for idx in range(10 ** 4):
+        if idx % 10 == 0:
+            trie.add(f"zigbee2mqtt/device_{idx}/+", idx)
+        elif idx % 10 == 1:
+            trie.add(f"tasmota/discovery/device_{idx}/#", idx)
+        else:
+            trie.add(f"zigbee2mqtt/device_{idx}", idx)
+
+    topics = [f"zigbee2mqtt/device_{idx % 10 ** 4}" for idx in range(5 * 10 ** 4)]
+
+    start = timer()
+
+    for topic in topics:
+        for _ in trie.iter_match(topic):
+            pass
+
+    return timer() - start
+
+
+@benchmark
+async def recorder_bulk_insert(hass):
+    """Write 100k state changes with the ORM and with the bulk writer.
+
+    Both write the same events to a database file, link each state to the
+    previous state of its entity and commit every 1000 events. Prints the
+    time of the ORM write path and returns the time of the bulk writer.
+    """
+    # pylint: disable=import-outside-toplevel
+    import os
+    import tempfile
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.models import (
+        Base,
+        Events,
+        StateAttributes,
+        States,
+    )
+    from homeassistant.components.recorder.writer import BulkWriter
+
+    commit_every = 1000
+    events = []
+    for idx in range(10 ** 5):
+        entity_id = f"sensor.benchmark_{idx % 100}"
+        new_state = core.State(entity_id, str(idx), {"unit_of_measurement": "W"})
+        events.append(
+            core.Event(
+                EVENT_STATE_CHANGED, {"entity_id": entity_id, "new_state": new_state}
+            )
+        )
+
+    def write_orm(session):
+        """Write the events like the default write path of the recorder."""
+        attributes = StateAttributes.from_event(events[0])
+        old_states = {}
+        pending_expunge = []
+        for idx, event in enumerate(events, 1):
+            dbevent = Events.from_event(event, event_data="{}")
+            dbevent.created = event.time_fired
+            session.add(dbevent)
+            dbstate = States.from_event(event)
+            old_state = old_states.pop(dbstate.entity_id, None)
+            if old_state is not None:
+                if old_state.state_id:
+                    dbstate.old_state_id = old_state.state_id
+                else:
+                    dbstate.old_state = old_state
+            if attributes.attributes_id:
+                dbstate.attributes_id = attributes.attributes_id
+            else:
+                dbstate.state_attributes = attributes
+            dbstate.event = dbevent
+            dbstate.created = event.time_fired
+            session.add(dbstate)
+            old_states[dbstate.entity_id] = dbstate
+            pending_expunge.append(dbstate)
+            if idx % commit_every == 0:
+                session.flush()
+                for dbstate in pending_expunge:
+                    session.expunge(dbstate)
+                pending_expunge = []
+                session.commit()
+
+    def write_bulk(session):
+        """Write the events with the bulk writer."""
+        writer = BulkWriter(session.bind.dialect.name)
+        writer.reset(session)
+        shared_attrs = StateAttributes.shared_attrs_from_event(events[0])
+        attributes_id = writer.add_state_attributes(
+            shared_attrs, StateAttributes.hash_shared_attrs(shared_attrs)
+        )
+        old_state_ids = {}
+        for idx, event in enumerate(events, 1):
+            entity_id = event.data["entity_id"]
+            event_id = writer.add_event(event, event_data="{}")
+            old_state_ids[entity_id] = writer.add_state(
+                event, event_id, old_state_ids.get(entity_id), attributes_id
+            )
+            if idx % commit_every == 0:
+                writer.write(session)
+                session.commit()
+                writer.clear()
+
+    runtimes = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, write in (("orm", write_orm), ("bulk", write_bulk)):
+            engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, name)}.db")
+            Base.metadata.create_all(engine)
+            session = Session(engine)
+            session.expire_on_commit = False
+            start = timer()
+            write(session)
+            runtimes[name] = timer() - start
+            assert session.query(States).count() == len(events)
+            session.close()
+            engine.dispose()
+
+    print(f"ORM write path done in {runtimes['orm']}s")
+    return runtimes["bulk"]
+
+
+@benchmark
+async def recorder_significant_states(hass):
+    """Query the significant states of 100k recorded state changes.
+
+    The states are written in both layouts: the default one with
+    last_changed always stored and the one of the compact_states option
+    with last_changed only stored when it differs from last_updated. Prints
+    the query time and the growth of the database file of each layout and
+    returns the query time of the last.
+    """
+    # pylint: disable=import-outside-toplevel
+    import os
+    import tempfile
+
+    from homeassistant import config_entries
+    from homeassistant.components.recorder import history
+    from homeassistant.components.recorder.models import StateAttributes, States
+    from homeassistant.components.recorder.util import session_scope
+    from homeassistant.setup import async_setup_component
+
+    def write_states(start, store_last_changed):
+        with session_scope(hass=hass) as session:
+            attributes = StateAttributes(
+                hash=0, shared_attrs='{"unit_of_measurement":"W"}'
+            )
+            session.add(attributes)
+            session.flush()
+            rows = []
+            for idx in range(10 ** 5):
+                last_updated = start + timedelta(seconds=idx)
+                # Every other update only changes the attributes
+                last_changed = last_updated - timedelta(seconds=(idx // 100) % 2)
+                if not store_last_changed and last_changed == last_updated:
+                    last_changed = None
+                rows.append(
+                    {
+                        "entity_id": f"sensor.benchmark_{idx % 100}",
+                        "domain": "sensor",
+                        "state": str(idx // 200),
+                        "attributes_id": attributes.attributes_id,
+                        "last_changed": last_changed,
+                        "last_updated": last_updated,
+                        "created": last_updated,
+                    }
+                )
+            session.execute(States.__table__.insert(), rows)
+
+    def query_states(start):
+        timer_start = timer()
+        history.get_significant_states(
+            hass,
+            start - timedelta(seconds=1),
+            start + timedelta(days=2),
+            include_start_time_state=False,
+        )
+        return timer() - timer_start
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        db_file = os.path.join(tmp_dir, "benchmark.db")
+        assert await async_setup_component(
+            hass, "recorder", {"recorder": {"db_url": f"sqlite:///{db_file}"}}
+        )
+        # The recorder only shuts down once Home Assistant has started
+        await hass.async_start()
+
+        start = dt_util.utcnow() - timedelta(days=7)
+        for layout, store_last_changed in (
+            ("Default layout", True),
+            ("Compact layout", False),
+        ):
+            size = os.path.getsize(db_file)
+            await hass.async_add_executor_job(write_states, start, store_last_changed)
+            growth = (os.path.getsize(db_file) - size) / 1024 ** 2
+            runtime = await hass.async_add_executor_job(query_states, start)
+            print(f"{layout}: database grew {growth:.1f} MiB, queried in {runtime}s")
+            # The next layout is written after this one
+            start += timedelta(days=3)
+
+        await hass.async_stop()
+
+    return runtime
+
+
+@benchmark
+async def template_reload(hass):
+    """Set up 2k templates, then time setting them up again as on a reload.
+
+    Also prints the hit statistics of the compiled template cache.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.template import Template
+
+    sources = [
+        f"{{{{ states('sensor.benchmark_{idx % 500}') | float(0) * {idx} }}}}"
+        for idx in range(2000)
+    ]
+
+    def setup_templates():
+        templates = [Template(source, hass) for source in sources]
+        for tpl in templates:
+            tpl.async_render()
+        return templates
+
+    templates = setup_templates()
+    del templates
+
+    start = timer()
+    setup_templates()
+    runtime = timer() - start
+
+    # pylint: disable=protected-access
+    print(Template(sources[0], hass)._env.cache_info())
+    return runtime
+
+
+@benchmark
+async def automation_reload(hass):
+    """Reload 600 automations of which one changed."""
+    # pylint: disable=import-outside-toplevel
+    import tempfile
+    from unittest.mock import patch
+
+    from homeassistant import config_entries
+    from homeassistant.helpers import area_registry, device_registry, entity_registry
+    from homeassistant.setup import async_setup_component
+
+    config = {
+        "automation": [
+            {
+                "id": str(idx),
+                "alias": f"benchmark_{idx}",
+                "trigger": {
+                    "platform": "state",
+                    "entity_id": f"sensor.benchmark_{idx}",
+                    "to": "on",
+                    "for": "00:05:00",
+                },
+                "condition": {"condition": "template", "value_template": "{{ true }}"},
+                "action": {"event": "benchmark"},
+            }
+            for idx in range(600)
+        ]
+    }
+
+    # The automations and their restored states are stored in the config dir
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        hass.config.skip_pip = True
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await asyncio.gather(
+            area_registry.async_load(hass),
+            device_registry.async_load(hass),
+            entity_registry.async_load(hass),
+        )
+        assert await async_setup_component(hass, "automation", config)
+        await hass.async_block_till_done()
+
+        config["automation"][5]["alias"] = "changed"
+        with patch("homeassistant.config.load_yaml_config_file", return_value=config):
+            start = timer()
+            await hass.services.async_call("automation", "reload", blocking=True)
+            runtime = timer() - start
+
+        await hass.async_stop()
+
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -627,7 +627,9 @@ async def test_reload_config_handles_load_fails(hass, calls):
     assert len(calls) == 2
 
 
-@pytest.mark.parametrize("service", ["turn_off_stop", "turn_off_no_stop", "reload"])
+@pytest.mark.parametrize(
+    "service", ["turn_off_stop", "turn_off_no_stop", "reload", "reload_unchanged"]
+)
 async def test_automation_stops(hass, calls, service):
     """Test that turning off / reloading stops any running actions as appropriate."""
     entity_id = "automation.hello"
@@ -673,6 +675,8 @@ async def test_automation_stops(hass, calls, service):
             blocking=True,
         )
     else:
+        if service == "reload":
+            config[automation.DOMAIN]["alias"] = "goodbye"
         with patch(
             "homeassistant.config.load_yaml_config_file",
             autospec=True,
@@ -685,7 +689,78 @@ async def test_automation_stops(hass, calls, service):
     hass.states.async_set(test_entity, "goodbye")
     await hass.async_block_till_done()
 
-    assert len(calls) == (1 if service == "turn_off_no_stop" else 0)
+    assert len(calls) == (
+        1 if service in ("turn_off_no_stop", "reload_unchanged") else 0
+    )
+
+
+async def test_reload_keeps_unchanged_automations(hass, calls):
+    """Test reload only replaces automations whose config changed."""
+    config = {
+        automation.DOMAIN: [
+            {
+                "id": "unchanged",
+                "alias": "unchanged",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": {"service": "test.automation"},
+            },
+            {
+                "id": "changed",
+                "alias": "changed",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": {"service": "test.automation"},
+            },
+            {
+                "alias": "removed",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": {"service": "test.automation"},
+            },
+        ]
+    }
+    assert await async_setup_component(hass, automation.DOMAIN, config)
+    component = hass.data[automation.DOMAIN]
+    unchanged = component.get_entity("automation.unchanged")
+    changed = component.get_entity("automation.changed")
+
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+    last_triggered = hass.states.get("automation.unchanged").attributes[
+        "last_triggered"
+    ]
+
+    config[automation.DOMAIN][1]["trigger"]["event_type"] = "test_event_2"
+    del config[automation.DOMAIN][2]
+    config[automation.DOMAIN].append(
+        {
+            "alias": "added",
+            "trigger": {"platform": "event", "event_type": "test_event_2"},
+            "action": {"service": "test.automation"},
+        }
+    )
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value=config,
+    ):
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert component.get_entity("automation.unchanged") is unchanged
+    assert component.get_entity("automation.changed") is not changed
+    assert hass.states.get("automation.removed") is None
+    assert hass.states.get("automation.added") is not None
+    assert (
+        hass.states.get("automation.unchanged").attributes["last_triggered"]
+        == last_triggered
+    )
+
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 4
+
+    hass.bus.async_fire("test_event_2")
+    await hass.async_block_till_done()
+    assert len(calls) == 6
 
 
 async def test_automation_restore_state(hass):
@@ -1130,6 +1205,12 @@ async def test_extraction_functions(hass):
         "device-in-last",
     }
 
+    await hass.data[automation.DOMAIN].async_remove_entity("automation.test1")
+    assert automation.automations_with_entity(hass, "light.in_both") == [
+        "automation.test2"
+    ]
+    assert automation.automations_with_entity(hass, "light.in_first") == []
+
 
 async def test_logbook_humanify_automation_triggered_event(hass):
     """Test humanifying Automation Trigger event."""
@@ -68,8 +68,9 @@ async def test_close_cover(hass, setup_comp):
     )
     state = hass.states.get(ENTITY_COVER)
     assert state.state == STATE_CLOSING
+    future = dt_util.utcnow()
     for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -88,8 +89,9 @@ async def test_open_cover(hass, setup_comp):
     )
     state = hass.states.get(ENTITY_COVER)
     assert state.state == STATE_OPENING
+    future = dt_util.utcnow()
     for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -104,8 +106,9 @@ async def test_toggle_cover(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
+    future = dt_util.utcnow()
     for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -116,8 +119,9 @@ async def test_toggle_cover(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_TOGGLE, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
+    future = dt_util.utcnow()
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -128,8 +132,9 @@ async def test_toggle_cover(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_TOGGLE, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
+    future = dt_util.utcnow()
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -148,8 +153,9 @@ async def test_set_cover_position(hass, setup_comp):
         {ATTR_ENTITY_ID: ENTITY_COVER, ATTR_POSITION: 10},
         blocking=True,
     )
+    future = dt_util.utcnow()
     for _ in range(6):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -183,8 +189,9 @@ async def test_close_cover_tilt(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_CLOSE_COVER_TILT, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
+    future = dt_util.utcnow()
     for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -199,8 +206,9 @@ async def test_open_cover_tilt(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER_TILT, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
+    future = dt_util.utcnow()
     for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -214,8 +222,9 @@ async def test_toggle_cover_tilt(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER_TILT, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
+    future = dt_util.utcnow()
     for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -225,8 +234,9 @@ async def test_toggle_cover_tilt(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_TOGGLE_COVER_TILT, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
+    future = dt_util.utcnow()
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -236,8 +246,9 @@ async def test_toggle_cover_tilt(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_TOGGLE_COVER_TILT, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
+    future = dt_util.utcnow()
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -255,8 +266,9 @@ async def test_set_cover_tilt_position(hass, setup_comp):
         {ATTR_ENTITY_ID: ENTITY_COVER, ATTR_TILT_POSITION: 90},
         blocking=True,
     )
+    future = dt_util.utcnow()
     for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -905,8 +905,9 @@ async def test_open_cover_without_position(hass_hue, hue_client):
     cover_test = hass_hue.states.get(cover_id)
     assert cover_test.state == "closing"
 
+    future = dt_util.utcnow()
     for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass_hue, future)
         await hass_hue.async_block_till_done()
 
@@ -919,8 +920,9 @@ async def test_open_cover_without_position(hass_hue, hue_client):
     assert cover_result.status == HTTP_OK
     assert CONTENT_TYPE_JSON in cover_result.headers["content-type"]
 
+    future = dt_util.utcnow()
     for _ in range(11):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass_hue, future)
         await hass_hue.async_block_till_done()
 
@@ -939,8 +941,9 @@ async def test_open_cover_without_position(hass_hue, hue_client):
     assert cover_result.status == HTTP_OK
     assert CONTENT_TYPE_JSON in cover_result.headers["content-type"]
 
+    future = dt_util.utcnow()
     for _ in range(11):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass_hue, future)
         await hass_hue.async_block_till_done()
 
@@ -969,8 +972,9 @@ async def test_set_position_cover(hass_hue, hue_client):
     cover_test = hass_hue.states.get(cover_id)
     assert cover_test.state == "closing"
 
+    future = dt_util.utcnow()
     for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass_hue, future)
         await hass_hue.async_block_till_done()
 
@@ -994,8 +998,9 @@ async def test_set_position_cover(hass_hue, hue_client):
     assert True, cover_result_json[0]["success"][f"/lights/{cover_number}/state/on"]
     assert cover_result_json[1]["success"][f"/lights/{cover_number}/state/bri"] == level
 
+    future = dt_util.utcnow()
     for _ in range(100):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass_hue, future)
         await hass_hue.async_block_till_done()
 
@@ -264,8 +264,9 @@ async def test_open_covers(hass, setup_comp):
         DOMAIN, SERVICE_OPEN_COVER, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
 
+    future = dt_util.utcnow()
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -285,8 +286,9 @@ async def test_close_covers(hass, setup_comp):
         DOMAIN, SERVICE_CLOSE_COVER, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
 
+    future = dt_util.utcnow()
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -306,8 +308,9 @@ async def test_toggle_covers(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
+    future = dt_util.utcnow()
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -318,8 +321,9 @@ async def test_toggle_covers(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_TOGGLE, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
+    future = dt_util.utcnow()
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -335,8 +339,9 @@ async def test_toggle_covers(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_TOGGLE, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
+    future = dt_util.utcnow()
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -384,8 +389,9 @@ async def test_set_cover_position(hass, setup_comp):
         {ATTR_ENTITY_ID: COVER_GROUP, ATTR_POSITION: 50},
         blocking=True,
     )
+    future = dt_util.utcnow()
     for _ in range(4):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -404,8 +410,9 @@ async def test_open_tilts(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER_TILT, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
+    future = dt_util.utcnow()
     for _ in range(5):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -424,8 +431,9 @@ async def test_close_tilts(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_CLOSE_COVER_TILT, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
+    future = dt_util.utcnow()
     for _ in range(5):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -443,8 +451,9 @@ async def test_toggle_tilts(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER_TILT, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
+    future = dt_util.utcnow()
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -460,8 +469,9 @@ async def test_toggle_tilts(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_TOGGLE_COVER_TILT, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
+    future = dt_util.utcnow()
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -475,8 +485,9 @@ async def test_toggle_tilts(hass, setup_comp):
     await hass.services.async_call(
         DOMAIN, SERVICE_TOGGLE_COVER_TILT, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
+    future = dt_util.utcnow()
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -522,8 +533,9 @@ async def test_set_tilt_positions(hass, setup_comp):
         {ATTR_ENTITY_ID: COVER_GROUP, ATTR_TILT_POSITION: 80},
         blocking=True,
     )
+    future = dt_util.utcnow()
     for _ in range(3):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -547,8 +559,9 @@ async def test_is_opening_closing(hass, setup_comp):
     assert hass.states.get(DEMO_COVER_TILT).state == STATE_OPENING
     assert hass.states.get(COVER_GROUP).state == STATE_OPENING
 
+    future = dt_util.utcnow()
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
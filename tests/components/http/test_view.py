@@ -1,6 +1,9 @@
 """Tests for Home Assistant View."""
-from unittest.mock import AsyncMock, Mock
+import itertools
+import threading
+from unittest.mock import AsyncMock, Mock, patch
 
+from aiohttp import ClientPayloadError, web
 from aiohttp.web_exceptions import (
     HTTPBadRequest,
     HTTPInternalServerError,
@@ -9,6 +12,7 @@ from aiohttp.web_exceptions import (
 import pytest
 import voluptuous as vol
 
+from homeassistant.components.http import view as http_view
 from homeassistant.components.http.view import (
     HomeAssistantView,
     request_handler_factory,
@@ -16,6 +20,10 @@ from homeassistant.components.http.view import (
 from homeassistant.exceptions import ServiceNotFound, Unauthorized
 
 
+class _Unserializable:
+    """A class that cannot be serialized."""
+
+
 @pytest.fixture
 def mock_request():
     """Mock a request."""
@@ -33,9 +41,9 @@ async def test_invalid_json(caplog):
     view = HomeAssistantView()
 
     with pytest.raises(HTTPInternalServerError):
-        view.json(float("NaN"))
+        view.json({"bad": _Unserializable()})
 
-    assert str(float("NaN")) in caplog.text
+    assert "Unserializable" in caplog.text
 
 
 async def test_handling_unauthorized(mock_request):
@@ -69,3 +77,116 @@ async def test_not_running(mock_request_with_stopping):
         Mock(requires_auth=False), AsyncMock(side_effect=Unauthorized)
     )(mock_request_with_stopping)
     assert response.status == 503
+
+
+async def test_json_stream(hass, aiohttp_client):
+    """Test streaming a JSON list in chunks."""
+
+    def items():
+        for number in range(100):
+            yield {"number": number}
+
+    async def handler(request):
+        return await HomeAssistantView.async_json_stream(request, items)
+
+    app = web.Application()
+    app["hass"] = hass
+    app.router.add_get("/", handler)
+    client = await aiohttp_client(app)
+
+    with patch.object(http_view, "JSON_STREAM_CHUNK_SIZE", 64):
+        response = await client.get("/")
+
+    assert response.status == 200
+    assert response.content_type == "application/json"
+    assert await response.json() == [{"number": number} for number in range(100)]
+
+
+async def test_json_stream_empty(hass, aiohttp_client):
+    """Test streaming an empty JSON list."""
+
+    async def handler(request):
+        return await HomeAssistantView.async_json_stream(request, list)
+
+    app = web.Application()
+    app["hass"] = hass
+    app.router.add_get("/", handler)
+    client = await aiohttp_client(app)
+
+    response = await client.get("/")
+
+    assert response.status == 200
+    assert await response.json() == []
+
+
+async def test_json_stream_invalid_json(hass, aiohttp_client, caplog):
+    """Test streaming an item that cannot be serialized."""
+
+    async def handler(request):
+        return await HomeAssistantView.async_json_stream(
+            request, lambda: [{"bad": _Unserializable()}]
+        )
+
+    app = web.Application()
+    app["hass"] = hass
+    app.router.add_get("/", handler)
+    client = await aiohttp_client(app)
+
+    response = await client.get("/")
+
+    assert response.status == 500
+    assert "Unserializable" in caplog.text
+
+
+async def test_json_stream_error_after_prepare(hass, aiohttp_client, caplog):
+    """Test an error in the middle of the stream drops the connection."""
+
+    def items():
+        for number in range(100):
+            yield {"number": number}
+        raise ValueError("Boom")
+
+    async def handler(request):
+        return await HomeAssistantView.async_json_stream(request, items)
+
+    app = web.Application()
+    app["hass"] = hass
+    app.router.add_get("/", handler)
+    client = await aiohttp_client(app)
+
+    with patch.object(http_view, "JSON_STREAM_CHUNK_SIZE", 64):
+        response = await client.get("/")
+        assert response.status == 200
+        with pytest.raises(ClientPayloadError):
+            await response.read()
+
+    assert "Error streaming the JSON response" in caplog.text
+    assert "Boom" in caplog.text
+
+
+async def test_json_stream_client_disconnect(hass, aiohttp_client):
+    """Test the producer stops when the client disconnects."""
+    finished = threading.Event()
+
+    def items():
+        try:
+            for number in itertools.count():
+                yield {"number": number}
+        finally:
+            finished.set()
+
+    async def handler(request):
+        return await HomeAssistantView.async_json_stream(request, items)
+
+    app = web.Application()
+    app["hass"] = hass
+    app.router.add_get("/", handler)
+    client = await aiohttp_client(app)
+
+    with patch.object(http_view, "JSON_STREAM_CHUNK_SIZE", 64):
+        response = await client.get("/")
+        assert response.status == 200
+        assert await response.content.read(64)
+        response.close()
+
+        assert await hass.async_add_executor_job(finished.wait, 5)
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 import datetime
 from unittest.mock import MagicMock, Mock, call, patch
 
+from aiohttp import web
 import pytest
 
 import homeassistant.components.influxdb as influxdb
@@ -1790,3 +1791,163 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+def test_event_to_json_measurement_cache():
+    """Test the cached measurement of an entity follows its unit."""
+    conf = influxdb.CONFIG_SCHEMA({"influxdb": {}})["influxdb"]
+    event_to_json = influxdb._generate_event_to_json(conf)
+
+    for unit in ("foobars", "W", "W"):
+        state = MagicMock(
+            state="1",
+            domain="fake",
+            entity_id="fake.entity_id",
+            object_id="entity_id",
+            attributes={"unit_of_measurement": unit},
+        )
+        event = MagicMock(data={"new_state": state}, time_fired=12345)
+        assert event_to_json(event) == {
+            "measurement": unit,
+            "tags": {"domain": "fake", "entity_id": "entity_id"},
+            "time": 12345,
+            "fields": {"value": 1.0},
+        }
+
+
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api, get_mock_call, get_buffered_call",
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+            lambda lines: call(lines, time_precision=None, protocol="line"),
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+            lambda lines: call(bucket=DEFAULT_BUCKET, record=lines),
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_buffer(
+    hass,
+    mock_client,
+    config_ext,
+    get_write_api,
+    get_mock_call,
+    get_buffered_call,
+    tmp_path,
+):
+    """Test events are buffered on disk while the write fails."""
+    hass.config.config_dir = str(tmp_path)
+    config = {"max_buffer_size": 1}
+    config.update(config_ext)
+    handler_method = await _setup(hass, mock_client, config, get_write_api)
+    instance = hass.data[influxdb.DOMAIN]
+    buffer_path = tmp_path / ".storage" / "influxdb.buffer"
+
+    state = MagicMock(
+        state=1,
+        domain="fake",
+        entity_id="entity.id",
+        object_id="entity",
+        attributes={},
+    )
+    event = MagicMock(data={"new_state": state}, time_fired=12345)
+    body = [
+        {
+            "measurement": "entity.id",
+            "tags": {"domain": "fake", "entity_id": "entity"},
+            "time": 12345,
+            "fields": {"value": 1},
+        }
+    ]
+    line = "entity.id,domain=fake,entity_id=entity value=1.0 12345\n"
+    write_api = get_write_api(mock_client)
+    write_api.side_effect = OSError("foo")
+
+    # Write fails, the event is buffered
+    handler_method(event)
+    instance.block_till_done()
+    assert write_api.call_count == 1
+    assert buffer_path.read_text() == line
+
+    # Write is not retried until the retry delay has passed
+    handler_method(event)
+    instance.block_till_done()
+    assert write_api.call_count == 1
+    assert buffer_path.read_text() == line * 2
+
+    # Write works again, the buffer is written before the new event
+    write_api.side_effect = None
+    instance.next_buffer_flush = 0
+    handler_method(event)
+    instance.block_till_done()
+    assert write_api.call_args_list == [
+        get_mock_call(body),
+        get_buffered_call(line * 2),
+        get_mock_call(body),
+    ]
+    assert not buffer_path.exists()
+
+
+async def test_write_gzip(hass, aiohttp_server):
+    """Test writes are sent gzip compressed when enabled."""
+    writes = []
+
+    async def handle_write(request):
+        """Record the write and accept it."""
+        writes.append((request.headers, request.query, await request.text()))
+        return web.Response(status=204)
+
+    app = web.Application()
+    app.router.add_post("/write", handle_write)
+    server = await aiohttp_server(app)
+
+    config = {
+        "influxdb": {
+            "host": server.host,
+            "port": server.port,
+            "database": "db",
+            "precision": "s",
+            "gzip": True,
+        }
+    }
+    assert await async_setup_component(hass, influxdb.DOMAIN, config)
+    await hass.async_block_till_done()
+    handler_method = hass.bus.listen.call_args_list[0][0][1]
+
+    state = MagicMock(
+        state=1,
+        domain="fake",
+        entity_id="entity.id",
+        object_id="entity",
+        attributes={},
+    )
+    event = MagicMock(
+        data={"new_state": state},
+        time_fired=datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc),
+    )
+    handler_method(event)
+    await hass.async_add_executor_job(hass.data[influxdb.DOMAIN].block_till_done)
+
+    assert len(writes) == 2
+    headers, query, body = writes[1]
+    assert headers["Content-Encoding"] == "gzip"
+    assert query == {"db": "db", "precision": "s"}
+    assert body == "entity.id,domain=fake,entity_id=entity value=1.0 1609459200\n"
+
+
+@pytest.mark.parametrize("mock_client", [influxdb.API_VERSION_2], indirect=True)
+async def test_write_gzip_v2(hass, mock_client):
+    """Test the V2 client is set up to compress writes when enabled."""
+    config = {"influxdb": {**BASE_V2_CONFIG, "gzip": True}}
+    assert await async_setup_component(hass, influxdb.DOMAIN, config)
+    await hass.async_block_till_done()
+    assert mock_client.call_args.kwargs["enable_gzip"] is True
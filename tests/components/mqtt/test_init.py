@@ -583,6 +583,47 @@ async def test_subscribe_special_characters(hass, mqtt_mock, calls, record_calls
     assert calls[0][0].payload == payload
 
 
+async def test_received_messages_are_batched(
+    hass, mqtt_mock, calls, record_calls, hass_ws_client
+):
+    """Test messages received by the paho thread are handed off in batches."""
+    await mqtt.async_subscribe(hass, "test-topic/+", record_calls)
+
+    mqtt_client = mqtt_mock()
+    drains = []
+
+    # Hold the drain so all messages are queued before the loop handles them
+    with patch.object(
+        hass.loop,
+        "call_soon_threadsafe",
+        side_effect=lambda func, *args: drains.append(func),
+    ):
+        for idx in range(10):
+            mqtt_client._mqtt_on_message(
+                None, None, mqtt.ReceiveMessage(f"test-topic/{idx}", b"on", 0, False)
+            )
+
+    assert len(drains) == 1
+    assert calls == []
+
+    drains[0]()
+    await hass.async_block_till_done()
+
+    assert [args[0].topic for args in calls] == [
+        f"test-topic/{idx}" for idx in range(10)
+    ]
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "mqtt/message_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["batches"] == 1
+    assert response["result"]["messages"] == 10
+    assert response["result"]["last_batch_size"] == 10
+    assert response["result"]["max_batch_size"] == 10
+    assert response["result"]["max_queue_latency"] >= 0
+
+
 async def test_subscribe_same_topic(hass, mqtt_client_mock, mqtt_mock):
     """
     Test subscring to same topic twice and simulate retained messages.
@@ -0,0 +1,70 @@
+"""The tests for the MQTT topic trie."""
+import pytest
+
+from homeassistant.components.mqtt.matcher import TopicTrie
+
+
+@pytest.mark.parametrize(
+    "topic_filter,topic,matches",
+    [
+        ("sensor/kitchen", "sensor/kitchen", True),
+        ("sensor/kitchen", "sensor/kitchen/temperature", False),
+        ("sensor/+", "sensor/kitchen", True),
+        ("sensor/+", "sensor/kitchen/temperature", False),
+        ("sensor/+/temperature", "sensor/kitchen/temperature", True),
+        ("sensor/#", "sensor", True),
+        ("sensor/#", "sensor/kitchen/temperature", True),
+        ("sensor/#", "switch/kitchen", False),
+        ("+/+", "/kitchen", True),
+        ("#", "sensor/kitchen", True),
+        ("#", "$SYS/broker/uptime", False),
+        ("+/broker/uptime", "$SYS/broker/uptime", False),
+        ("$SYS/#", "$SYS/broker/uptime", True),
+        ("$SYS/+/uptime", "$SYS/broker/uptime", True),
+    ],
+)
+def test_match(topic_filter, topic, matches):
+    """Test matching topics against topic filters."""
+    trie = TopicTrie()
+    trie.add(topic_filter, "value")
+
+    assert list(trie.iter_match(topic)) == (["value"] if matches else [])
+
+
+def test_multiple_matching_filters():
+    """Test all values of all matching filters are returned."""
+    trie = TopicTrie()
+    trie.add("home/+/light", 1)
+    trie.add("home/#", 2)
+    trie.add("home/kitchen/light", 3)
+    trie.add("home/kitchen/light", 4)
+    trie.add("home/kitchen/switch", 5)
+
+    assert sorted(trie.iter_match("home/kitchen/light")) == [1, 2, 3, 4]
+    assert len(trie) == 5
+
+
+def test_remove():
+    """Test removing values prunes the trie."""
+    trie = TopicTrie()
+    trie.add("home/kitchen/light", 1)
+    trie.add("home/kitchen/light", 2)
+    trie.add("home/#", 3)
+
+    trie.remove("home/kitchen/light", 1)
+    assert sorted(trie.iter_match("home/kitchen/light")) == [2, 3]
+    assert trie.has_filter("home/kitchen/light")
+
+    trie.remove("home/kitchen/light", 2)
+    assert not trie.has_filter("home/kitchen/light")
+    assert trie.has_filter("home/#")
+    assert list(trie.iter_match("home/kitchen/light")) == [3]
+
+    trie.remove("home/#", 3)
+    assert len(trie) == 0
+    assert not trie._root.children
+
+    with pytest.raises(KeyError):
+        trie.remove("home/#", 3)
+    with pytest.raises(KeyError):
+        trie.remove("not/added", 3)
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 import datetime
 import unittest.mock as mock
 
+import prometheus_client as prometheus_client_lib
 import pytest
 
 from homeassistant.components import climate, humidifier, sensor
@@ -254,14 +255,129 @@ async def test_view_default_namespace(hass, hass_client):
     )
 
 
+async def test_view_renders_updated_metrics(hass, hass_client):
+    """Test only the updated metrics are rendered again for a scrape."""
+    client = await prometheus_client(hass, hass_client, "")
+    resp = await client.get(
+        prometheus.API_ENDPOINT, headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.status == 200
+    assert resp.headers["Content-Encoding"] == "gzip"
+    body = await resp.text()
+    assert (
+        'sensor_unit_u0xb0{domain="sensor",'
+        'entity="sensor.wind_direction",'
+        'friendly_name="Wind Direction"} 25.0' in body
+    )
+
+    hass.states.async_set(
+        "sensor.wind_direction",
+        "30",
+        {"unit_of_measurement": DEGREE, "friendly_name": "Wind Direction"},
+    )
+    await hass.async_block_till_done()
+
+    with mock.patch(
+        f"{PROMETHEUS_PATH}.floatToGoString", wraps=prometheus.floatToGoString
+    ) as float_to_go_string:
+        resp = await client.get(prometheus.API_ENDPOINT)
+        body = await resp.text()
+
+    assert (
+        'sensor_unit_u0xb0{domain="sensor",'
+        'entity="sensor.wind_direction",'
+        'friendly_name="Wind Direction"} 30.0' in body
+    )
+    assert "python_info" in body
+    assert 'entity="sensor.radio_energy"' in body
+    # Only the series of the changed entity are rendered again, except for
+    # the creation time of its state_change counter
+    updated_series = [
+        line for line in body.split("\n") if 'entity="sensor.wind_direction"' in line
+    ]
+    assert float_to_go_string.call_count == len(updated_series) - 1
+    assert mock.call(30.0) in float_to_go_string.call_args_list
+
+    with mock.patch(
+        f"{PROMETHEUS_PATH}.floatToGoString", wraps=prometheus.floatToGoString
+    ) as float_to_go_string:
+        resp = await client.get(prometheus.API_ENDPOINT)
+        assert resp.status == 200
+
+    assert float_to_go_string.call_count == 0
+
+
+async def test_view_renders_like_prometheus_client(hass, hass_client):
+    """Test the metrics are rendered like prometheus_client renders them."""
+    client = await prometheus_client(hass, hass_client, "")
+    hass.states.async_set(
+        "sensor.wind_direction",
+        "30",
+        {"unit_of_measurement": DEGREE, "friendly_name": 'Wind "Direction"\\'},
+    )
+    await hass.async_block_till_done()
+    resp = await client.get(prometheus.API_ENDPOINT)
+    body = await resp.text()
+
+    registry = prometheus_client_lib.CollectorRegistry()
+    labels = {
+        "entity": "sensor.wind_direction",
+        "friendly_name": 'Wind "Direction"\\',
+        "domain": "sensor",
+    }
+    prometheus_client_lib.Gauge(
+        "sensor_unit_u0xb0", "Sensor data measured in °", labels, registry=registry
+    ).labels(**labels).set(30)
+    expected = prometheus_client_lib.generate_latest(registry).decode()
+    for line in expected.split("\n")[:-1]:
+        assert f"\n{line}\n" in body
+
+    # The sample of the creation time of the counter is left out
+    registry = prometheus_client_lib.CollectorRegistry()
+    prometheus_client_lib.Counter(
+        "state_change", "The number of state changes", labels, registry=registry
+    ).labels(**labels).inc()
+    expected = prometheus_client_lib.generate_latest(registry).decode()
+    for line in expected.split("\n")[:-2]:
+        assert f"\n{line}\n" in body
+
+
+async def test_view_friendly_name_change(hass, hass_client):
+    """Test a new friendly_name starts new series."""
+    client = await prometheus_client(hass, hass_client, "")
+    hass.states.async_set(
+        "sensor.wind_direction",
+        "30",
+        {"unit_of_measurement": DEGREE, "friendly_name": "Wind"},
+    )
+    await hass.async_block_till_done()
+    resp = await client.get(prometheus.API_ENDPOINT)
+    body = await resp.text()
+
+    assert (
+        'sensor_unit_u0xb0{domain="sensor",'
+        'entity="sensor.wind_direction",'
+        'friendly_name="Wind Direction"} 25.0' in body
+    )
+    assert (
+        'sensor_unit_u0xb0{domain="sensor",'
+        'entity="sensor.wind_direction",'
+        'friendly_name="Wind"} 30.0' in body
+    )
+    assert (
+        'state_change_total{domain="sensor",'
+        'entity="sensor.wind_direction",'
+        'friendly_name="Wind"} 1.0' in body
+    )
+
+
 @pytest.fixture(name="mock_client")
 def mock_client_fixture():
-    """Mock the prometheus client."""
-    with mock.patch(f"{PROMETHEUS_PATH}.prometheus_client") as client:
-        counter_client = mock.MagicMock()
-        client.Counter = mock.MagicMock(return_value=counter_client)
-        setattr(counter_client, "labels", mock.MagicMock(return_value=mock.MagicMock()))
-        yield counter_client
+    """Mock the prometheus client and the increments of the counters."""
+    with mock.patch(f"{PROMETHEUS_PATH}.prometheus_client"), mock.patch(
+        f"{PROMETHEUS_PATH}.RenderedSeries.inc"
+    ) as counter_inc:
+        yield counter_inc
 
 
 @pytest.fixture
@@ -353,9 +469,9 @@ async def test_allowlist(hass, mock_client):
         event = make_event(test.id)
         handler_method(event)
 
-        was_called = mock_client.labels.call_count == 1
+        was_called = mock_client.call_count == 1
         assert test.should_pass == was_called
-        mock_client.labels.reset_mock()
+        mock_client.reset_mock()
 
 
 @pytest.mark.usefixtures("mock_bus")
@@ -383,9 +499,9 @@ async def test_denylist(hass, mock_client):
         event = make_event(test.id)
         handler_method(event)
 
-        was_called = mock_client.labels.call_count == 1
+        was_called = mock_client.call_count == 1
         assert test.should_pass == was_called
-        mock_client.labels.reset_mock()
+        mock_client.reset_mock()
 
 
 @pytest.mark.usefixtures("mock_bus")
@@ -414,6 +530,6 @@ async def test_filtered_denylist(hass, mock_client):
         event = make_event(test.id)
         handler_method(event)
 
-        was_called = mock_client.labels.call_count == 1
+        was_called = mock_client.call_count == 1
         assert test.should_pass == was_called
-        mock_client.labels.reset_mock()
+        mock_client.reset_mock()
@@ -30,9 +30,11 @@ async def async_setup_recorder_instance(
         hass: HomeAssistant, config: ConfigType | None = None
     ) -> Recorder:
         """Setup and return recorder instance."""  # noqa: D401
-        stats = recorder.Recorder.async_hourly_statistics if enable_statistics else None
+        stats = (
+            recorder.Recorder.async_periodic_statistics if enable_statistics else None
+        )
         with patch(
-            "homeassistant.components.recorder.Recorder.async_hourly_statistics",
+            "homeassistant.components.recorder.Recorder.async_periodic_statistics",
             side_effect=stats,
             autospec=True,
         ):
@@ -6,7 +6,9 @@ import json
 from unittest.mock import patch, sentinel
 
 from homeassistant.components.recorder import history
+from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.util import session_scope
 import homeassistant.core as ha
 from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
@@ -358,6 +360,82 @@ def test_get_significant_states_only(hass_recorder):
     assert states == hist[entity_id]
 
 
+def test_get_significant_states_from_history_cache(hass_recorder):
+    """Test significant states from the history cache match the database."""
+    hass = hass_recorder({"history_cache_size": 10})
+    zero, four, _ = record_states(hass)
+    instance = hass.data[DATA_INSTANCE]
+    start = zero + timedelta(seconds=2.5)
+    entity_ids = [
+        "media_player.test",
+        "media_player.test3",
+        "thermostat.test",
+        "script.can_cancel_this_one",
+    ]
+
+    for kwargs in (
+        {},
+        {"minimal_response": True},
+        {"significant_changes_only": False},
+        {"include_start_time_state": False},
+        {"end_time": zero + timedelta(seconds=3)},
+    ):
+        kwargs.setdefault("end_time", four)
+        hist = history.get_significant_states(
+            hass, start, entity_ids=entity_ids, **kwargs
+        )
+        with patch.object(instance, "history_cache", None):
+            db_hist = history.get_significant_states(
+                hass, start, entity_ids=entity_ids, **kwargs
+            )
+        assert hist
+        assert json.dumps(hist, cls=JSONEncoder) == json.dumps(db_hist, cls=JSONEncoder)
+
+    assert instance.history_cache.hits == 5
+    assert instance.history_cache.misses == 0
+
+    # The state of the script at the start is not cached
+    hist = history.get_significant_states(hass, zero, four, entity_ids=entity_ids)
+    assert instance.history_cache.misses == 1
+    assert list(hist) == entity_ids
+
+
+def test_iter_significant_states(hass_recorder):
+    """Test streaming significant states per entity matches the dict."""
+    hass = hass_recorder()
+    zero, four, _ = record_states(hass)
+    start = zero + timedelta(seconds=2.5)
+    entity_ids = ["thermostat.test", "media_player.test", "script.can_cancel_this_one"]
+
+    for kwargs in (
+        {},
+        {"entity_ids": entity_ids},
+        {"minimal_response": True},
+        {"include_start_time_state": False},
+    ):
+        hist = history.get_significant_states(hass, start, four, **kwargs)
+        with session_scope(hass=hass) as session:
+            streamed = dict(
+                history._iter_significant_states(hass, session, start, four, **kwargs)
+            )
+        assert json.dumps(streamed, cls=JSONEncoder, sort_keys=True) == json.dumps(
+            hist, cls=JSONEncoder, sort_keys=True
+        )
+        if "entity_ids" in kwargs:
+            assert list(streamed) == entity_ids
+
+    # Only the rows of the first entity are processed for the first result
+    hist = history.get_significant_states(hass, zero, four)
+    with session_scope(hass=hass) as session, patch.object(
+        history, "_extend_entity_states", wraps=history._extend_entity_states
+    ) as extend_mock:
+        entity_states = history._iter_significant_states(hass, session, zero, four)
+        entity_id, states = next(entity_states)
+        assert extend_mock.call_count == 1
+        assert states == hist[entity_id]
+        assert len(list(entity_states)) == len(hist) - 1
+
+
 def record_states(hass):
     """Record some test states.
 
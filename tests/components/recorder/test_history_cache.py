@@ -0,0 +1,199 @@
+"""The tests for the recorder history cache."""
+from datetime import timedelta
+
+from homeassistant.components.recorder.history_cache import MAX_AGE, HistoryCache
+from homeassistant.const import EVENT_STATE_CHANGED
+import homeassistant.core as ha
+import homeassistant.util.dt as dt_util
+
+
+def _state_changed(entity_id, old_state, new_state, time_fired):
+    """Return a state_changed event."""
+    return ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": entity_id, "old_state": old_state, "new_state": new_state},
+        time_fired=time_fired,
+    )
+
+
+def _set_states(history_cache, entity_id, start, count, step=timedelta(seconds=1)):
+    """Add count state changes of an entity, one every step."""
+    old_state = None
+    states = []
+    for idx in range(count):
+        point_in_time = start + idx * step
+        new_state = ha.State(
+            entity_id,
+            str(idx),
+            {"idx": idx},
+            last_changed=point_in_time,
+            last_updated=point_in_time,
+        )
+        history_cache.async_add(
+            _state_changed(entity_id, old_state, new_state, point_in_time)
+        )
+        states.append(new_state)
+        old_state = new_state
+    return states
+
+
+def test_states_during_period():
+    """Test getting the states at the start and during a period."""
+    history_cache = HistoryCache(100)
+    start = dt_util.utcnow()
+    _set_states(history_cache, "sensor.one", start, 10)
+    _set_states(history_cache, "sensor.two", start, 10)
+
+    start_states, changes = history_cache.get_states_during_period(
+        start + timedelta(seconds=4.5),
+        start + timedelta(seconds=7),
+        ["sensor.two", "sensor.one"],
+        True,
+    )
+    assert [(row.entity_id, row.state) for row in start_states] == [
+        ("sensor.one", "4"),
+        ("sensor.two", "4"),
+    ]
+    assert [(row.entity_id, row.state) for row in changes] == [
+        ("sensor.one", "5"),
+        ("sensor.one", "6"),
+        ("sensor.two", "5"),
+        ("sensor.two", "6"),
+    ]
+    assert changes[0].attributes == '{"idx":5}'
+    assert changes[0].last_updated == start + timedelta(seconds=5)
+
+    # States updated exactly at the start are neither the start state nor a change
+    start_states, changes = history_cache.get_states_during_period(
+        start + timedelta(seconds=4), None, ["sensor.one"], True
+    )
+    assert start_states[0].state == "3"
+    assert [row.state for row in changes] == ["5", "6", "7", "8", "9"]
+
+    assert history_cache.hits == 2
+    assert history_cache.misses == 0
+
+
+def test_states_during_period_not_cached():
+    """Test periods starting before the cached states are not answered."""
+    history_cache = HistoryCache(100)
+    start = dt_util.utcnow()
+    _set_states(history_cache, "sensor.one", start, 10)
+
+    assert (
+        history_cache.get_states_during_period(start, None, ["sensor.one"], True)
+        is None
+    )
+    assert (
+        history_cache.get_states_during_period(
+            start + timedelta(seconds=5), None, ["sensor.one", "sensor.two"], True
+        )
+        is None
+    )
+    assert history_cache.misses == 2
+
+
+def test_old_state_is_kept_as_start_state():
+    """Test the old state of the first event is the state before it."""
+    history_cache = HistoryCache(100)
+    now = dt_util.utcnow()
+    old_state = ha.State("light.kitchen", "off", last_updated=now - timedelta(hours=1))
+    new_state = ha.State("light.kitchen", "on", last_updated=now)
+    history_cache.async_add(_state_changed("light.kitchen", old_state, new_state, now))
+
+    start_states, changes = history_cache.get_states_during_period(
+        now - timedelta(minutes=5), None, ["light.kitchen"], True
+    )
+    assert [row.state for row in start_states] == ["off"]
+    assert [row.state for row in changes] == ["on"]
+
+
+def test_significant_changes_only():
+    """Test attribute only changes are skipped for significant changes."""
+    history_cache = HistoryCache(100)
+    now = dt_util.utcnow()
+    old_state = ha.State("light.kitchen", "on", {"brightness": 1}, last_updated=now)
+    new_state = ha.State(
+        "light.kitchen",
+        "on",
+        {"brightness": 2},
+        last_changed=now,
+        last_updated=now + timedelta(seconds=1),
+    )
+    history_cache.async_add(
+        _state_changed("light.kitchen", old_state, new_state, new_state.last_updated)
+    )
+
+    _, changes = history_cache.get_states_during_period(
+        now + timedelta(microseconds=1), None, ["light.kitchen"], True
+    )
+    assert changes == []
+    _, changes = history_cache.get_states_during_period(
+        now + timedelta(microseconds=1), None, ["light.kitchen"], False
+    )
+    assert [row.attributes for row in changes] == ['{"brightness":2}']
+
+
+def test_memory_is_bounded():
+    """Test the number and age of the cached states is bounded."""
+    history_cache = HistoryCache(10)
+    start = dt_util.utcnow()
+    _set_states(history_cache, "sensor.one", start, 100)
+    assert history_cache.stats().states <= 10 + 10 // 4
+
+    history_cache = HistoryCache(100)
+    _set_states(history_cache, "sensor.one", start, 10, step=MAX_AGE * 0.3)
+    stats = history_cache.stats()
+    assert stats.entities == 1
+    # The states within the maximum age and the last one before it are kept
+    assert stats.states == 5
+    assert stats.memory > 0
+
+
+def test_memory_is_bounded_over_entities():
+    """Test the entities with the most states lose their oldest states first."""
+    history_cache = HistoryCache(20)
+    start = dt_util.utcnow()
+    _set_states(history_cache, "sensor.small", start, 3)
+    for idx in range(5):
+        _set_states(history_cache, f"sensor.large_{idx}", start, 10)
+
+    stats = history_cache.stats()
+    assert stats.entities == 6
+    assert stats.states <= 20 + 20 // 4
+
+    # The small entity is kept whole, the large ones keep their newest states
+    assert history_cache.get_states_during_period(
+        start + timedelta(seconds=1), None, ["sensor.small"], False
+    )
+    assert (
+        history_cache.get_states_during_period(
+            start + timedelta(seconds=1), None, ["sensor.large_0"], False
+        )
+        is None
+    )
+    start_states, changes = history_cache.get_states_during_period(
+        start + timedelta(seconds=7.5), None, ["sensor.large_0"], False
+    )
+    assert [row.state for row in start_states + changes] == ["7", "8", "9"]
+
+
+def test_remove_and_evict():
+    """Test forgetting the states of entities."""
+    history_cache = HistoryCache(100)
+    start = dt_util.utcnow()
+    states = _set_states(history_cache, "sensor.one", start, 2)
+    _set_states(history_cache, "sensor.two", start, 2)
+    _set_states(history_cache, "sensor.three", start, 2)
+    assert history_cache.stats().entities == 3
+
+    history_cache.async_add(
+        _state_changed("sensor.one", states[-1], None, start + timedelta(seconds=2))
+    )
+    assert history_cache.stats().entities == 2
+
+    history_cache.evict(lambda entity_id: entity_id == "sensor.two")
+    assert history_cache.stats().entities == 1
+
+    history_cache.clear()
+    assert history_cache.stats().entities == 0
@@ -5,12 +5,16 @@ import sqlite3
 from unittest.mock import patch
 
 import pytest
+from sqlalchemy import text
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
+    CONF_BULK_INSERT,
+    CONF_COMPACT_STATES,
     CONF_DB_URL,
+    CONF_READ_POOL_SIZE,
     CONFIG_SCHEMA,
     DOMAIN,
     KEEPALIVE_TIME,
@@ -20,6 +24,7 @@ from homeassistant.components.recorder import (
     SERVICE_PURGE_ENTITIES,
     SQLITE_URL_PREFIX,
     Recorder,
+    history,
     run_information,
     run_information_from_instance,
     run_information_with_session,
@@ -28,15 +33,18 @@ from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     process_timestamp,
 )
 from homeassistant.components.recorder.util import session_scope
+from homeassistant.components.recorder.writer import BulkWriter
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     MATCH_ALL,
     STATE_LOCKED,
     STATE_UNLOCKED,
@@ -147,6 +155,270 @@ async def test_saving_state(
     assert state == _state_empty_context(hass, entity_id)
 
 
+async def test_saving_states_shares_attributes(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test states with the same attributes share one attributes row."""
+    instance = await async_setup_recorder_instance(hass)
+
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    hass.states.async_set("test.one", "on", attributes)
+    hass.states.async_set("test.two", "on", attributes)
+    await async_wait_recording_done(hass, instance)
+    # Attributes already in the database
+    hass.states.async_set("test.three", "on", attributes)
+    # Attributes unchanged since the previous state
+    hass.states.async_set("test.one", "off", attributes)
+    hass.states.async_set("test.two", "off", {"test_attr": 6})
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        db_attributes = {
+            attributes.attributes_id: attributes.to_native()
+            for attributes in session.query(StateAttributes)
+        }
+        assert list(db_attributes.values()) == [attributes, {"test_attr": 6}]
+
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert all(db_state.attributes is None for db_state in db_states)
+        assert [
+            (db_state.entity_id, db_attributes[db_state.attributes_id])
+            for db_state in db_states
+        ] == [
+            ("test.one", attributes),
+            ("test.two", attributes),
+            ("test.three", attributes),
+            ("test.one", attributes),
+            ("test.two", {"test_attr": 6}),
+        ]
+        assert db_states[-1].to_native() == _state_empty_context(hass, "test.two")
+
+
+async def test_saving_states_bulk_insert(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test saving states and events with the bulk insert write path."""
+    instance = await async_setup_recorder_instance(hass, {CONF_BULK_INSERT: True})
+    assert instance._bulk_writer is not None
+
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    hass.states.async_set("test.one", "on", attributes)
+    hass.states.async_set("test.two", "on", attributes)
+    hass.bus.async_fire("test_event", {"some_data": 1})
+    await async_wait_recording_done(hass, instance)
+    hass.states.async_set("test.one", "off", attributes)
+    hass.states.async_set("test.two", "off", {"test_attr": 6})
+    hass.states.async_remove("test.one")
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        # Attributes of test.one, test.two and the removed state
+        assert session.query(StateAttributes).count() == 3
+
+        db_events = list(
+            session.query(Events).filter(Events.event_type == "test_event")
+        )
+        assert len(db_events) == 1
+        assert db_events[0].to_native().data == {"some_data": 1}
+
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert [
+            (db_state.entity_id, db_state.state, db_state.to_native().attributes)
+            for db_state in db_states[:-1]
+        ] == [
+            ("test.one", "on", attributes),
+            ("test.two", "on", attributes),
+            ("test.one", "off", attributes),
+            ("test.two", "off", {"test_attr": 6}),
+        ]
+        assert db_states[0].attributes_id == db_states[2].attributes_id
+        assert db_states[2].old_state_id == db_states[0].state_id
+        assert db_states[3].old_state_id == db_states[1].state_id
+        assert db_states[4].entity_id == "test.one"
+        assert db_states[4].state is None
+        assert db_states[4].old_state_id == db_states[2].state_id
+        assert all(
+            db_state.event.event_type == EVENT_STATE_CHANGED for db_state in db_states
+        )
+        assert db_states[3].to_native() == _state_empty_context(hass, "test.two")
+
+
+@pytest.mark.parametrize("bulk_insert", [False, True])
+@pytest.mark.parametrize("compact_states", [False, True])
+async def test_saving_states_compact(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: SetupRecorderInstanceT,
+    bulk_insert,
+    compact_states,
+):
+    """Test last_changed is only NULL with the compact_states option."""
+    instance = await async_setup_recorder_instance(
+        hass, {CONF_BULK_INSERT: bulk_insert, CONF_COMPACT_STATES: compact_states}
+    )
+    start = dt_util.utcnow()
+    hass.states.async_set("test.one", "on", {"test_attr": 5})
+    await async_wait_recording_done(hass, instance)
+    # Only the attributes change, so last_changed differs from last_updated
+    hass.states.async_set("test.one", "on", {"test_attr": 6})
+    await async_wait_recording_done(hass, instance)
+    state = hass.states.get("test.one")
+
+    with session_scope(hass=hass) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert len(db_states) == 2
+        assert (db_states[0].last_changed is None) == compact_states
+        assert process_timestamp(db_states[1].last_changed) == state.last_changed
+        assert db_states[1].to_native() == _state_empty_context(hass, "test.one")
+
+    # The attribute change is not a significant change in either layout
+    states = await hass.async_add_executor_job(
+        history.get_significant_states, hass, start, None, ["test.one"]
+    )
+    assert [(state.attributes, state.last_changed) for state in states["test.one"]] == [
+        ({"test_attr": 5}, state.last_changed)
+    ]
+
+
+async def test_bulk_insert_reset_after_failed_commit(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test the bulk insert ids continue from the database after a failed commit."""
+    instance = await async_setup_recorder_instance(hass, {CONF_BULK_INSERT: True})
+    hass.states.async_set("test.one", "on")
+    await async_wait_recording_done(hass, instance)
+
+    original_write = BulkWriter.write
+
+    def failing_write(writer, session):
+        original_write(writer, session)
+        raise SQLAlchemyError("commit failed")
+
+    with patch.object(BulkWriter, "write", failing_write):
+        hass.states.async_set("test.one", "off")
+        hass.states.async_set("test.two", "on")
+        await async_wait_recording_done(hass, instance)
+
+    hass.states.async_set("test.one", "unlocked")
+    hass.bus.async_fire("test_event")
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert [(db_state.entity_id, db_state.state) for db_state in db_states] == [
+            ("test.one", "on"),
+            ("test.one", "unlocked"),
+        ]
+        # The ids of the rolled back rows are assigned again
+        assert db_states[1].state_id == db_states[0].state_id + 1
+        # The old state was forgotten with the event session
+        assert db_states[1].old_state_id is None
+        assert db_states[1].event.event_type == EVENT_STATE_CHANGED
+        assert session.query(Events).filter_by(event_type="test_event").count() == 1
+
+
+async def test_bulk_insert_shared_database(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test bulk insert moves its rows above the rows of another writer."""
+    instance = await async_setup_recorder_instance(hass, {CONF_BULK_INSERT: True})
+    hass.states.async_set("test.one", "on")
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        other_attributes = StateAttributes(hash=0, shared_attrs="{}")
+        other_event = Events(event_type="other_writer", origin="LOCAL")
+        session.add_all((other_attributes, other_event))
+        session.flush()
+        session.add(
+            States(
+                entity_id="test.other",
+                domain="test",
+                state="other",
+                event_id=other_event.event_id,
+                attributes_id=other_attributes.attributes_id,
+            )
+        )
+
+    hass.states.async_set("test.one", "off", {"attr": 1})
+    await async_wait_recording_done(hass, instance)
+    hass.states.async_set("test.one", "unlocked", {"attr": 1})
+    await async_wait_recording_done(hass, instance)
+    assert instance._bulk_writer is not None
+
+    with session_scope(hass=hass) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert [(db_state.entity_id, db_state.state) for db_state in db_states] == [
+            ("test.one", "on"),
+            ("test.other", "other"),
+            ("test.one", "off"),
+            ("test.one", "unlocked"),
+        ]
+        assert db_states[2].old_state_id == db_states[0].state_id
+        assert db_states[3].old_state_id == db_states[2].state_id
+        assert db_states[2].event.event_type == EVENT_STATE_CHANGED
+        assert db_states[3].attributes_id == db_states[2].attributes_id
+        assert db_states[3].to_native() == _state_empty_context(hass, "test.one")
+        assert session.query(Events).filter_by(event_type="other_writer").count() == 1
+        assert session.query(StateAttributes).count() == 3
+
+
+@pytest.mark.parametrize(
+    "service, service_data, kept_entity_ids",
+    [
+        (SERVICE_PURGE_ENTITIES, {"entity_id": "test.two"}, ["test.one"]),
+        (SERVICE_PURGE, {"keep_days": 0}, []),
+    ],
+)
+async def test_bulk_insert_after_purge(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: SetupRecorderInstanceT,
+    service,
+    service_data,
+    kept_entity_ids,
+):
+    """Test bulk insert continues from the ids left by a purge."""
+    instance = await async_setup_recorder_instance(hass, {CONF_BULK_INSERT: True})
+    hass.states.async_set("test.one", "on")
+    hass.states.async_set("test.two", "on", {"attr": 1})
+    await async_wait_recording_done(hass, instance)
+
+    # Purge the newest rows so the highest ids go down
+    with patch(
+        "homeassistant.components.recorder.dt_util.utcnow",
+        return_value=dt_util.utcnow() + timedelta(seconds=1),
+    ):
+        await hass.services.async_call(DOMAIN, service, service_data, blocking=True)
+        await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        kept_states = [
+            (db_state.state_id, db_state.entity_id, db_state.state)
+            for db_state in session.query(States).order_by(States.state_id)
+        ]
+    assert [entity_id for _, entity_id, _ in kept_states] == kept_entity_ids
+    last_state_id = kept_states[-1][0] if kept_states else 0
+
+    hass.states.async_set("test.one", "off")
+    hass.states.async_set("test.two", "off", {"attr": 2})
+    await async_wait_recording_done(hass, instance)
+    assert instance._bulk_writer is not None
+
+    with session_scope(hass=hass) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert [
+            (db_state.state_id, db_state.entity_id, db_state.state)
+            for db_state in db_states
+        ] == kept_states + [
+            (last_state_id + 1, "test.one", "off"),
+            (last_state_id + 2, "test.two", "off"),
+        ]
+        for db_state in db_states[-2:]:
+            assert db_state.to_native() == _state_empty_context(
+                hass, db_state.entity_id
+            )
+            assert db_state.event.event_type == EVENT_STATE_CHANGED
+
+
 async def test_saving_many_states(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -199,6 +471,26 @@ async def test_saving_state_with_intermixed_time_changes(
         assert db_states[0].event_id > 0
 
 
+async def test_keep_alive(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test the connection is kept alive every KEEPALIVE_TIME seconds."""
+    instance = await async_setup_recorder_instance(hass)
+
+    with patch.object(instance, "_send_keep_alive") as send_keep_alive:
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=KEEPALIVE_TIME - 1)
+        )
+        await async_wait_recording_done(hass, instance)
+        assert send_keep_alive.call_count == 0
+
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=KEEPALIVE_TIME + 1)
+        )
+        await async_wait_recording_done(hass, instance)
+        assert send_keep_alive.call_count == 1
+
+
 def test_saving_state_with_exception(hass, hass_recorder, caplog):
     """Test saving and restoring a state."""
     hass = hass_recorder()
@@ -700,41 +992,41 @@ def test_auto_statistics(hass_recorder):
     tz = dt_util.get_time_zone("Europe/Copenhagen")
     dt_util.set_default_time_zone(tz)
 
-    # Statistics is scheduled to happen at *:12am every hour. Exercise this behavior by
+    # Statistics is scheduled to happen every 5 minutes. Exercise this behavior by
     # firing time changed events and advancing the clock around this time. Pick an
     # arbitrary year in the future to avoid boundary conditions relative to the current
     # date.
     #
-    # The clock is started at 4:15am then advanced forward below
+    # The clock is started at 4:16am then advanced forward below
     now = dt_util.utcnow()
-    test_time = datetime(now.year + 2, 1, 1, 4, 15, 0, tzinfo=tz)
+    test_time = datetime(now.year + 2, 1, 1, 4, 16, 0, tzinfo=tz)
     run_tasks_at_time(hass, test_time)
 
     with patch(
         "homeassistant.components.recorder.statistics.compile_statistics",
         return_value=True,
     ) as compile_statistics:
-        # Advance one hour, and the statistics task should run
-        test_time = test_time + timedelta(hours=1)
+        # Advance 5 minutes, and the statistics task should run
+        test_time = test_time + timedelta(minutes=5)
         run_tasks_at_time(hass, test_time)
         assert len(compile_statistics.mock_calls) == 1
 
         compile_statistics.reset_mock()
 
-        # Advance one hour, and the statistics task should run again
-        test_time = test_time + timedelta(hours=1)
+        # Advance 5 minutes, and the statistics task should run again
+        test_time = test_time + timedelta(minutes=5)
         run_tasks_at_time(hass, test_time)
         assert len(compile_statistics.mock_calls) == 1
 
         compile_statistics.reset_mock()
 
-        # Advance less than one full hour. The task should not run.
-        test_time = test_time + timedelta(minutes=50)
+        # Advance less than 5 minutes. The task should not run.
+        test_time = test_time + timedelta(minutes=3)
         run_tasks_at_time(hass, test_time)
         assert len(compile_statistics.mock_calls) == 0
 
-        # Advance to the next hour, and the statistics task should run again
-        test_time = test_time + timedelta(hours=1)
+        # Advance 5 minutes, and the statistics task should run again
+        test_time = test_time + timedelta(minutes=5)
         run_tasks_at_time(hass, test_time)
         assert len(compile_statistics.mock_calls) == 1
 
@@ -754,8 +1046,8 @@ def test_statistics_runs_initiated(hass_recorder):
             assert len(statistics_runs) == 1
             last_run = process_timestamp(statistics_runs[0].start)
             assert process_timestamp(last_run) == now.replace(
-                minute=0, second=0, microsecond=0
-            ) - timedelta(hours=1)
+                minute=now.minute - now.minute % 5, second=0, microsecond=0
+            ) - timedelta(minutes=5)
 
 
 def test_compile_missing_statistics(tmpdir):
@@ -776,7 +1068,7 @@ def test_compile_missing_statistics(tmpdir):
             statistics_runs = list(session.query(StatisticsRuns))
             assert len(statistics_runs) == 1
             last_run = process_timestamp(statistics_runs[0].start)
-            assert last_run == now - timedelta(hours=1)
+            assert last_run == now - timedelta(minutes=5)
 
         wait_recording_done(hass)
         wait_recording_done(hass)
@@ -795,7 +1087,7 @@ def test_compile_missing_statistics(tmpdir):
 
         with session_scope(hass=hass) as session:
             statistics_runs = list(session.query(StatisticsRuns))
-            assert len(statistics_runs) == 2
+            assert len(statistics_runs) == 13  # 12 5-minute runs
             last_run = process_timestamp(statistics_runs[1].start)
             assert last_run == now
 
@@ -1035,6 +1327,48 @@ def test_service_disable_run_information_recorded(tmpdir):
     hass.stop()
 
 
+def test_read_only_pool(tmpdir):
+    """Test queries outside the recorder thread use the read only pool."""
+    test_db_file = tmpdir.mkdir("sqlite").join("test_read_pool.db")
+    dburl = f"{SQLITE_URL_PREFIX}//{test_db_file}"
+
+    hass = get_test_home_assistant()
+    setup_component(
+        hass, DOMAIN, {DOMAIN: {CONF_DB_URL: dburl, CONF_READ_POOL_SIZE: 2}}
+    )
+    hass.start()
+    start = dt_util.utcnow()
+    hass.states.set("sensor.test", "1")
+    hass.states.set("sensor.test", "2")
+    wait_recording_done(hass)
+
+    read_engine = hass.data[DATA_INSTANCE].read_engine
+    assert read_engine is not None
+    states = history.state_changes_during_period(hass, start)
+    assert [state.state for state in states["sensor.test"]] == ["1", "2"]
+    stats = read_engine.pool.stats()
+    assert stats.size == 2
+    assert stats.checked_out == 0
+    assert stats.checkouts == 1
+
+    with pytest.raises(OperationalError), session_scope(
+        hass=hass, read_only=True
+    ) as session:
+        session.execute(text("DELETE FROM states"))
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 2
+
+    hass.stop()
+    assert hass.data[DATA_INSTANCE].read_engine is None
+
+
+def test_read_only_pool_in_memory(hass_recorder):
+    """Test an in memory database has no read only pool."""
+    hass = hass_recorder({CONF_READ_POOL_SIZE: 2})
+    assert hass.data[DATA_INSTANCE].read_engine is None
+
+
 class CannotSerializeMe:
     """A class that the JSONEncoder cannot serialize."""
 
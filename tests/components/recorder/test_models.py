@@ -1,5 +1,6 @@
 """The tests for the Recorder component."""
-from datetime import datetime
+from datetime import datetime, timedelta
+from unittest.mock import Mock
 
 import pytest
 from sqlalchemy import create_engine
@@ -8,6 +9,7 @@ from sqlalchemy.orm import scoped_session, sessionmaker
 from homeassistant.components.recorder.models import (
     Base,
     Events,
+    LazyState,
     RecorderRuns,
     States,
     process_timestamp,
@@ -26,6 +28,22 @@ def test_from_event_to_db_event():
     assert event == Events.from_event(event).to_native()
 
 
+def test_from_event_to_db_event_entity_id():
+    """Test the entity_id of events is recorded in its own column."""
+    event = ha.Event("test_event", {"entity_id": "light.kitchen"})
+    assert Events.from_event(event).entity_id == "light.kitchen"
+
+    event = ha.Event("test_event", {"entity_id": ["light.kitchen", "light.hall"]})
+    assert Events.from_event(event).entity_id is None
+
+    state = ha.State("sensor.temperature", "18")
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+    )
+    assert Events.from_event(event).entity_id is None
+
+
 def test_from_event_to_db_state():
     """Test converting event to db state."""
     state = ha.State("sensor.temperature", "18")
@@ -58,6 +76,61 @@ def test_from_event_to_delete_state():
     assert db_state.last_changed == event.time_fired
     assert db_state.last_updated == event.time_fired
 
+    db_state = States.from_event(event, compact=True)
+    assert db_state.last_changed is None
+    assert db_state.last_updated == event.time_fired
+
+
+def test_from_event_to_db_state_last_changed():
+    """Test the compact layout only stores last_changed if it differs."""
+    last_changed = dt_util.utcnow()
+    state = ha.State(
+        "sensor.temperature",
+        "18",
+        last_changed=last_changed,
+        last_updated=last_changed,
+    )
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+    )
+    db_state = States.from_event(event)
+    assert db_state.last_changed == last_changed
+    db_state = States.from_event(event, compact=True)
+    assert db_state.last_changed is None
+    assert db_state.to_native().last_changed == last_changed
+
+    state = ha.State(
+        "sensor.temperature",
+        "18",
+        last_changed=last_changed,
+        last_updated=last_changed + timedelta(seconds=1),
+    )
+    event.data["new_state"] = state
+    db_state = States.from_event(event, compact=True)
+    assert db_state.last_changed == last_changed
+    assert db_state.to_native().last_changed == last_changed
+
+
+def test_lazy_state_last_changed():
+    """Test LazyState falls back to last_updated without last_changed."""
+    last_updated = datetime(2021, 9, 1, 12, 0, 0)
+    row = Mock(
+        entity_id="sensor.temperature",
+        state="18",
+        attributes="{}",
+        last_changed=None,
+        last_updated=last_updated,
+    )
+    lazy_state = LazyState(row)
+    assert lazy_state.last_changed == last_updated.replace(tzinfo=dt_util.UTC)
+    assert lazy_state.as_dict()["last_changed"] == "2021-09-01T12:00:00+00:00"
+
+    row.last_changed = last_updated - timedelta(hours=1)
+    lazy_state = LazyState(row)
+    assert lazy_state.as_dict()["last_changed"] == "2021-09-01T11:00:00+00:00"
+    assert lazy_state.as_dict()["last_updated"] == "2021-09-01T12:00:00+00:00"
+
 
 def test_entity_ids():
     """Test if entity ids helper method works."""
@@ -4,7 +4,7 @@ import threading
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from homeassistant.components.recorder.pool import RecorderPool
+from homeassistant.components.recorder.pool import ReadOnlyPool, RecorderPool
 
 
 def test_recorder_pool():
@@ -32,3 +32,24 @@ def test_recorder_pool():
     new_thread.join()
 
     assert connections[2] != connections[3]
+
+
+def test_read_only_pool_stats(tmp_path):
+    """Test ReadOnlyPool counts the checkouts waiting for a connection."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}",
+        poolclass=ReadOnlyPool,
+        pool_size=1,
+        max_overflow=0,
+        connect_args={"check_same_thread": False},
+    )
+    connection = engine.connect()
+    assert engine.pool.stats() == (1, 1, 1, 1, 0)
+
+    waiting = threading.Thread(target=lambda: engine.connect().close())
+    waiting.start()
+    waiting.join(0.1)
+    connection.close()
+    waiting.join()
+
+    assert engine.pool.stats() == (1, 0, 1, 2, 1)
@@ -10,7 +10,13 @@ from sqlalchemy.orm.session import Session
 from homeassistant.components import recorder
 from homeassistant.components.recorder import PurgeTask
 from homeassistant.components.recorder.const import MAX_ROWS_TO_PURGE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.purge import purge_old_data
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -61,6 +67,175 @@ async def test_purge_old_states(
         assert states.count() == 2
 
 
+async def test_purge_old_states_in_time_ranges(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test old states are purged oldest time range first."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_states(hass, instance)
+
+    with session_scope(hass=hass) as session, patch(
+        "homeassistant.components.recorder.purge.MAX_ROWS_TO_PURGE", 2
+    ):
+        states = session.query(States)
+        assert states.count() == 6
+        events = session.query(Events).filter(Events.event_type == "state_changed")
+        assert events.count() == 6
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        assert {state.state for state in states} == {"purgeme", "dontpurgeme"}
+        assert events.count() == 4
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        assert {state.state for state in states} == {"dontpurgeme"}
+        assert events.count() == 2
+        assert states[0].old_state_id is None
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert finished
+        assert states.count() == 2
+
+
+async def test_purge_old_states_with_shared_attributes(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test deleting old states removes the attributes no longer used."""
+    instance = await async_setup_recorder_instance(hass)
+
+    utcnow = dt_util.utcnow()
+    eleven_days_ago = utcnow - timedelta(days=11)
+
+    await async_wait_recording_done(hass, instance)
+
+    with recorder.session_scope(hass=hass) as session:
+        only_old = StateAttributes(shared_attrs='{"old":true}', hash=1)
+        old_and_new = StateAttributes(shared_attrs='{"new":true}', hash=2)
+        for idx, (timestamp, attributes) in enumerate(
+            (
+                (eleven_days_ago, only_old),
+                (eleven_days_ago, only_old),
+                (eleven_days_ago, old_and_new),
+                (utcnow, old_and_new),
+            )
+        ):
+            event = Events(
+                event_type="state_changed",
+                event_data="{}",
+                origin="LOCAL",
+                created=timestamp,
+                time_fired=timestamp,
+            )
+            session.add(event)
+            session.flush()
+            session.add(
+                States(
+                    entity_id=f"test.recorder{idx}",
+                    domain="test",
+                    state="on",
+                    state_attributes=attributes,
+                    last_changed=timestamp,
+                    last_updated=timestamp,
+                    created=timestamp,
+                    event_id=event.event_id,
+                )
+            )
+        session.flush()
+        old_and_new_id = old_and_new.attributes_id
+        instance._state_attributes_ids['{"old":true}'] = only_old.attributes_id
+        instance._state_attributes_ids['{"new":true}'] = old_and_new_id
+
+    with session_scope(hass=hass) as session:
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+
+        assert session.query(States).count() == 1
+        attributes = session.query(StateAttributes).all()
+        assert [attr.attributes_id for attr in attributes] == [old_and_new_id]
+        assert list(instance._state_attributes_ids.values()) == [old_and_new_id]
+
+
+async def test_purge_keeps_attributes_of_pending_states(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test pending states are committed before a purge deletes attributes.
+
+    A pending state can reuse the attributes of an old state. When the purge
+    runs on its own connection it only sees committed states, so it would
+    delete those attributes.
+    """
+    instance = await async_setup_recorder_instance(hass)
+
+    eleven_days_ago = dt_util.utcnow() - timedelta(days=11)
+
+    await async_wait_recording_done(hass, instance)
+
+    with recorder.session_scope(hass=hass) as session:
+        old_attributes = StateAttributes(shared_attrs='{"old":true}', hash=1)
+        event = Events(
+            event_type="state_changed",
+            event_data="{}",
+            origin="LOCAL",
+            created=eleven_days_ago,
+            time_fired=eleven_days_ago,
+        )
+        session.add(event)
+        session.flush()
+        session.add(
+            States(
+                entity_id="test.old",
+                domain="test",
+                state="on",
+                state_attributes=old_attributes,
+                last_changed=eleven_days_ago,
+                last_updated=eleven_days_ago,
+                created=eleven_days_ago,
+                event_id=event.event_id,
+            )
+        )
+        session.flush()
+        old_attributes_id = old_attributes.attributes_id
+    instance._state_attributes_ids['{"old":true}'] = old_attributes_id
+
+    pending_at_purge = []
+
+    def _purge_old_data(instance, *args):
+        pending_at_purge.append(bool(instance.event_session.new))
+        return purge_old_data(instance, *args)
+
+    with patch(
+        "homeassistant.components.recorder.purge.purge_old_data",
+        side_effect=_purge_old_data,
+    ):
+        # The state is added to the event session, but not committed
+        hass.states.async_set("test.pending", "on", {"old": True})
+        await hass.async_block_till_done()
+        instance.queue.put(
+            PurgeTask(dt_util.utcnow() - timedelta(days=4), False, False)
+        )
+        await async_wait_purge_done(hass, instance)
+        await async_wait_recording_done(hass, instance)
+
+    assert pending_at_purge and not any(pending_at_purge)
+
+    with session_scope(hass=hass) as session:
+        pending = session.query(States).one()
+        assert pending.entity_id == "test.pending"
+        assert pending.attributes_id == old_attributes_id
+        assert (
+            session.query(StateAttributes)
+            .filter(StateAttributes.attributes_id == old_attributes_id)
+            .one()
+            .shared_attrs
+            == '{"old":true}'
+        )
+
+
 async def test_purge_old_states_encouters_database_corruption(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -203,6 +378,36 @@ async def test_purge_old_recorder_runs(
         assert recorder_runs.count() == 1
 
 
+async def test_purge_old_short_term_statistics(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test deleting old short term statistics keeps recent ones."""
+    instance = await async_setup_recorder_instance(hass)
+
+    now = dt_util.utcnow()
+    with session_scope(hass=hass) as session:
+        for days in range(6):
+            session.add(
+                StatisticsShortTerm(
+                    start=now - timedelta(days=days, minutes=5), mean=days
+                )
+            )
+
+    with session_scope(hass=hass) as session:
+        statistics = session.query(StatisticsShortTerm)
+        assert statistics.count() == 6
+
+        purge_before = now - timedelta(days=3)
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        assert statistics.count() == 3
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert finished
+        assert statistics.count() == 3
+
+
 async def test_purge_method(
     hass: HomeAssistant,
     async_setup_recorder_instance: SetupRecorderInstanceT,
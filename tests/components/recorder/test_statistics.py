@@ -7,11 +7,17 @@ from pytest import approx
 
 from homeassistant.components.recorder import history
 from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import process_timestamp_to_utc_isoformat
+from homeassistant.components.recorder.models import (
+    Statistics,
+    StatisticsMeta,
+    StatisticsShortTerm,
+    process_timestamp_to_utc_isoformat,
+)
 from homeassistant.components.recorder.statistics import (
-    get_last_statistics,
+    get_last_short_term_statistics,
     statistics_during_period,
 )
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import TEMP_CELSIUS
 from homeassistant.setup import setup_component
 import homeassistant.util.dt as dt_util
@@ -30,13 +36,13 @@ def test_compile_hourly_statistics(hass_recorder):
     assert dict(states) == dict(hist)
 
     for kwargs in ({}, {"statistic_ids": ["sensor.test1"]}):
-        stats = statistics_during_period(hass, zero, **kwargs)
+        stats = statistics_during_period(hass, zero, period="5minute", **kwargs)
         assert stats == {}
-    stats = get_last_statistics(hass, 0, "sensor.test1")
+    stats = get_last_short_term_statistics(hass, 0, "sensor.test1")
     assert stats == {}
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
-    recorder.do_adhoc_statistics(period="hourly", start=four)
+    recorder.do_adhoc_statistics(start=zero)
+    recorder.do_adhoc_statistics(start=four)
     wait_recording_done(hass)
     expected_1 = {
         "statistic_id": "sensor.test1",
@@ -68,32 +74,106 @@ def test_compile_hourly_statistics(hass_recorder):
     ]
 
     # Test statistics_during_period
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {"sensor.test1": expected_stats1, "sensor.test2": expected_stats2}
 
-    stats = statistics_during_period(hass, zero, statistic_ids=["sensor.test2"])
+    stats = statistics_during_period(
+        hass, zero, statistic_ids=["sensor.test2"], period="5minute"
+    )
     assert stats == {"sensor.test2": expected_stats2}
 
-    stats = statistics_during_period(hass, zero, statistic_ids=["sensor.test3"])
+    stats = statistics_during_period(
+        hass, zero, statistic_ids=["sensor.test3"], period="5minute"
+    )
     assert stats == {}
 
-    # Test get_last_statistics
-    stats = get_last_statistics(hass, 0, "sensor.test1")
+    # Test get_last_short_term_statistics
+    stats = get_last_short_term_statistics(hass, 0, "sensor.test1")
     assert stats == {}
 
-    stats = get_last_statistics(hass, 1, "sensor.test1")
+    stats = get_last_short_term_statistics(hass, 1, "sensor.test1")
     assert stats == {"sensor.test1": [{**expected_2, "statistic_id": "sensor.test1"}]}
 
-    stats = get_last_statistics(hass, 2, "sensor.test1")
+    stats = get_last_short_term_statistics(hass, 2, "sensor.test1")
     assert stats == {"sensor.test1": expected_stats1[::-1]}
 
-    stats = get_last_statistics(hass, 3, "sensor.test1")
+    stats = get_last_short_term_statistics(hass, 3, "sensor.test1")
     assert stats == {"sensor.test1": expected_stats1[::-1]}
 
-    stats = get_last_statistics(hass, 1, "sensor.test3")
+    stats = get_last_short_term_statistics(hass, 1, "sensor.test3")
     assert stats == {}
 
 
+def test_compile_hourly_statistics_from_short_term(hass_recorder):
+    """Test hourly statistics are rolled up from the 5-minute statistics."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    # Before the last 5-minute period, which a new database marks as compiled
+    zero = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=2
+    )
+    last_reset = zero - timedelta(days=1)
+
+    with session_scope(hass=hass) as session:
+        mean_meta = StatisticsMeta.from_meta(
+            "recorder", "sensor.test1", TEMP_CELSIUS, True, False
+        )
+        sum_meta = StatisticsMeta.from_meta(
+            "recorder", "sensor.test2", "kWh", False, True
+        )
+        session.add_all([mean_meta, sum_meta])
+        session.flush()
+        for i in range(12):
+            start = zero + timedelta(minutes=5 * i)
+            session.add(
+                StatisticsShortTerm.from_stats(
+                    mean_meta.id, start, {"mean": i, "min": i - 1, "max": i + 1}
+                )
+            )
+            session.add(
+                StatisticsShortTerm.from_stats(
+                    sum_meta.id,
+                    start,
+                    {"last_reset": last_reset, "state": 10 + i, "sum": 2 * i},
+                )
+            )
+
+    # Compiling the last 5-minute period of the hour rolls up the hour
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=50))
+    wait_recording_done(hass)
+    assert statistics_during_period(hass, zero, period="hour") == {}
+
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=55))
+    wait_recording_done(hass)
+    stats = statistics_during_period(hass, zero, period="hour")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "statistic_id": "sensor.test1",
+                "start": process_timestamp_to_utc_isoformat(zero),
+                "mean": approx(5.5),
+                "min": approx(-1.0),
+                "max": approx(12.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ],
+        "sensor.test2": [
+            {
+                "statistic_id": "sensor.test2",
+                "start": process_timestamp_to_utc_isoformat(zero),
+                "mean": None,
+                "min": None,
+                "max": None,
+                "last_reset": process_timestamp_to_utc_isoformat(last_reset),
+                "state": approx(21.0),
+                "sum": approx(22.0),
+            }
+        ],
+    }
+
+
 def test_rename_entity(hass_recorder):
     """Test statistics is migrated when entity_id is changed."""
     hass = hass_recorder()
@@ -114,12 +194,12 @@ def test_rename_entity(hass_recorder):
     assert dict(states) == dict(hist)
 
     for kwargs in ({}, {"statistic_ids": ["sensor.test1"]}):
-        stats = statistics_during_period(hass, zero, **kwargs)
+        stats = statistics_during_period(hass, zero, period="5minute", **kwargs)
         assert stats == {}
-    stats = get_last_statistics(hass, 0, "sensor.test1")
+    stats = get_last_short_term_statistics(hass, 0, "sensor.test1")
     assert stats == {}
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(start=zero)
     wait_recording_done(hass)
     expected_1 = {
         "statistic_id": "sensor.test1",
@@ -141,16 +221,54 @@ def test_rename_entity(hass_recorder):
         {**expected_1, "statistic_id": "sensor.test99"},
     ]
 
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {"sensor.test1": expected_stats1, "sensor.test2": expected_stats2}
 
     entity_reg.async_update_entity(reg_entry.entity_id, new_entity_id="sensor.test99")
     hass.block_till_done()
 
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {"sensor.test99": expected_stats99, "sensor.test2": expected_stats2}
 
 
+def test_statistics_during_period_table(hass_recorder):
+    """Test short term statistics are only used for fine recent periods."""
+    hass = hass_recorder()
+    keep_days = hass.data[DATA_INSTANCE].keep_days
+    recent = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=1
+    )
+    purged = recent - timedelta(days=keep_days + 1)
+
+    with session_scope(hass=hass) as session:
+        meta = StatisticsMeta.from_meta(
+            "recorder", "sensor.test1", TEMP_CELSIUS, True, False
+        )
+        session.add(meta)
+        session.flush()
+        for start in (recent, purged):
+            session.add(
+                Statistics.from_stats(meta.id, start, {"mean": 1, "min": 1, "max": 1})
+            )
+        session.add(
+            StatisticsShortTerm.from_stats(
+                meta.id, recent, {"mean": 2, "min": 2, "max": 2}
+            )
+        )
+
+    def means(start_time, period):
+        stats = statistics_during_period(hass, start_time, period=period)
+        return [stat["mean"] for stat in stats["sensor.test1"]]
+
+    assert means(recent, "5minute") == [approx(2.0)]
+    assert means(recent, timedelta(minutes=5)) == [approx(2.0)]
+    assert means(recent, "hour") == [approx(1.0)]
+    assert means(recent, timedelta(days=1)) == [approx(1.0)]
+    # Short term statistics are purged before the range starts
+    assert means(purged, "5minute") == [approx(1.0), approx(1.0)]
+    assert means(purged, timedelta(minutes=5)) == [approx(1.0), approx(1.0)]
+
+
 def test_statistics_duplicated(hass_recorder, caplog):
     """Test statistics with same start time is not compiled."""
     hass = hass_recorder()
@@ -167,7 +285,7 @@ def test_statistics_duplicated(hass_recorder, caplog):
     with patch(
         "homeassistant.components.sensor.recorder.compile_statistics"
     ) as compile_statistics:
-        recorder.do_adhoc_statistics(period="hourly", start=zero)
+        recorder.do_adhoc_statistics(start=zero)
         wait_recording_done(hass)
         assert compile_statistics.called
         compile_statistics.reset_mock()
@@ -175,7 +293,7 @@ def test_statistics_duplicated(hass_recorder, caplog):
         assert "Statistics already compiled" not in caplog.text
         caplog.clear()
 
-        recorder.do_adhoc_statistics(period="hourly", start=zero)
+        recorder.do_adhoc_statistics(start=zero)
         wait_recording_done(hass)
         assert not compile_statistics.called
         compile_statistics.reset_mock()
@@ -214,10 +332,10 @@ def record_states(hass):
         return hass.states.get(entity_id)
 
     zero = dt_util.utcnow()
-    one = zero + timedelta(minutes=1)
-    two = one + timedelta(minutes=15)
-    three = two + timedelta(minutes=30)
-    four = three + timedelta(minutes=15)
+    one = zero + timedelta(seconds=1 * 5)
+    two = one + timedelta(seconds=15 * 5)
+    three = two + timedelta(seconds=30 * 5)
+    four = three + timedelta(seconds=15 * 5)
 
     states = {mp: [], sns1: [], sns2: [], sns3: [], sns4: []}
     with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=one):
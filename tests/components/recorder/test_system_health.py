@@ -0,0 +1,57 @@
+"""Test recorder system health."""
+from unittest.mock import Mock, patch
+
+from homeassistant.components.recorder.const import DATA_INSTANCE
+from homeassistant.components.recorder.pool import ReadPoolStats
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+from tests.components.recorder.common import async_wait_recording_done
+
+
+async def test_recorder_system_health(hass, async_setup_recorder_instance):
+    """Test recorder system health with the history cache enabled."""
+    instance = await async_setup_recorder_instance(hass, {"history_cache_size": 10})
+    assert await async_setup_component(hass, "system_health", {})
+
+    hass.states.async_set("sensor.test", "1")
+    hass.states.async_set("sensor.test", "2")
+    await async_wait_recording_done(hass, instance)
+
+    info = await get_system_health_info(hass, "recorder")
+    assert info["history_cache_entities"] == 1
+    assert info["history_cache_states"] == 2
+    assert info["history_cache_hit_rate"] == "-"
+    assert info["history_cache_memory"].endswith(" MiB")
+
+    instance.history_cache.hits = 3
+    instance.history_cache.misses = 1
+    info = await get_system_health_info(hass, "recorder")
+    assert info["history_cache_hit_rate"] == "75.0%"
+
+
+async def test_recorder_system_health_read_pool(hass, async_setup_recorder_instance):
+    """Test recorder system health with the read only pool enabled."""
+    instance = await async_setup_recorder_instance(hass)
+    read_engine = Mock(pool=Mock(stats=Mock(return_value=ReadPoolStats(2, 1, 2, 8, 2))))
+    with patch.object(instance, "read_engine", read_engine):
+        assert await async_setup_component(hass, "system_health", {})
+        info = await get_system_health_info(hass, "recorder")
+
+    assert info == {
+        "read_pool_in_use": "1/2",
+        "read_pool_max_in_use": 2,
+        "read_pool_wait_rate": "25.0%",
+    }
+
+
+async def test_recorder_system_health_cache_disabled(
+    hass, async_setup_recorder_instance
+):
+    """Test recorder system health without the history cache."""
+    await async_setup_recorder_instance(hass)
+    assert hass.data[DATA_INSTANCE].history_cache is None
+    assert await async_setup_component(hass, "system_health", {})
+    await hass.async_block_till_done()
+
+    assert "recorder" not in hass.data["system_health"]
@@ -11,10 +11,17 @@ from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import process_timestamp_to_utc_isoformat
 from homeassistant.components.recorder.statistics import (
     get_metadata,
+    get_metadata_for_statistic_ids,
     list_statistic_ids,
     statistics_during_period,
 )
-from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.components.sensor.recorder import (
+    DATA_ACCUMULATOR,
+    async_record_state_changed,
+    compile_statistics,
+)
+from homeassistant.const import EVENT_STATE_CHANGED, STATE_UNAVAILABLE
+from homeassistant.core import Event
 from homeassistant.setup import setup_component
 import homeassistant.util.dt as dt_util
 
@@ -81,13 +88,13 @@ def test_compile_hourly_statistics(
     hist = history.get_significant_states(hass, zero, four)
     assert dict(states) == dict(hist)
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(start=zero)
     wait_recording_done(hass)
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
         {"statistic_id": "sensor.test1", "unit_of_measurement": native_unit}
     ]
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -141,7 +148,7 @@ def test_compile_hourly_statistics_unsupported(hass_recorder, caplog, attributes
     hist = history.get_significant_states(hass, zero, four)
     assert dict(states) == dict(hist)
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(start=zero)
     wait_recording_done(hass)
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
@@ -149,7 +156,7 @@ def test_compile_hourly_statistics_unsupported(hass_recorder, caplog, attributes
         {"statistic_id": "sensor.test6", "unit_of_measurement": "°C"},
         {"statistic_id": "sensor.test7", "unit_of_measurement": "°C"},
     ]
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -227,17 +234,17 @@ def test_compile_hourly_sum_statistics_amount(
     )
     assert dict(states)["sensor.test1"] == dict(hist)["sensor.test1"]
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(start=zero)
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=1))
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=5))
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=2))
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=10))
     wait_recording_done(hass)
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
         {"statistic_id": "sensor.test1", "unit_of_measurement": native_unit}
     ]
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -252,7 +259,9 @@ def test_compile_hourly_sum_statistics_amount(
             },
             {
                 "statistic_id": "sensor.test1",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=1)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=5)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -262,7 +271,9 @@ def test_compile_hourly_sum_statistics_amount(
             },
             {
                 "statistic_id": "sensor.test1",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=2)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=10)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -311,7 +322,7 @@ def test_compile_hourly_sum_statistics_amount_reset_every_state_change(
     states = {"sensor.test1": []}
     one = zero
     for i in range(len(seq)):
-        one = one + timedelta(minutes=1)
+        one = one + timedelta(seconds=1 * 5)
         _states = record_meter_state(
             hass, one, "sensor.test1", attributes, seq[i : i + 1]
         )
@@ -325,13 +336,13 @@ def test_compile_hourly_sum_statistics_amount_reset_every_state_change(
     )
     assert dict(states)["sensor.test1"] == dict(hist)["sensor.test1"]
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(start=zero)
     wait_recording_done(hass)
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
         {"statistic_id": "sensor.test1", "unit_of_measurement": native_unit}
     ]
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -381,17 +392,17 @@ def test_compile_hourly_sum_statistics_total_increasing(
     )
     assert dict(states)["sensor.test1"] == dict(hist)["sensor.test1"]
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(start=zero)
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=1))
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=5))
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=2))
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=10))
     wait_recording_done(hass)
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
         {"statistic_id": "sensor.test1", "unit_of_measurement": native_unit}
     ]
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -406,7 +417,9 @@ def test_compile_hourly_sum_statistics_total_increasing(
             },
             {
                 "statistic_id": "sensor.test1",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=1)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=5)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -416,7 +429,9 @@ def test_compile_hourly_sum_statistics_total_increasing(
             },
             {
                 "statistic_id": "sensor.test1",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=2)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=10)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -459,9 +474,9 @@ def test_compile_hourly_sum_statistics_total_increasing_small_dip(
     )
     assert dict(states)["sensor.test1"] == dict(hist)["sensor.test1"]
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(start=zero)
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=1))
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=5))
     wait_recording_done(hass)
     assert (
         "Entity sensor.test1 has state class total_increasing, but its state is not "
@@ -469,7 +484,7 @@ def test_compile_hourly_sum_statistics_total_increasing_small_dip(
         "home-assistant/core/issues?q=is%3Aopen+is%3Aissue+label%3A%22integration%3A"
         "+recorder%22"
     ) not in caplog.text
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=2))
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=10))
     wait_recording_done(hass)
     assert (
         "Entity sensor.test1 has state class total_increasing, but its state is not "
@@ -481,7 +496,7 @@ def test_compile_hourly_sum_statistics_total_increasing_small_dip(
     assert statistic_ids == [
         {"statistic_id": "sensor.test1", "unit_of_measurement": native_unit}
     ]
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -497,7 +512,9 @@ def test_compile_hourly_sum_statistics_total_increasing_small_dip(
             {
                 "last_reset": None,
                 "statistic_id": "sensor.test1",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=1)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=5)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -507,7 +524,9 @@ def test_compile_hourly_sum_statistics_total_increasing_small_dip(
             {
                 "last_reset": None,
                 "statistic_id": "sensor.test1",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=2)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=10)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -558,17 +577,17 @@ def test_compile_hourly_energy_statistics_unsupported(hass_recorder, caplog):
     )
     assert dict(states)["sensor.test1"] == dict(hist)["sensor.test1"]
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(start=zero)
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=1))
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=5))
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=2))
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=10))
     wait_recording_done(hass)
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
         {"statistic_id": "sensor.test1", "unit_of_measurement": "kWh"}
     ]
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -583,7 +602,9 @@ def test_compile_hourly_energy_statistics_unsupported(hass_recorder, caplog):
             },
             {
                 "statistic_id": "sensor.test1",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=1)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=5)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -593,7 +614,9 @@ def test_compile_hourly_energy_statistics_unsupported(hass_recorder, caplog):
             },
             {
                 "statistic_id": "sensor.test1",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=2)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=10)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -639,11 +662,11 @@ def test_compile_hourly_energy_statistics_multiple(hass_recorder, caplog):
     )
     assert dict(states)["sensor.test1"] == dict(hist)["sensor.test1"]
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(start=zero)
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=1))
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=5))
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=2))
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=10))
     wait_recording_done(hass)
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
@@ -651,7 +674,7 @@ def test_compile_hourly_energy_statistics_multiple(hass_recorder, caplog):
         {"statistic_id": "sensor.test2", "unit_of_measurement": "kWh"},
         {"statistic_id": "sensor.test3", "unit_of_measurement": "kWh"},
     ]
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -666,7 +689,9 @@ def test_compile_hourly_energy_statistics_multiple(hass_recorder, caplog):
             },
             {
                 "statistic_id": "sensor.test1",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=1)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=5)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -676,7 +701,9 @@ def test_compile_hourly_energy_statistics_multiple(hass_recorder, caplog):
             },
             {
                 "statistic_id": "sensor.test1",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=2)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=10)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -698,7 +725,9 @@ def test_compile_hourly_energy_statistics_multiple(hass_recorder, caplog):
             },
             {
                 "statistic_id": "sensor.test2",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=1)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=5)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -708,7 +737,9 @@ def test_compile_hourly_energy_statistics_multiple(hass_recorder, caplog):
             },
             {
                 "statistic_id": "sensor.test2",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=2)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=10)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -730,7 +761,9 @@ def test_compile_hourly_energy_statistics_multiple(hass_recorder, caplog):
             },
             {
                 "statistic_id": "sensor.test3",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=1)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=5)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -740,7 +773,9 @@ def test_compile_hourly_energy_statistics_multiple(hass_recorder, caplog):
             },
             {
                 "statistic_id": "sensor.test3",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=2)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=10)
+                ),
                 "max": None,
                 "mean": None,
                 "min": None,
@@ -786,9 +821,9 @@ def test_compile_hourly_statistics_unchanged(
     hist = history.get_significant_states(hass, zero, four)
     assert dict(states) == dict(hist)
 
-    recorder.do_adhoc_statistics(period="hourly", start=four)
+    recorder.do_adhoc_statistics(start=four)
     wait_recording_done(hass)
-    stats = statistics_during_period(hass, four)
+    stats = statistics_during_period(hass, four, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -818,9 +853,9 @@ def test_compile_hourly_statistics_partially_unavailable(hass_recorder, caplog):
     hist = history.get_significant_states(hass, zero, four)
     assert dict(states) == dict(hist)
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(start=zero)
     wait_recording_done(hass)
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -875,9 +910,9 @@ def test_compile_hourly_statistics_unavailable(
     hist = history.get_significant_states(hass, zero, four)
     assert dict(states) == dict(hist)
 
-    recorder.do_adhoc_statistics(period="hourly", start=four)
+    recorder.do_adhoc_statistics(start=four)
     wait_recording_done(hass)
-    stats = statistics_during_period(hass, four)
+    stats = statistics_during_period(hass, four, period="5minute")
     assert stats == {
         "sensor.test2": [
             {
@@ -905,7 +940,7 @@ def test_compile_hourly_statistics_fails(hass_recorder, caplog):
         "homeassistant.components.sensor.recorder.compile_statistics",
         side_effect=Exception,
     ):
-        recorder.do_adhoc_statistics(period="hourly", start=zero)
+        recorder.do_adhoc_statistics(start=zero)
         wait_recording_done(hass)
     assert "Error while processing event StatisticsTask" in caplog.text
 
@@ -1010,24 +1045,24 @@ def test_compile_hourly_statistics_changing_units_1(
     four, states = record_states(hass, zero, "sensor.test1", attributes)
     attributes["unit_of_measurement"] = "cats"
     four, _states = record_states(
-        hass, zero + timedelta(hours=1), "sensor.test1", attributes
+        hass, zero + timedelta(minutes=5), "sensor.test1", attributes
     )
     states["sensor.test1"] += _states["sensor.test1"]
     four, _states = record_states(
-        hass, zero + timedelta(hours=2), "sensor.test1", attributes
+        hass, zero + timedelta(minutes=10), "sensor.test1", attributes
     )
     states["sensor.test1"] += _states["sensor.test1"]
     hist = history.get_significant_states(hass, zero, four)
     assert dict(states) == dict(hist)
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(start=zero)
     wait_recording_done(hass)
     assert "does not match the unit of already compiled" not in caplog.text
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
         {"statistic_id": "sensor.test1", "unit_of_measurement": native_unit}
     ]
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -1043,7 +1078,7 @@ def test_compile_hourly_statistics_changing_units_1(
         ]
     }
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=2))
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=10))
     wait_recording_done(hass)
     assert (
         "The unit of sensor.test1 (cats) does not match the unit of already compiled "
@@ -1053,7 +1088,7 @@ def test_compile_hourly_statistics_changing_units_1(
     assert statistic_ids == [
         {"statistic_id": "sensor.test1", "unit_of_measurement": native_unit}
     ]
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -1096,13 +1131,13 @@ def test_compile_hourly_statistics_changing_units_2(
     four, states = record_states(hass, zero, "sensor.test1", attributes)
     attributes["unit_of_measurement"] = "cats"
     four, _states = record_states(
-        hass, zero + timedelta(hours=1), "sensor.test1", attributes
+        hass, zero + timedelta(minutes=5), "sensor.test1", attributes
     )
     states["sensor.test1"] += _states["sensor.test1"]
     hist = history.get_significant_states(hass, zero, four)
     assert dict(states) == dict(hist)
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(minutes=30))
+    recorder.do_adhoc_statistics(start=zero + timedelta(seconds=30 * 5))
     wait_recording_done(hass)
     assert "The unit of sensor.test1 is changing" in caplog.text
     assert "and matches the unit of already compiled statistics" not in caplog.text
@@ -1110,7 +1145,7 @@ def test_compile_hourly_statistics_changing_units_2(
     assert statistic_ids == [
         {"statistic_id": "sensor.test1", "unit_of_measurement": "cats"}
     ]
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {}
 
     assert "Error while processing event StatisticsTask" not in caplog.text
@@ -1140,25 +1175,25 @@ def test_compile_hourly_statistics_changing_units_3(
     }
     four, states = record_states(hass, zero, "sensor.test1", attributes)
     four, _states = record_states(
-        hass, zero + timedelta(hours=1), "sensor.test1", attributes
+        hass, zero + timedelta(minutes=5), "sensor.test1", attributes
     )
     states["sensor.test1"] += _states["sensor.test1"]
     attributes["unit_of_measurement"] = "cats"
     four, _states = record_states(
-        hass, zero + timedelta(hours=2), "sensor.test1", attributes
+        hass, zero + timedelta(minutes=10), "sensor.test1", attributes
     )
     states["sensor.test1"] += _states["sensor.test1"]
     hist = history.get_significant_states(hass, zero, four)
     assert dict(states) == dict(hist)
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(start=zero)
     wait_recording_done(hass)
     assert "does not match the unit of already compiled" not in caplog.text
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
         {"statistic_id": "sensor.test1", "unit_of_measurement": native_unit}
     ]
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -1174,7 +1209,7 @@ def test_compile_hourly_statistics_changing_units_3(
         ]
     }
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=2))
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=10))
     wait_recording_done(hass)
     assert "The unit of sensor.test1 is changing" in caplog.text
     assert f"matches the unit of already compiled statistics ({unit})" in caplog.text
@@ -1182,7 +1217,7 @@ def test_compile_hourly_statistics_changing_units_3(
     assert statistic_ids == [
         {"statistic_id": "sensor.test1", "unit_of_measurement": native_unit}
     ]
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -1225,7 +1260,7 @@ def test_compile_hourly_statistics_changing_statistics(
         "unit_of_measurement": unit,
     }
     four, states = record_states(hass, zero, "sensor.test1", attributes_1)
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(start=zero)
     wait_recording_done(hass)
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
@@ -1241,13 +1276,13 @@ def test_compile_hourly_statistics_changing_statistics(
 
     # Add more states, with changed state class
     four, _states = record_states(
-        hass, zero + timedelta(hours=1), "sensor.test1", attributes_2
+        hass, zero + timedelta(minutes=5), "sensor.test1", attributes_2
     )
     states["sensor.test1"] += _states["sensor.test1"]
     hist = history.get_significant_states(hass, zero, four)
     assert dict(states) == dict(hist)
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=1))
+    recorder.do_adhoc_statistics(start=zero + timedelta(minutes=5))
     wait_recording_done(hass)
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
@@ -1260,7 +1295,7 @@ def test_compile_hourly_statistics_changing_statistics(
         "statistic_id": "sensor.test1",
         "unit_of_measurement": None,
     }
-    stats = statistics_during_period(hass, zero)
+    stats = statistics_during_period(hass, zero, period="5minute")
     assert stats == {
         "sensor.test1": [
             {
@@ -1275,7 +1310,9 @@ def test_compile_hourly_statistics_changing_statistics(
             },
             {
                 "statistic_id": "sensor.test1",
-                "start": process_timestamp_to_utc_isoformat(zero + timedelta(hours=1)),
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=5)
+                ),
                 "mean": None,
                 "min": None,
                 "max": None,
@@ -1289,6 +1326,161 @@ def test_compile_hourly_statistics_changing_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+@pytest.mark.parametrize(
+    "attributes,seq",
+    [
+        (
+            TEMPERATURE_SENSOR_ATTRIBUTES,
+            ["10", "20", STATE_UNAVAILABLE, "5", "7"],
+        ),
+        (
+            {**TEMPERATURE_SENSOR_ATTRIBUTES, "unit_of_measurement": "°F"},
+            ["10", "20", STATE_UNAVAILABLE, "5", "7"],
+        ),
+        (
+            {**POWER_SENSOR_ATTRIBUTES, "unit_of_measurement": "W"},
+            [STATE_UNAVAILABLE, "20", "30", "5", "7"],
+        ),
+        (
+            {
+                "device_class": "energy",
+                "state_class": "total_increasing",
+                "unit_of_measurement": "kWh",
+            },
+            ["10", "20", "30", "5", "7"],
+        ),
+    ],
+)
+def test_compile_hourly_statistics_accumulated(hass_recorder, attributes, seq):
+    """Test accumulated statistics match the statistics compiled from history."""
+    period = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=3
+    )
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    offsets = [-30, 10, 40, 50, 70]
+    for offset, state in zip(offsets, seq):
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow",
+            return_value=period + timedelta(seconds=offset * 5),
+        ):
+            hass.states.set("sensor.test1", state, attributes=attributes)
+            wait_recording_done(hass)
+
+    end = period + timedelta(minutes=5)
+    accumulator = hass.data.pop(DATA_ACCUMULATOR)
+    from_history = compile_statistics(hass, period, end)
+    hass.data[DATA_ACCUMULATOR] = accumulator
+
+    with patch.object(history, "get_significant_states") as get_significant_states:
+        accumulated = compile_statistics(hass, period, end)
+    get_significant_states.assert_not_called()
+
+    assert from_history["sensor.test1"]
+    assert accumulated == from_history
+
+
+def test_compile_hourly_statistics_accumulated_incomplete(hass_recorder):
+    """Test periods which started before the accumulator are compiled from history."""
+    period = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=3
+    )
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    for offset, state in ((10, "10"), (40, "20")):
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow",
+            return_value=period + timedelta(seconds=offset * 5),
+        ):
+            hass.states.set(
+                "sensor.test1", state, attributes=TEMPERATURE_SENSOR_ATTRIBUTES
+            )
+            wait_recording_done(hass)
+
+    end = period + timedelta(minutes=5)
+    accumulator = hass.data[DATA_ACCUMULATOR]
+    assert accumulator.pop_statistics(
+        [("sensor.test1", "measurement", "temperature")], period, end
+    ) == ({}, {})
+    assert compile_statistics(hass, period, end)["sensor.test1"]["stat"] == {
+        "max": 20.0,
+        "min": 10.0,
+        "mean": 14.0,
+    }
+
+
+def test_compile_hourly_statistics_excluded_entity(hass_recorder):
+    """Test sensors excluded from the recorder are not accumulated or compiled."""
+    period = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=3
+    )
+    hass = hass_recorder({"exclude": {"entities": ["sensor.excluded"]}})
+    setup_component(hass, "sensor", {})
+    for offset, state in ((-30, "5"), (10, "10"), (40, "20")):
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow",
+            return_value=period + timedelta(seconds=offset * 5),
+        ):
+            for entity_id in ("sensor.test1", "sensor.excluded"):
+                hass.states.set(
+                    entity_id, state, attributes=TEMPERATURE_SENSOR_ATTRIBUTES
+                )
+            wait_recording_done(hass)
+
+    end = period + timedelta(minutes=5)
+    accumulated, buffered = hass.data[DATA_ACCUMULATOR].pop_statistics(
+        [
+            ("sensor.test1", "measurement", "temperature"),
+            ("sensor.excluded", "measurement", "temperature"),
+        ],
+        period,
+        end,
+    )
+    assert "sensor.excluded" not in accumulated
+    assert "sensor.excluded" not in buffered
+
+    # Excluded sensors are skipped even if their events reach the accumulator
+    state = hass.states.get("sensor.excluded")
+    hass.add_job(
+        async_record_state_changed,
+        hass,
+        Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": "sensor.excluded", "old_state": None, "new_state": state},
+        ),
+    )
+    hass.block_till_done()
+    accumulated, buffered = hass.data[DATA_ACCUMULATOR].pop_statistics(
+        [("sensor.excluded", "measurement", "temperature")], period, end
+    )
+    assert "sensor.excluded" not in accumulated
+    assert "sensor.excluded" not in buffered
+
+    statistics = compile_statistics(hass, period, end)
+    assert statistics["sensor.test1"]
+    assert "sensor.excluded" not in statistics
+
+
+def test_get_metadata_for_statistic_ids(hass_recorder):
+    """Test fetching metadata of multiple statistics at once."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    zero = dt_util.utcnow()
+    record_states(hass, zero, "sensor.test1", TEMPERATURE_SENSOR_ATTRIBUTES)
+    record_states(hass, zero, "sensor.test2", PRESSURE_SENSOR_ATTRIBUTES)
+    recorder.do_adhoc_statistics(start=zero)
+    wait_recording_done(hass)
+
+    assert get_metadata_for_statistic_ids(hass, []) == {}
+    assert get_metadata_for_statistic_ids(
+        hass, ["sensor.test1", "sensor.test2", "sensor.test3"]
+    ) == {
+        "sensor.test1": get_metadata(hass, "sensor.test1"),
+        "sensor.test2": get_metadata(hass, "sensor.test2"),
+    }
+
+
 def record_states(hass, zero, entity_id, attributes):
     """Record some test states.
 
@@ -1302,10 +1494,10 @@ def record_states(hass, zero, entity_id, attributes):
         wait_recording_done(hass)
         return hass.states.get(entity_id)
 
-    one = zero + timedelta(minutes=1)
-    two = one + timedelta(minutes=10)
-    three = two + timedelta(minutes=40)
-    four = three + timedelta(minutes=10)
+    one = zero + timedelta(seconds=1 * 5)
+    two = one + timedelta(seconds=10 * 5)
+    three = two + timedelta(seconds=40 * 5)
+    four = three + timedelta(seconds=10 * 5)
 
     states = {entity_id: []}
     with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=one):
@@ -1332,14 +1524,14 @@ def record_meter_states(hass, zero, entity_id, _attributes, seq):
         wait_recording_done(hass)
         return hass.states.get(entity_id)
 
-    one = zero + timedelta(minutes=15)
-    two = one + timedelta(minutes=30)
-    three = two + timedelta(minutes=15)
-    four = three + timedelta(minutes=15)
-    five = four + timedelta(minutes=30)
-    six = five + timedelta(minutes=15)
-    seven = six + timedelta(minutes=15)
-    eight = seven + timedelta(minutes=30)
+    one = zero + timedelta(seconds=15 * 5)
+    two = one + timedelta(seconds=30 * 5)
+    three = two + timedelta(seconds=15 * 5)
+    four = three + timedelta(seconds=15 * 5)
+    five = four + timedelta(seconds=30 * 5)
+    six = five + timedelta(seconds=15 * 5)
+    seven = six + timedelta(seconds=15 * 5)
+    eight = seven + timedelta(seconds=30 * 5)
 
     attributes = dict(_attributes)
     if "last_reset" in _attributes:
@@ -1414,10 +1606,10 @@ def record_states_partially_unavailable(hass, zero, entity_id, attributes):
         wait_recording_done(hass)
         return hass.states.get(entity_id)
 
-    one = zero + timedelta(minutes=1)
-    two = one + timedelta(minutes=15)
-    three = two + timedelta(minutes=30)
-    four = three + timedelta(minutes=15)
+    one = zero + timedelta(seconds=1 * 5)
+    two = one + timedelta(seconds=15 * 5)
+    three = two + timedelta(seconds=30 * 5)
+    four = three + timedelta(seconds=15 * 5)
 
     states = {entity_id: []}
     with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=one):
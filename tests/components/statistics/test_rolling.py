@@ -0,0 +1,75 @@
+"""The tests for the rolling aggregates of the statistics sensor."""
+from collections import deque
+import math
+import random
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.rolling import RollingStatistics
+
+
+@pytest.mark.parametrize("method", ["exclusive", "inclusive"])
+def test_rolling_statistics_match_statistics_module(method):
+    """Test the aggregates match a full recomputation over a sliding window."""
+    rng = random.Random(42)
+    window = deque()
+    stats = RollingStatistics()
+
+    for _ in range(500):
+        if len(window) == 25:
+            stats.remove(window.popleft())
+        value = round(rng.uniform(-1000, 1000), 1)
+        window.append(value)
+        stats.add(value)
+
+        assert len(stats) == len(window)
+        assert stats.total == pytest.approx(sum(window))
+        assert stats.mean == pytest.approx(statistics.mean(window))
+        assert stats.median == statistics.median(window)
+        assert stats.min == min(window)
+        assert stats.max == max(window)
+        if len(window) > 1:
+            assert stats.variance == pytest.approx(statistics.variance(window))
+            assert stats.stdev == pytest.approx(statistics.stdev(window))
+            assert stats.quantiles(4, method) == pytest.approx(
+                statistics.quantiles(window, n=4, method=method)
+            )
+
+
+def test_rolling_statistics_remove_all():
+    """Test the window can be emptied and filled again."""
+    stats = RollingStatistics()
+    for value in (1.0, 2.0, 3.0):
+        stats.add(value)
+    for value in (2.0, 1.0, 3.0):
+        stats.remove(value)
+
+    assert len(stats) == 0
+    assert stats.total == 0
+
+    stats.add(5.0)
+    stats.add(7.0)
+    assert stats.mean == 6.0
+    assert stats.median == 6.0
+    assert stats.variance == 2.0
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_rolling_statistics_reject_non_finite(value):
+    """Test non-finite values are rejected and keep the window intact."""
+    stats = RollingStatistics()
+    for finite in (3.0, 1.0, 2.0):
+        stats.add(finite)
+
+    with pytest.raises(ValueError):
+        stats.add(value)
+    with pytest.raises(ValueError):
+        stats.remove(value)
+    with pytest.raises(ValueError):
+        stats.remove(5.0)
+
+    assert len(stats) == 3
+    assert stats.median == 2.0
+    stats.remove(1.0)
+    assert stats.min == 2.0
@@ -153,6 +153,40 @@ class TestStatisticsSensor(unittest.TestCase):
         assert state.attributes.get("min_value") == 3.8
         assert state.attributes.get("max_value") == 14
 
+    def test_sampling_size_non_finite_values(self):
+        """Test non-finite values are ignored while the window rotates."""
+        assert setup_component(
+            self.hass,
+            "sensor",
+            {
+                "sensor": {
+                    "platform": "statistics",
+                    "name": "test",
+                    "entity_id": "sensor.test_monitored",
+                    "sampling_size": 5,
+                }
+            },
+        )
+
+        self.hass.block_till_done()
+        self.hass.start()
+        self.hass.block_till_done()
+
+        for value in self.values:
+            for state in (value, "nan", "inf"):
+                self.hass.states.set(
+                    "sensor.test_monitored",
+                    state,
+                    {ATTR_UNIT_OF_MEASUREMENT: TEMP_CELSIUS},
+                )
+                self.hass.block_till_done()
+
+        state = self.hass.states.get("sensor.test")
+
+        assert state.attributes.get("count") == 5
+        assert state.attributes.get("min_value") == 3.8
+        assert state.attributes.get("max_value") == 14
+
     def test_sampling_size_1(self):
         """Test validity of stats requiring only one sample."""
         assert setup_component(
@@ -18,7 +18,7 @@ from homeassistant.core import Context, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.loader import async_get_integration
+from homeassistant.loader import DATA_IMPORT_TIME, async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
 
 from tests.common import MockEntity, MockEntityPlatform, async_mock_service
@@ -528,15 +528,15 @@ async def test_states_filters_visible(hass, hass_admin_user, websocket_client):
     assert msg["result"][0]["entity_id"] == "test.entity"
 
 
-async def test_get_states_not_allows_nan(hass, websocket_client):
-    """Test get_states command not allows NaN floats."""
+async def test_get_states_dumps_nan_as_null(hass, websocket_client):
+    """Test get_states command dumps NaN floats as null."""
     hass.states.async_set("greeting.hello", "world", {"hello": float("NaN")})
 
     await websocket_client.send_json({"id": 5, "type": "get_states"})
 
     msg = await websocket_client.receive_json()
-    assert not msg["success"]
-    assert msg["error"]["code"] == const.ERR_UNKNOWN_ERROR
+    assert msg["success"]
+    assert msg["result"][0]["attributes"] == {"hello": None}
 
 
 async def test_subscribe_unsubscribe_events_whitelist(
@@ -1181,6 +1181,7 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
         "august": datetime.timedelta(seconds=12.5),
         "isy994": datetime.timedelta(seconds=12.8),
     }
+    hass.data[DATA_IMPORT_TIME] = {"august": datetime.timedelta(seconds=1.5)}
     await websocket_client.send_json({"id": 7, "type": "integration/setup_info"})
 
     msg = await websocket_client.receive_json()
@@ -1188,6 +1189,6 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"] == [
-        {"domain": "august", "seconds": 12.5},
-        {"domain": "isy994", "seconds": 12.8},
+        {"domain": "august", "seconds": 12.5, "import_seconds": 1.5},
+        {"domain": "isy994", "seconds": 12.8, "import_seconds": None},
     ]
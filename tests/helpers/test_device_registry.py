@@ -389,6 +389,46 @@ async def test_removing_area_id(registry):
     assert entry_w_area != entry_wo_area
 
 
+async def test_entries_lookups_follow_updates(registry):
+    """Test the area and config entry lookups follow registry changes."""
+    entry = registry.async_get_or_create(
+        config_entry_id="123",
+        identifiers={("bridgeid", "0123")},
+    )
+    entry = registry.async_update_device(entry.id, area_id="kitchen")
+    other = registry.async_get_or_create(
+        config_entry_id="456",
+        identifiers={("bridgeid", "4567")},
+    )
+    other = registry.async_get_or_create(
+        config_entry_id="123",
+        identifiers={("bridgeid", "4567")},
+    )
+
+    assert device_registry.async_entries_for_area(registry, "kitchen") == [entry]
+    assert device_registry.async_entries_for_config_entry(registry, "123") == [
+        entry,
+        other,
+    ]
+
+    registry.async_clear_area_id("kitchen")
+    assert device_registry.async_entries_for_area(registry, "kitchen") == []
+
+    registry.async_clear_config_entry("123")
+    assert device_registry.async_entries_for_config_entry(registry, "123") == []
+    assert device_registry.async_entries_for_config_entry(registry, "456") == [
+        registry.async_get(other.id)
+    ]
+    assert registry.deleted_devices[entry.id].config_entries == set()
+
+    registry.async_remove_device(other.id)
+    registry.async_clear_config_entry("456")
+    assert registry.deleted_devices[other.id].config_entries == set()
+    assert registry._registered_index.config_entries == {}
+    assert registry._registered_index.areas == {}
+    assert registry._deleted_index.config_entries == {}
+
+
 async def test_deleted_device_removing_area_id(registry):
     """Make sure we can clear area id of deleted device."""
     entry = registry.async_get_or_create(
@@ -352,6 +352,53 @@ async def test_removing_area_id(registry):
     assert entry_w_area != entry_wo_area
 
 
+async def test_entries_lookups_follow_updates(registry):
+    """Test the device, area and config entry lookups follow registry changes."""
+    mock_config = MockConfigEntry(domain="light", entry_id="mock-id-1")
+    entry = registry.async_get_or_create(
+        "light", "hue", "1234", config_entry=mock_config, device_id="device-1"
+    )
+    other = registry.async_get_or_create("light", "hue", "5678", device_id="device-1")
+
+    assert er.async_entries_for_device(registry, "device-1") == [entry, other]
+    assert er.async_entries_for_config_entry(registry, "mock-id-1") == [entry]
+
+    entry = registry.async_update_entity(
+        entry.entity_id, area_id="kitchen", new_entity_id="light.renamed"
+    )
+    assert er.async_entries_for_area(registry, "kitchen") == [entry]
+    assert er.async_entries_for_config_entry(registry, "mock-id-1") == [entry]
+    assert entry in er.async_entries_for_device(registry, "device-1")
+
+    registry.async_update_entity(other.entity_id, disabled_by="user")
+    assert er.async_entries_for_device(registry, "device-1") == [entry]
+    assert (
+        len(
+            er.async_entries_for_device(
+                registry, "device-1", include_disabled_entities=True
+            )
+        )
+        == 2
+    )
+
+    registry.async_clear_area_id("kitchen")
+    assert er.async_entries_for_area(registry, "kitchen") == []
+
+    registry.async_clear_config_entry("mock-id-1")
+    assert er.async_entries_for_config_entry(registry, "mock-id-1") == []
+    assert [
+        entry.entity_id
+        for entry in er.async_entries_for_device(
+            registry, "device-1", include_disabled_entities=True
+        )
+    ] == [other.entity_id]
+
+    registry.async_remove(other.entity_id)
+    assert registry._device_index == {}
+    assert registry._area_index == {}
+    assert registry._config_entry_index == {}
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_migration(hass):
     """Test migration from old data to new."""
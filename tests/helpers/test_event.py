@@ -10,7 +10,7 @@ import jinja2
 import pytest
 
 from homeassistant.components import sun
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
@@ -519,6 +519,33 @@ async def test_async_track_state_change_event(hass):
     unsub_throws()
 
 
+async def test_async_track_state_change_event_listens_by_entity_id(hass):
+    """Test the state change event tracker listens per entity_id on the bus."""
+    runs = []
+    listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    unsub_one = async_track_state_change_event(
+        hass,
+        ["light.bowl", "switch.kitchen"],
+        callback(lambda event: runs.append(event)),
+    )
+    unsub_two = async_track_state_change_event(
+        hass, ["light.bowl"], callback(lambda event: runs.append(event))
+    )
+    # One keyed bus listener per tracked entity_id
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners + 2
+
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.other", "on")
+    await hass.async_block_till_done()
+    assert [event.data["entity_id"] for event in runs] == ["light.bowl"] * 2
+
+    unsub_one()
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners + 1
+    unsub_two()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners
+
+
 async def test_async_track_state_change_event_with_empty_list(hass):
     """Test async_track_state_change_event passing an empty list of entities."""
     unsub_single = async_track_state_change_event(
@@ -1022,6 +1049,85 @@ async def test_track_template_result(hass):
     assert len(wildercard_runs) == 4
 
 
+async def test_track_template_result_attribute_changes(hass):
+    """Test tracking template only re-renders when a read attribute changes."""
+    hass.states.async_set(
+        "climate.test", "heat", {"temperature": 20, "hvac_action": "idle"}
+    )
+    renders = []
+    template_attribute = Template(
+        "{{ state_attr('climate.test', 'temperature') }}", hass
+    )
+
+    async_render_to_info = Template.async_render_to_info
+
+    def render_counting(self, *args, **kwargs):
+        renders.append(self)
+        return async_render_to_info(self, *args, **kwargs)
+
+    runs = []
+
+    @ha.callback
+    def run_callback(event, updates):
+        runs.append(updates.pop().result)
+
+    with patch.object(Template, "async_render_to_info", render_counting):
+        async_track_template_result(
+            hass, [TrackTemplate(template_attribute, None)], run_callback
+        )
+        await hass.async_block_till_done()
+        assert len(renders) == 1
+
+        hass.states.async_set(
+            "climate.test", "heat", {"temperature": 20, "hvac_action": "heating"}
+        )
+        await hass.async_block_till_done()
+        assert len(renders) == 1
+        assert runs == []
+
+        hass.states.async_set(
+            "climate.test", "cool", {"temperature": 20, "hvac_action": "heating"}
+        )
+        await hass.async_block_till_done()
+        assert len(renders) == 1
+
+        hass.states.async_set(
+            "climate.test", "cool", {"temperature": 22, "hvac_action": "heating"}
+        )
+        await hass.async_block_till_done()
+        assert len(renders) == 2
+        assert runs == [22]
+
+        hass.states.async_remove("climate.test")
+        await hass.async_block_till_done()
+        assert len(renders) == 3
+        assert runs == [22, None]
+
+
+async def test_track_template_result_state_changes(hass):
+    """Test tracking template reading the state ignores attribute changes."""
+    hass.states.async_set("sensor.test", "1", {"battery": 80})
+    runs = []
+
+    @ha.callback
+    def run_callback(event, updates):
+        runs.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(Template("{{ states('sensor.test') }}", hass), None)],
+        run_callback,
+    )
+    await hass.async_block_till_done()
+    assert info.listeners["entities"] == {"sensor.test"}
+
+    hass.states.async_set("sensor.test", "1", {"battery": 79})
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.test", "2", {"battery": 79})
+    await hass.async_block_till_done()
+    assert runs == [2]
+
+
 async def test_track_template_result_complex(hass):
     """Test tracking template."""
     specific_runs = []
@@ -2673,6 +2779,41 @@ async def test_async_track_time_change(hass):
     assert len(wildcard_runs) == 3
 
 
+async def test_async_track_time_change_without_pattern_shares_tick(hass):
+    """Test trackers without a pattern share one callback every second."""
+    utc_runs = []
+    local_runs = []
+
+    def scheduled_handles():
+        return [handle for handle in hass.loop._scheduled if not handle.cancelled()]
+
+    now = dt_util.utcnow()
+    scheduled = len(scheduled_handles())
+    unsubs = [
+        async_track_utc_time_change(hass, callback(lambda x: utc_runs.append(x))),
+        async_track_utc_time_change(hass, callback(lambda x: utc_runs.append(x))),
+        async_track_time_change(hass, callback(lambda x: local_runs.append(x))),
+    ]
+    assert len(scheduled_handles()) == scheduled + 1
+
+    async_fire_time_changed(hass, now + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert len(utc_runs) == 2
+    assert utc_runs[0].tzinfo == dt_util.UTC
+    assert len(local_runs) == 1
+    assert local_runs[0].tzinfo == dt_util.DEFAULT_TIME_ZONE
+    assert len(scheduled_handles()) == scheduled + 1
+
+    for unsub in unsubs:
+        unsub()
+    assert len(scheduled_handles()) == scheduled
+
+    async_fire_time_changed(hass, now + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert len(utc_runs) == 2
+    assert len(local_runs) == 1
+
+
 async def test_periodic_task_minute(hass):
     """Test periodic tasks per minute."""
     specific_runs = []
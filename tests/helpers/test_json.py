@@ -1,9 +1,12 @@
 """Test Home Assistant remote methods and classes."""
-from datetime import timedelta
+from collections import namedtuple
+from datetime import datetime, timedelta
+import json
 
 import pytest
 
 from homeassistant import core
+from homeassistant.helpers import json as json_helper
 from homeassistant.helpers.json import ExtendedJSONEncoder, JSONEncoder
 from homeassistant.util import dt as dt_util
 
@@ -63,3 +66,87 @@ def test_trace_json_encoder(hass):
     # Default method falls back to repr(o)
     o = object()
     assert ha_json_enc.default(o) == {"__type": str(type(o)), "repr": repr(o)}
+
+
+@pytest.mark.parametrize(
+    "dumps",
+    [
+        json_helper._json_dumps_stdlib,
+        pytest.param(
+            json_helper._json_dumps_orjson,
+            marks=pytest.mark.skipif(
+                json_helper.orjson is None, reason="orjson is not installed"
+            ),
+        ),
+    ],
+)
+def test_json_dumps(dumps):
+    """Test both JSON backends dump Home Assistant objects the same way."""
+    state = core.State("test.test", "hello", {"milk": "beer"})
+    point = namedtuple("Point", ["x", "y"])
+    data = {
+        "state": state,
+        "time": datetime(2021, 10, 1, 12, 30, tzinfo=dt_util.UTC),
+        "set": {"milk"},
+        "point": point(1, 2),
+        "big": 2 ** 70,
+        1: "int_key",
+    }
+
+    dumped = dumps(data)
+    assert " " not in dumped
+    assert json.loads(dumped) == {
+        "state": state.as_dict(),
+        "time": "2021-10-01T12:30:00+00:00",
+        "set": ["milk"],
+        "point": [1, 2],
+        "big": 2 ** 70,
+        "1": "int_key",
+    }
+
+    with pytest.raises(TypeError):
+        dumps({"object": object()})
+
+
+@pytest.mark.parametrize(
+    "dumps",
+    [
+        json_helper._json_dumps_stdlib,
+        pytest.param(
+            json_helper._json_dumps_orjson,
+            marks=pytest.mark.skipif(
+                json_helper.orjson is None, reason="orjson is not installed"
+            ),
+        ),
+    ],
+)
+def test_json_dumps_non_ascii_and_nan(dumps):
+    """Test both JSON backends dump non-ASCII and NaN to the same output."""
+
+    class Reading:
+        """Object converted with as_dict."""
+
+        def as_dict(self):
+            return {"value": float("nan")}
+
+    data = {
+        "name": "Küche ☕",
+        "nan": float("nan"),
+        "inf": [float("inf"), float("-inf")],
+        "point": (1.5, float("nan")),
+        "reading": Reading(),
+    }
+
+    assert dumps(data) == (
+        '{"name":"Küche ☕","nan":null,"inf":[null,null],'
+        '"point":[1.5,null],"reading":{"value":null}}'
+    )
+
+
+def test_json_encoder_default():
+    """Test the default hook of the native JSON backend."""
+    state = core.State("test.test", "hello")
+    assert json_helper.json_encoder_default(state) == state.as_dict()
+    assert json_helper.json_encoder_default({"milk"}) == ["milk"]
+    with pytest.raises(TypeError):
+        json_helper.json_encoder_default(object())
@@ -2506,35 +2506,46 @@ def test_urlencode(hass):
     assert tpl.async_render() == "the%20quick%20brown%20fox%20%3D%20true"
 
 
-async def test_cache_garbage_collection():
-    """Test caching a template."""
+async def test_cache_shared_compiled_code():
+    """Test templates with the same source share their compiled code."""
     template_string = (
-        "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
-    )
-    tpl = template.Template(
-        (template_string),
+        "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }} cache"
     )
+    env = template._NO_HASS_ENV  # pylint: disable=protected-access
+    hits = env.cache_info().hits
+    misses = env.cache_info().misses
+
+    tpl = template.Template(template_string)
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert env.cache_info().misses == misses + 1
 
-    tpl2 = template.Template(
-        (template_string),
-    )
+    tpl2 = template.Template(template_string)
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert env.cache_info().hits == hits + 1
+    assert tpl2._compiled_code is tpl._compiled_code
+
+    # Code outlives the templates, so templates created again on reload hit it
+    code = tpl._compiled_code
+    del tpl, tpl2
+    tpl3 = template.Template(template_string)
+    tpl3.ensure_valid()
+    assert env.cache_info().hits == hits + 2
+    assert tpl3._compiled_code is code
 
-    del tpl
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+
+async def test_cache_size():
+    """Test the compiled template cache is bounded."""
+    with patch.object(template, "TEMPLATE_CACHE_SIZE", 2):
+        env = template.TemplateEnvironment(None)
+
+    for idx in range(3):
+        env.compile(f"{{{{ {idx} }}}}")
+    env.compile("{{ 0 }}")
+
+    info = env.cache_info()
+    assert info.hits == 0
+    assert info.misses == 4
+    assert info.currsize == 2
 
 
 def test_is_template_string():
@@ -2725,6 +2736,40 @@ async def test_template_errors(hass):
         template.Template("{{ utcnow() | random }}", hass).async_render()
 
 
+def test_render_info_collects_fields(hass):
+    """Test render info records which fields of a state were read."""
+    hass.states.async_set("sensor.test", "23", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.other", "1")
+
+    info = render_to_info(
+        hass,
+        "{{ states('sensor.test') }}"
+        "{{ state_attr('sensor.test', 'unit_of_measurement') }}"
+        "{{ states.sensor.other.name }}",
+    )
+    assert info.entities == {"sensor.test", "sensor.other"}
+    assert info.entity_states == {"sensor.test"}
+    assert info.entity_attributes == {
+        "sensor.test": {"unit_of_measurement"},
+        "sensor.other": {"friendly_name"},
+    }
+
+    info = render_to_info(
+        hass,
+        "{{ states('sensor.test') }}{{ states.sensor.test.attributes }}",
+    )
+    assert info.entities == {"sensor.test"}
+    assert info.entity_states == frozenset()
+    assert info.entity_attributes == {}
+
+    info = render_to_info(
+        hass,
+        "{{ states('sensor.test') }}{{ states.sensor | list | count }}",
+    )
+    assert info.entities == {"sensor.test"}
+    assert info.entity_attributes == {}
+
+
 async def test_state_attributes(hass):
     """Test state attributes."""
     hass.states.async_set("sensor.test", "23")
@@ -166,6 +166,40 @@ async def test_setup_after_deps_all_present(hass):
     assert order == ["logger", "root", "first_dep", "second_dep"]
 
 
+async def test_preimport_integrations(hass):
+    """Test integrations are imported after their dependencies."""
+    order = []
+
+    def gen_import(domain):
+        def get_component():
+            order.append(domain)
+
+        return get_component
+
+    def get_platform(platform_name):
+        order.append(f"platform.{platform_name}")
+
+    root = mock_integration(hass, MockModule(domain="root"))
+    first_dep = mock_integration(
+        hass, MockModule(domain="first_dep", dependencies=["root"])
+    )
+    second_dep = mock_integration(
+        hass, MockModule(domain="second_dep", dependencies=["first_dep"])
+    )
+    integrations = {"second_dep": second_dep, "first_dep": first_dep, "root": root}
+
+    with patch.object(root, "get_component", gen_import("root")), patch.object(
+        root, "get_platform", get_platform
+    ), patch.object(first_dep, "get_component", gen_import("first_dep")), patch.object(
+        second_dep, "get_component", gen_import("second_dep")
+    ):
+        await bootstrap._async_preimport_integrations(
+            hass, {"first_dep": [{"platform": "root"}]}, integrations
+        )
+
+    assert order == ["root", "platform.first_dep", "first_dep", "second_dep"]
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_after_deps_in_stage_1_ignored(hass):
     """Test after_dependencies are ignored in stage 1."""
@@ -3,6 +3,7 @@
 import asyncio
 from datetime import datetime, timedelta
 import functools
+import json
 import logging
 import os
 from tempfile import TemporaryDirectory
@@ -38,6 +39,7 @@ from homeassistant.exceptions import (
     MaxLengthExceeded,
     ServiceNotFound,
 )
+from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -383,6 +385,63 @@ def test_state_as_dict():
     assert state.as_dict() is state.as_dict()
 
 
+def test_state_as_dict_json():
+    """Test a State as JSON."""
+    last_time = datetime(1984, 12, 8, 12, 0, 0)
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog"},
+        last_updated=last_time,
+        last_changed=last_time,
+    )
+    expected = (
+        '{"entity_id":"happy.happy","state":"on","attributes":{"pig":"dog"},'
+        '"last_changed":"1984-12-08T12:00:00","last_updated":"1984-12-08T12:00:00",'
+        f'"context":{{"id":"{state.context.id}","parent_id":null,"user_id":null}}}}'
+    )
+    assert state.as_dict_json() == expected
+    assert json.loads(state.as_dict_json()) == state.as_dict()
+    assert state.attributes_json() == '{"pig":"dog"}'
+    # 2nd time to verify cache
+    assert state.as_dict_json() is state.as_dict_json()
+
+
+def test_state_as_dict_json_invalid():
+    """Test a State with attributes that can not be serialized."""
+    state = ha.State("happy.happy", "on", {"pig": object()})
+    with pytest.raises(TypeError):
+        state.as_dict_json()
+
+
+def test_event_as_dict_json():
+    """Test an Event as JSON reuses the JSON of its states."""
+    now = dt_util.utcnow()
+    old_state = ha.State("happy.happy", "off")
+    new_state = ha.State("happy.happy", "on", {"pig": "dog"})
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "happy.happy", "old_state": old_state, "new_state": new_state},
+        ha.EventOrigin.local,
+        now,
+    )
+
+    assert json.loads(event.as_dict_json()) == json.loads(
+        json.dumps(event.as_dict(), cls=JSONEncoder)
+    )
+    assert new_state.as_dict_json() in event.as_dict_json()
+    assert event.as_dict_json() is event.as_dict_json()
+
+    event = ha.Event("some_type", {"some": ["attr"]}, ha.EventOrigin.remote, now)
+    assert json.loads(event.as_dict_json()) == {
+        "event_type": "some_type",
+        "data": {"some": ["attr"]},
+        "origin": "REMOTE",
+        "time_fired": now.isoformat(),
+        "context": event.context.as_dict(),
+    }
+
+
 async def test_eventbus_add_remove_listener(hass):
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -402,6 +461,26 @@ async def test_eventbus_add_remove_listener(hass):
     unsub()
 
 
+async def test_eventbus_has_listeners(hass):
+    """Test checking if an event type has listeners."""
+    assert not hass.bus.async_has_listeners("test")
+
+    unsub = hass.bus.async_listen("test", lambda event: None)
+    assert hass.bus.async_has_listeners("test")
+    unsub()
+    assert not hass.bus.async_has_listeners("test")
+
+    unsub = hass.bus.async_listen("test", lambda event: None, entity_id="light.a")
+    assert hass.bus.async_has_listeners("test")
+    unsub()
+    assert not hass.bus.async_has_listeners("test")
+
+    unsub = hass.bus.async_listen(MATCH_ALL, lambda event: None)
+    assert hass.bus.async_has_listeners("test")
+    assert not hass.bus.async_has_listeners(EVENT_TIME_CHANGED)
+    unsub()
+
+
 async def test_eventbus_filtered_listener(hass):
     """Test we can prefilter events."""
     calls = []
@@ -431,6 +510,86 @@ async def test_eventbus_filtered_listener(hass):
     unsub()
 
 
+async def test_eventbus_entity_listener(hass):
+    """Test listening to events of a single entity_id."""
+    calls = []
+    old_count = hass.bus.async_listeners().get("test", 0)
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen("test", listener, entity_id="Light.Kitchen")
+    assert hass.bus.async_listeners()["test"] == old_count + 1
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.living_room"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert calls[0].data["entity_id"] == "light.kitchen"
+
+    unsub()
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+
+    # Should do nothing now
+    unsub()
+
+
+async def test_eventbus_entity_listener_with_filter(hass):
+    """Test an event filter is applied to entity_id listeners."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def filter(event):
+        """Mock filter."""
+        return not event.data["filtered"]
+
+    hass.bus.async_listen(
+        "test", listener, event_filter=filter, entity_id="light.kitchen"
+    )
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen", "filtered": True})
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen", "filtered": False})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert calls[0].data["filtered"] is False
+
+
+async def test_eventbus_entity_listener_match_all(hass):
+    """Test listening to all events of a single entity_id is rejected."""
+    with pytest.raises(ha.HomeAssistantError):
+        hass.bus.async_listen(MATCH_ALL, lambda event: None, entity_id="light.a")
+
+
+async def test_eventbus_time_changed_not_sent_to_match_all(hass):
+    """Test time_changed events only go to their own listeners."""
+    test_all = async_capture_events(hass, MATCH_ALL)
+    test_time_changed = async_capture_events(hass, EVENT_TIME_CHANGED)
+
+    hass.bus.async_fire(EVENT_TIME_CHANGED, {ATTR_NOW: dt_util.utcnow()})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert len(test_time_changed) == 1
+    assert [event.event_type for event in test_all] == ["test"]
+
+
 async def test_eventbus_unsubscribe_listener(hass):
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -1098,6 +1257,37 @@ def test_create_timer(mock_monotonic, loop):
     assert event_data[ATTR_NOW] == datetime(2018, 12, 31, 3, 4, 6, 100000)
 
 
+@patch("homeassistant.core.monotonic")
+def test_timer_without_time_changed_listeners(mock_monotonic, loop):
+    """Test the timer does not fire time changed events nobody listens to."""
+    hass = MagicMock()
+    hass.bus.async_has_listeners.return_value = False
+    funcs = []
+    orig_callback = ha.callback
+
+    def mock_callback(func):
+        funcs.append(func)
+        return orig_callback(func)
+
+    mock_monotonic.side_effect = 10.2, 10.9, 11.0
+
+    with patch.object(ha, "callback", mock_callback), patch(
+        "homeassistant.core.dt_util.utcnow",
+        return_value=datetime(2018, 12, 31, 3, 4, 5, 333333),
+    ):
+        ha._async_create_timer(hass)
+
+    delay, callback, target = hass.loop.call_later.mock_calls[0][1]
+    with patch(
+        "homeassistant.core.dt_util.utcnow",
+        return_value=datetime(2018, 12, 31, 3, 4, 6, 100000),
+    ):
+        callback(target)
+
+    assert len(hass.bus.async_fire.mock_calls) == 0
+    assert len(hass.loop.call_later.mock_calls) == 2
+
+
 @patch("homeassistant.core.monotonic")
 def test_timer_out_of_sync(mock_monotonic, loop):
     """Test create timer."""
@@ -160,6 +160,17 @@ async def test_get_integration(hass):
     assert hue_light == integration.get_platform("light")
 
 
+async def test_get_integration_import_time(hass):
+    """Test the time spent importing an integration is recorded."""
+    integration = await loader.async_get_integration(hass, "hue")
+    with patch("homeassistant.loader.monotonic", side_effect=[10, 10.5, 20, 20.25]):
+        integration.get_component()
+        integration.get_platform("light")
+        # Cached imports are not timed again
+        integration.get_component()
+    assert hass.data[loader.DATA_IMPORT_TIME]["hue"].total_seconds() == 0.75
+
+
 async def test_get_integration_legacy(hass, enable_custom_integrations):
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "test_embedded")